@@ -0,0 +1,225 @@
+"""
+Columnar on-disk store for option chain snapshots.
+
+A snapshot is a directory of ``.npy`` files, one per column, with rows
+sorted by (underlying, expiry, strike):
+
+    meta.json           column names, risk-free rate
+    underlyings.npy     sorted underlying names; row codes index into it
+    offsets.npy         CSR row offsets: underlying i owns rows
+                        offsets[i]:offsets[i + 1]
+    spot.npy, vol.npy   per-underlying market snapshot (vol optional)
+    <column>.npy        one array per chain column (underlying stored
+                        as integer codes)
+
+Columns are opened with ``mmap_mode="r"``, so opening a snapshot only
+reads the headers. Because of the sort order, any underlying, expiry or
+strike range is a contiguous slice, and selections are views of the
+mapped files that need no copying.
+"""
+
+import csv
+import json
+import os
+
+import numpy as np
+
+
+REQUIRED_COLUMNS = ("underlying", "expiry", "strike", "is_call")
+
+
+class OptionChainStore:
+    """
+    Memory-mapped option chain snapshot.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot directory written by ``ingest``
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+
+        self.r = meta["r"]
+        self.underlyings = np.load(os.path.join(path, "underlyings.npy"))
+        self.offsets = np.load(os.path.join(path, "offsets.npy"))
+        self.spot = np.load(os.path.join(path, "spot.npy"))
+        vol_path = os.path.join(path, "vol.npy")
+        self.vol = np.load(vol_path) if os.path.exists(vol_path) else None
+
+        self.columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in meta["columns"]
+        }
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    @staticmethod
+    def ingest(path, chain, spots, r, vols=None):
+        """
+        Write a chain snapshot to ``path`` and open it.
+
+        Parameters
+        ----------
+        chain : mapping or structured ndarray
+            Columns ``underlying``, ``expiry`` (years), ``strike`` and
+            ``is_call``; any further columns (bid, ask, sigma, ...)
+            are stored alongside
+        spots : mapping
+            Spot price per underlying name
+        r : float
+            Risk-free rate of the snapshot
+        vols : mapping, optional
+            Volatility per underlying name
+
+        Returns
+        -------
+        OptionChainStore
+        """
+        names = chain.dtype.names if isinstance(chain, np.ndarray) else list(chain)
+        missing = [column for column in REQUIRED_COLUMNS if column not in names]
+        if missing:
+            raise ValueError(f"Chain is missing columns: {missing}")
+
+        # Object arrays (pandas / CSV strings) cannot be memory-mapped, so
+        # names are stored as fixed-width unicode
+        underlyings, codes = np.unique(np.asarray(chain["underlying"]).astype(str), return_inverse=True)
+        expiry = np.asarray(chain["expiry"], dtype=float)
+        strike = np.asarray(chain["strike"], dtype=float)
+        order = np.lexsort((strike, expiry, codes))
+
+        columns = {
+            "underlying": codes.astype(np.int32),
+            "expiry": expiry,
+            "strike": strike,
+            "is_call": np.asarray(chain["is_call"], dtype=bool),
+        }
+        for name in names:
+            if name not in columns:
+                values = np.asarray(chain[name])
+                columns[name] = values.astype(str) if values.dtype == object else values
+
+        os.makedirs(path, exist_ok=True)
+        for name, values in columns.items():
+            np.save(os.path.join(path, f"{name}.npy"), values[order])
+
+        counts = np.bincount(codes, minlength=len(underlyings))
+        np.save(os.path.join(path, "underlyings.npy"), underlyings)
+        np.save(os.path.join(path, "offsets.npy"), np.concatenate([[0], np.cumsum(counts)]))
+        np.save(os.path.join(path, "spot.npy"), np.array([spots[u] for u in underlyings], dtype=float))
+        vol_path = os.path.join(path, "vol.npy")
+        if vols is not None:
+            np.save(vol_path, np.array([vols[u] for u in underlyings], dtype=float))
+        elif os.path.exists(vol_path):
+            # Drop the vol snapshot of an earlier ingest into this directory
+            os.remove(vol_path)
+
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"columns": list(columns), "r": r}, f)
+
+        return OptionChainStore(path)
+
+    @staticmethod
+    def ingest_csv(path, csv_path, spots, r, vols=None):
+        """
+        Ingest a CSV chain with a header row.
+
+        ``is_call`` may be given as true/false, 1/0 or C/P; other
+        columns are parsed as floats where possible.
+        """
+        with open(csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        chain = {name: [row[name] for row in rows] for name in rows[0]}
+        for name, values in chain.items():
+            if name == "is_call":
+                chain[name] = np.array([v.strip().lower() in ("1", "true", "c", "call") for v in values])
+            elif name == "underlying":
+                chain[name] = np.array(values)
+            else:
+                try:
+                    chain[name] = np.array(values, dtype=float)
+                except ValueError:
+                    chain[name] = np.array(values)
+
+        return OptionChainStore.ingest(path, chain, spots, r, vols)
+
+    def code(self, underlying):
+        """
+        Integer code of an underlying name.
+        """
+        i = np.searchsorted(self.underlyings, underlying)
+        if i == len(self.underlyings) or self.underlyings[i] != underlying:
+            raise KeyError(underlying)
+        return int(i)
+
+    def rows(self, underlying, expiry=None, strike_range=None):
+        """
+        Contiguous row slice for an underlying, optionally narrowed to
+        one expiry and then to strikes in [low, high].
+        """
+        i = self.code(underlying)
+        start, stop = int(self.offsets[i]), int(self.offsets[i + 1])
+
+        if expiry is not None:
+            expiries = self.columns["expiry"][start:stop]
+            lo = np.searchsorted(expiries, expiry, side="left")
+            hi = np.searchsorted(expiries, expiry, side="right")
+            start, stop = start + lo, start + hi
+
+            if strike_range is not None:
+                strikes = self.columns["strike"][start:stop]
+                lo = np.searchsorted(strikes, strike_range[0], side="left")
+                hi = np.searchsorted(strikes, strike_range[1], side="right")
+                start, stop = start + lo, start + hi
+        elif strike_range is not None:
+            raise ValueError("strike_range needs an expiry")
+
+        return slice(start, stop)
+
+    def select(self, underlying=None, expiry=None, strike_range=None):
+        """
+        Zero-copy column views for a selection (the whole snapshot when
+        ``underlying`` is None).
+
+        Returns
+        -------
+        dict of ndarray
+            Memory-mapped views, one per stored column
+        """
+        rows = slice(None) if underlying is None else self.rows(underlying, expiry, strike_range)
+        return {name: values[rows] for name, values in self.columns.items()}
+
+    def expiries(self, underlying):
+        """
+        Distinct expiries listed for an underlying.
+        """
+        return np.unique(self.columns["expiry"][self.rows(underlying)])
+
+    def pricing_inputs(self, selection):
+        """
+        Columns ``S``, ``K``, ``r``, ``sigma``, ``T`` for
+        ``BlackScholes.price_chain``.
+
+        Volatility comes from the chain's ``sigma`` column when stored,
+        otherwise from the per-underlying ``vol`` snapshot.
+        """
+        codes = selection["underlying"]
+        if "sigma" in selection:
+            sigma = selection["sigma"]
+        elif self.vol is not None:
+            sigma = self.vol[codes]
+        else:
+            raise ValueError("Snapshot has neither a sigma column nor a vol snapshot")
+
+        return {
+            "S": self.spot[codes],
+            "K": selection["strike"],
+            "r": self.r,
+            "sigma": sigma,
+            "T": selection["expiry"],
+        }
@@ -0,0 +1,55 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+
+
+def make_chain(n_contracts, seed=42):
+    rng = np.random.default_rng(seed)
+
+    chain = np.empty(
+        n_contracts,
+        dtype=[("S", float), ("K", float), ("r", float), ("sigma", float), ("T", float)],
+    )
+    chain["S"] = 100.0
+    chain["K"] = rng.uniform(50, 150, n_contracts)
+    chain["r"] = 0.05
+    chain["sigma"] = rng.uniform(0.1, 0.5, n_contracts)
+    chain["T"] = rng.uniform(0.05, 2.0, n_contracts)
+
+    return chain
+
+
+def run_benchmark(n_contracts=500_000, n_scalar=5_000):
+    chain = make_chain(n_contracts)
+
+    # Scalar path: one call_price + put_price per contract (timed on a subset)
+    start = time.perf_counter()
+    for row in chain[:n_scalar]:
+        S, K, r, sigma, T = (float(x) for x in row)
+        BlackScholes.call_price(S, K, r, sigma, T)
+        BlackScholes.put_price(S, K, r, sigma, T)
+    scalar_time = time.perf_counter() - start
+    scalar_rate = n_scalar / scalar_time
+
+    # Batch path: the whole chain in one pass
+    start = time.perf_counter()
+    calls, puts = BlackScholes.price_chain(chain)
+    batch_time = time.perf_counter() - start
+    batch_rate = n_contracts / batch_time
+
+    # Sanity check against the scalar path
+    row = chain[0]
+    assert np.isclose(calls[0], BlackScholes.call_price(*(float(x) for x in row)))
+    assert np.isclose(puts[0], BlackScholes.put_price(*(float(x) for x in row)))
+
+    print(f"Scalar loop : {scalar_rate:>14,.0f} contracts/s ({n_scalar:,} contracts)")
+    print(f"Batch pass  : {batch_rate:>14,.0f} contracts/s ({n_contracts:,} contracts)")
+    print(f"Speedup     : {batch_rate / scalar_rate:>14,.1f}x")
+    print(f"Full chain  : {batch_time * 1e3:.1f} ms batch vs "
+          f"{n_contracts / scalar_rate:.1f} s scalar (extrapolated)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
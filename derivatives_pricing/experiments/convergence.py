@@ -1,49 +1,38 @@
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
 
+from derivatives_pricing.experiments.plot_sweep import plot_sweep
+from derivatives_pricing.experiments.sweep import mc_call, parameter_grid, run_sweep, write_results
 from derivatives_pricing.models.black_scholes import BlackScholes
-from derivatives_pricing.models.monte_carlo import MonteCarloPricer
-
-
-def convergence_experiment():
-    S = 100
-    K = 100
-    r = 0.05
-    sigma = 0.2
-    T = 1.0
 
-    path_grid = np.logspace(3, 5, 15, dtype=int)
 
-    mc_prices = []
-    cv_prices = []
+def convergence_experiment(out="mc_convergence.csv", save=None, n_workers=None):
+    S, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
 
-    for n in path_grid:
-        mc_prices.append(
-            MonteCarloPricer.european_call(
-                S, K, r, sigma, T, n, seed=42
-            )
-        )
-        cv_prices.append(
-            MonteCarloPricer.european_call_control_variate(
-                S, K, r, sigma, T, n, seed=42
-            )
-        )
+    grid = parameter_grid(
+        method=["plain", "control_variate", "rqmc"],
+        n_paths=[int(n) for n in np.logspace(3, 5, 15)],
+        S0=[S], K=[K], r=[r], sigma=[sigma], T=[T],
+    )
+    rows = run_sweep(mc_call, grid, seed=42, n_workers=n_workers)
+    write_results(rows, out)
 
-    bs_price = BlackScholes.call_price(S, K, r, sigma, T)
+    for row in rows:
+        print(f"{row['method']:>15} {row['n_paths']:>7,}: {row['price']:.4f} ± {row['std_error']:.4f}")
 
-    plt.figure(figsize=(10, 6))
-    plt.plot(path_grid, mc_prices, marker='o', label='Monte Carlo')
-    plt.plot(path_grid, cv_prices, marker='s', label='Control Variate')
-    plt.axhline(bs_price, linestyle='--', label='Black-Scholes')
-
-    plt.xscale('log')
-    plt.xlabel("Number of Paths (log scale)")
-    plt.ylabel("Call Price")
-    plt.title("Monte Carlo Convergence")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+    plot_sweep(
+        out, x="n_paths", y="price", hue="method", save=save,
+        title="Monte Carlo Convergence", logx=True,
+        reference=BlackScholes.call_price(S, K, r, sigma, T),
+    )
 
 
 if __name__ == "__main__":
-    convergence_experiment()
+    parser = argparse.ArgumentParser(description="Monte Carlo convergence sweep.")
+    parser.add_argument("--out", default="mc_convergence.csv")
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    convergence_experiment(args.out, args.save, args.workers)
@@ -19,12 +19,14 @@ def early_exercise_experiment():
     american_prices = []
     european_prices = []
 
+    # One normalized path set serves every spot on the grid
+    paths = LongstaffSchwartzPricer.simulate_paths(
+        r, sigma, T, n_paths=n_paths, n_steps=n_steps, seed=42
+    )
+
     for S0 in S_grid:
-        american = LongstaffSchwartzPricer.american_put(
-            S0, K, r, sigma, T,
-            n_paths=n_paths,
-            n_steps=n_steps,
-            seed=42
+        american = LongstaffSchwartzPricer.american_put_from_paths(
+            paths, S0, K, r, T
         )
 
         european = BlackScholes.put_price(
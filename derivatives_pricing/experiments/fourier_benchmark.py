@@ -0,0 +1,36 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.fourier import FourierPricer
+from derivatives_pricing.models.stochastic import GBMModel, HestonModel, VarianceGammaModel
+
+
+def run_benchmark(n_strikes=200, n_repeats=50):
+    S0, r, T = 100.0, 0.03, 1.0
+    K = np.linspace(50, 200, n_strikes)
+
+    exact = BlackScholes.call_price(S0, K, r, 0.2, T)
+    gbm = GBMModel(0.2)
+    print(f"COS vs Black-Scholes max error : {np.abs(FourierPricer.cos(gbm, S0, K, r, T) - exact).max():.2e}")
+    print(f"FFT vs Black-Scholes max error : {np.abs(FourierPricer.carr_madan(gbm, S0, K, r, T) - exact).max():.2e}")
+    print()
+
+    models = {
+        "Black-Scholes": gbm,
+        "Heston": HestonModel(0.04, 1.5, 0.04, 0.5, -0.7),
+        "Variance Gamma": VarianceGammaModel(0.12, 0.2, -0.14),
+    }
+    print(f"{'Model':<16}{'Method':<12}{'Chains/s':>12}{'ms/chain':>10}")
+    for name, model in models.items():
+        for method_name, method in [("COS", FourierPricer.cos), ("Carr-Madan", FourierPricer.carr_madan)]:
+            start = time.perf_counter()
+            for _ in range(n_repeats):
+                method(model, S0, K, r, T)
+            elapsed = (time.perf_counter() - start) / n_repeats
+            print(f"{name:<16}{method_name:<12}{1 / elapsed:12,.0f}{elapsed * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.greeks.analytical import BlackScholesGreeks
+from derivatives_pricing.models.black_scholes import BlackScholes
+
+
+def individual_greeks(S, K, r, sigma, T):
+    return {
+        "call_price": BlackScholes.call_price(S, K, r, sigma, T),
+        "put_price": BlackScholes.put_price(S, K, r, sigma, T),
+        "delta_call": BlackScholesGreeks.delta_call(S, K, r, sigma, T),
+        "delta_put": BlackScholesGreeks.delta_put(S, K, r, sigma, T),
+        "gamma": BlackScholesGreeks.gamma(S, K, r, sigma, T),
+        "vega": BlackScholesGreeks.vega(S, K, r, sigma, T),
+        "theta_call": BlackScholesGreeks.theta_call(S, K, r, sigma, T),
+        "theta_put": BlackScholesGreeks.theta_put(S, K, r, sigma, T),
+        "rho_call": BlackScholesGreeks.rho_call(S, K, r, sigma, T),
+        "rho_put": BlackScholesGreeks.rho_put(S, K, r, sigma, T),
+    }
+
+
+def run_benchmark(n_contracts=500_000, n_repeats=5):
+    rng = np.random.default_rng(42)
+
+    S = 100.0
+    K = rng.uniform(50, 150, n_contracts)
+    r = 0.05
+    sigma = rng.uniform(0.1, 0.5, n_contracts)
+    T = rng.uniform(0.05, 2.0, n_contracts)
+
+    timings = {}
+    for name, fn in [("Individual methods", individual_greeks),
+                     ("Fused all_greeks", BlackScholesGreeks.all_greeks)]:
+        best = np.inf
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            result = fn(S, K, r, sigma, T)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = (best, result)
+
+    reference = timings["Individual methods"][1]
+    fused = timings["Fused all_greeks"][1]
+    for key in reference:
+        assert np.allclose(reference[key], fused[key]), key
+
+    for name, (elapsed, _) in timings.items():
+        print(f"{name:<20}: {elapsed * 1e3:8.1f} ms "
+              f"({n_contracts / elapsed:,.0f} contracts/s)")
+
+    speedup = timings["Individual methods"][0] / timings["Fused all_greeks"][0]
+    print(f"Speedup             : {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
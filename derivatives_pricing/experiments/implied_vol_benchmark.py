@@ -0,0 +1,52 @@
+import time
+
+import numpy as np
+from scipy.optimize import brentq
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.implied_volatility import ImpliedVolatility
+
+
+def run_benchmark(n_contracts=1_000_000, n_brentq=2_000):
+    rng = np.random.default_rng(42)
+
+    S = 100.0
+    K = rng.uniform(60, 160, n_contracts)
+    r = 0.03
+    T = rng.uniform(0.05, 2.0, n_contracts)
+    sigma = rng.uniform(0.05, 0.8, n_contracts)
+    is_call = rng.random(n_contracts) < 0.5
+
+    calls, puts = BlackScholes.prices(S, K, r, sigma, T)
+    prices = np.where(is_call, calls, puts)
+
+    # Baseline: per-quote brentq around the scalar pricer (calls only)
+    start = time.perf_counter()
+    for i in range(n_brentq):
+        brentq(
+            lambda s: BlackScholes.call_price(S, K[i], r, s, T[i]) - calls[i],
+            1e-6, 10.0, xtol=1e-12,
+        )
+    brentq_rate = n_brentq / (time.perf_counter() - start)
+
+    # Vectorized solver on the full mixed call/put chain
+    start = time.perf_counter()
+    implied, status = ImpliedVolatility.solve(prices, S, K, r, T, is_call=is_call)
+    vector_rate = n_contracts / (time.perf_counter() - start)
+
+    converged = status == ImpliedVolatility.CONVERGED
+
+    # Parity-derived OTM puts below ~1e-12 are rounding noise in the inputs
+    meaningful = converged & (prices > 1e-8)
+    max_error = np.max(np.abs(implied[meaningful] - sigma[meaningful]))
+
+    print(f"brentq per quote : {brentq_rate:>12,.0f} contracts/s ({n_brentq:,} quotes)")
+    print(f"Vectorized solver: {vector_rate:>12,.0f} contracts/s ({n_contracts:,} quotes)")
+    print(f"Speedup          : {vector_rate / brentq_rate:>12,.1f}x")
+    print(f"Converged        : {converged.mean():.4%}, max |sigma error| = {max_error:.2e}")
+    print(f"Status counts    : {np.bincount(status.ravel(), minlength=4)} "
+          f"(converged, below intrinsic, above bound, max iterations)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.lattice import LatticePricer
+
+
+def legacy_american_put(S0, K, r, sigma, T, n_steps):
+    """
+    Previous BinomialPricer.american_put, allocating new arrays each step.
+    """
+    dt = T / n_steps
+    u = np.exp(sigma * np.sqrt(dt))
+    d = 1 / u
+    p = (np.exp(r * dt) - d) / (u - d)
+    discount = np.exp(-r * dt)
+
+    S = S0 * d ** np.arange(n_steps, -1, -1) * u ** np.arange(0, n_steps + 1)
+    V = np.maximum(K - S, 0.0)
+
+    for _ in range(n_steps):
+        V = discount * (p * V[1:] + (1 - p) * V[:-1])
+        S = S[:-1] / d
+        V = np.maximum(V, K - S)
+
+    return V[0]
+
+
+def accuracy(S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0):
+    reference = LatticePricer.price(S0, K, r, sigma, T, n_steps=20_000)[()]
+    print(f"American put accuracy (reference: CRR 20,000 steps = {reference:.5f})")
+
+    methods = {
+        "CRR": dict(),
+        "Trinomial": dict(tree="trinomial"),
+        "BBS": dict(smoothing=True),
+        "BBSR": dict(smoothing=True, richardson=True),
+    }
+    print(f"{'steps':>7} " + " ".join(f"{name:>11}" for name in methods))
+    for n_steps in (50, 100, 200, 2_000):
+        errors = [
+            LatticePricer.price(S0, K, r, sigma, T, n_steps=n_steps, **options)[()] - reference
+            for options in methods.values()
+        ]
+        print(f"{n_steps:>7} " + " ".join(f"{error:>11.2e}" for error in errors))
+
+
+def throughput(n_contracts=2_000, n_steps=200):
+    rng = np.random.default_rng(42)
+    K = rng.uniform(80, 120, n_contracts)
+    sigma = rng.uniform(0.1, 0.5, n_contracts)
+    T = rng.uniform(0.1, 2.0, n_contracts)
+
+    start = time.perf_counter()
+    legacy = np.array([
+        legacy_american_put(100.0, K[i], 0.05, sigma[i], T[i], n_steps)
+        for i in range(n_contracts)
+    ])
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = LatticePricer.price(100.0, K, 0.05, sigma, T, n_steps=n_steps)
+    batch_time = time.perf_counter() - start
+
+    assert np.allclose(legacy, batch)
+
+    print(f"\n{n_contracts:,} American puts, {n_steps} steps")
+    print(f"  Per-contract loop : {legacy_time:6.2f} s")
+    print(f"  Batched lattice   : {batch_time:6.2f} s ({legacy_time / batch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    accuracy()
+    throughput()
@@ -1,50 +1,34 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
-
-
-def run_basis_comparison():
-    S0 = 100
-    K = 100
-    r = 0.05
-    sigma = 0.2
-    T = 1.0
-
-    n_paths = 50_000
-    n_steps = 50
-    seed = 42
-
-    bases = {
-        "Linear (1, S)": 1,
-        "Quadratic (1, S, S²)": 2,
-        "Cubic (1, S, S², S³)": 3,
-    }
-
-    prices = {}
-
-    for name, degree in bases.items():
-        price = LongstaffSchwartzPricer.american_put(
-            S0=S0,
-            K=K,
-            r=r,
-            sigma=sigma,
-            T=T,
-            n_paths=n_paths,
-            n_steps=n_steps,
-            basis_degree=degree,
-            seed=seed,
-        )
-        prices[name] = price
-        print(f"{name}: {price:.4f}")
-
-    # Plot comparison
-    plt.figure()
-    plt.bar(prices.keys(), prices.values())
-    plt.ylabel("American Put Price")
-    plt.title("LSM Price Sensitivity to Regression Basis")
-    plt.grid(True)
-    plt.show()
+import argparse
+
+from derivatives_pricing.experiments.plot_sweep import plot_sweep
+from derivatives_pricing.experiments.sweep import (
+    SHARED_PATH_KEYS, lsm_put_shared_paths, parameter_grid, run_sweep, write_results,
+)
+
+
+def run_basis_comparison(out="lsm_basis_comparison.csv", save=None, n_workers=None):
+    # Linear (1, S), quadratic (1, S, S²) and cubic (1, S, S², S³) bases
+    # priced off one simulated path set
+    grid = parameter_grid(basis_degree=[1, 2, 3], n_paths=[50_000], n_steps=[50])
+    rows = run_sweep(
+        lsm_put_shared_paths, grid, seed=42, n_workers=n_workers, group_by=SHARED_PATH_KEYS
+    )
+    write_results(rows, out)
+
+    for row in rows:
+        print(f"Basis degree {row['basis_degree']}: {row['price']:.4f}")
+
+    plot_sweep(
+        out, x="basis_degree", y="price", save=save,
+        title="LSM Price Sensitivity to Regression Basis",
+    )
 
 
 if __name__ == "__main__":
-    run_basis_comparison()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="LSM regression basis sweep.")
+    parser.add_argument("--out", default="lsm_basis_comparison.csv")
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    run_basis_comparison(args.out, args.save, args.workers)
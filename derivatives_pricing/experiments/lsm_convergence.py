@@ -1,30 +1,38 @@
-import numpy as np
-import matplotlib.pyplot as plt
+import argparse
 
-from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.experiments.plot_sweep import plot_sweep
+from derivatives_pricing.experiments.sweep import (
+    SHARED_PATH_KEYS, lsm_put_shared_paths, parameter_grid, run_sweep, write_results,
+)
 
 
-def run_convergence():
-    S0, K, r, sigma, T = 100, 100, 0.05, 0.2, 1
+def run_convergence(out="lsm_convergence.csv", save=None, n_workers=None):
+    # One path set per sampler, simulated at the largest size; smaller
+    # runs use its leading paths
+    grid = parameter_grid(
+        sampler=["pseudo", "sobol"],
+        n_paths=[4_096, 8_192, 16_384, 32_768, 65_536, 131_072],
+        n_steps=[50],
+    )
+    rows = run_sweep(
+        lsm_put_shared_paths, grid, seed=42, n_workers=n_workers, group_by=SHARED_PATH_KEYS
+    )
+    write_results(rows, out)
 
-    paths_list = [5_000, 10_000, 20_000, 50_000, 100_000]
-    prices = []
+    for row in rows:
+        print(f"{row['sampler']:>6} {row['n_paths']:>8,}: {row['price']:.4f}")
 
-    for n in paths_list:
-        price = LongstaffSchwartzPricer.american_put(
-            S0, K, r, sigma, T,
-            n_paths=n,
-            n_steps=50,
-            seed=42
-        )
-        prices.append(price)
-
-    plt.plot(paths_list, prices, marker="o")
-    plt.xlabel("Number of paths")
-    plt.ylabel("American put price")
-    plt.title("LSM Convergence (Paths)")
-    plt.show()
+    plot_sweep(
+        out, x="n_paths", y="price", hue="sampler", save=save,
+        title="LSM Convergence (Paths)", logx=True,
+    )
 
 
 if __name__ == "__main__":
-    run_convergence()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="LSM convergence sweep.")
+    parser.add_argument("--out", default="lsm_convergence.csv")
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    run_convergence(args.out, args.save, args.workers)
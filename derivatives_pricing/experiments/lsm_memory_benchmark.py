@@ -0,0 +1,41 @@
+import time
+import tracemalloc
+
+import numpy as np
+
+from derivatives_pricing.models.binomial import BinomialPricer
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+
+
+def measure(**kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    price = LongstaffSchwartzPricer.american_put(**kwargs)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return price, peak, elapsed
+
+
+def run_benchmark(n_paths=100_000, n_steps=252):
+    params = dict(S0=100, K=100, r=0.05, sigma=0.2, T=1.0,
+                  n_paths=n_paths, n_steps=n_steps, seed=42)
+
+    modes = {
+        "Full paths, float64": dict(),
+        "Full paths, float32": dict(dtype=np.float32),
+        "Brownian bridge (low_memory)": dict(low_memory=True),
+    }
+
+    print(f"{n_paths:,} paths x {n_steps} steps")
+    for name, options in modes.items():
+        price, peak, elapsed = measure(**params, **options)
+        print(f"{name:<30}: price={price:.4f}  peak={peak / 2 ** 20:8.1f} MiB  "
+              f"time={elapsed:6.2f} s")
+
+    benchmark = BinomialPricer.american_put(100, 100, 0.05, 0.2, 1.0, n_steps=2_000)
+    print(f"{'Binomial (2,000 steps)':<30}: price={benchmark:.4f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,55 +1,40 @@
-import numpy as np
-import matplotlib.pyplot as plt
-
-from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
-
-
-def run_overfitting_diagnostics():
-    S0 = 100
-    K = 100
-    r = 0.05
-    sigma = 0.2
-    T = 1.0
-
-    n_paths = 50_000
-    n_steps = 50
-    seed = 42
-
-    basis_degrees = [1, 2, 3, 4, 5]
-
-    prices_naive = []
-    prices_split = []
-
-    for degree in basis_degrees:
-        # Standard (in-sample) LSM
-        price_naive = LongstaffSchwartzPricer.american_put(S0=S0, K=K, r=r, sigma=sigma, T=T,
-            n_paths=n_paths, n_steps=n_steps, seed=seed, basis_degree=degree, split_paths=False)
-
-        # Path-split (out-of-sample) LSM
-        price_split = LongstaffSchwartzPricer.american_put(S0=S0, K=K, r=r, sigma=sigma, T=T,
-            n_paths=n_paths, n_steps=n_steps, seed=seed, basis_degree=degree, split_paths=True)
-
-        prices_naive.append(price_naive)
-        prices_split.append(price_split)
-
-        print(
-            f"Basis degree {degree}: "
-            f"Naive LSM = {price_naive:.4f}, "
-            f"Path-split LSM = {price_split:.4f}"
-        )
-
-    # Plot
-    plt.figure(figsize=(9, 5))
-    plt.plot(basis_degrees, prices_naive, marker='o', label='Naive LSM (in-sample)')
-    plt.plot(basis_degrees, prices_split, marker='s', label='Path-split LSM (out-of-sample)')
-    plt.xlabel("Regression Basis Degree")
-    plt.ylabel("American Put Price")
-    plt.title("LSM Overfitting Diagnostics via Path Splitting")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+import argparse
+
+from derivatives_pricing.experiments.plot_sweep import plot_sweep
+from derivatives_pricing.experiments.sweep import (
+    SHARED_PATH_KEYS, lsm_put_shared_paths, parameter_grid, run_sweep, write_results,
+)
+
+
+def run_overfitting_diagnostics(out="lsm_overfitting.csv", save=None, n_workers=None):
+    # Naive (in-sample) vs path-split (out-of-sample) LSM per basis degree;
+    # every cell prices off one simulated path set
+    grid = parameter_grid(
+        basis_degree=[1, 2, 3, 4, 5],
+        split_paths=[False, True],
+        n_paths=[50_000],
+        n_steps=[50],
+    )
+    rows = run_sweep(
+        lsm_put_shared_paths, grid, seed=42, n_workers=n_workers, group_by=SHARED_PATH_KEYS
+    )
+    write_results(rows, out)
+
+    for row in rows:
+        mode = "Path-split LSM" if row["split_paths"] else "Naive LSM"
+        print(f"Basis degree {row['basis_degree']}: {mode} = {row['price']:.4f}")
+
+    plot_sweep(
+        out, x="basis_degree", y="price", hue="split_paths", save=save,
+        title="LSM Overfitting Diagnostics via Path Splitting",
+    )
 
 
 if __name__ == "__main__":
-    run_overfitting_diagnostics()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="LSM overfitting diagnostics sweep.")
+    parser.add_argument("--out", default="lsm_overfitting.csv")
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    run_overfitting_diagnostics(args.out, args.save, args.workers)
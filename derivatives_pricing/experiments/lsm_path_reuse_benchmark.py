@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+
+
+def run_benchmark(n_paths=50_000, n_steps=50, n_spots=15):
+    K, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    S_grid = np.linspace(60, 140, n_spots)
+
+    start = time.perf_counter()
+    repriced = [
+        LongstaffSchwartzPricer.american_put(
+            S0, K, r, sigma, T, n_paths=n_paths, n_steps=n_steps, seed=42
+        )
+        for S0 in S_grid
+    ]
+    repricing_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    paths = LongstaffSchwartzPricer.simulate_paths(
+        r, sigma, T, n_paths=n_paths, n_steps=n_steps, seed=42
+    )
+    reused = [
+        LongstaffSchwartzPricer.american_put_from_paths(paths, S0, K, r, T)
+        for S0 in S_grid
+    ]
+    reuse_time = time.perf_counter() - start
+
+    assert np.allclose(repriced, reused)
+
+    print(f"{n_spots}-point spot grid, {n_paths:,} paths x {n_steps} steps")
+    print(f"  Resimulate per point : {repricing_time:6.2f} s")
+    print(f"  Shared path set      : {reuse_time:6.2f} s ({repricing_time / reuse_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.models.regression import RegressionBasis
+
+
+def legacy_step(S_t, Y, itm, train_idx, test_idx, degree):
+    """
+    Previous split-path regression: set intersections, column_stack, SVD.
+    """
+    itm_train = np.intersect1d(itm, train_idx)
+    itm_test = np.intersect1d(itm, test_idx)
+
+    X_train = np.column_stack([S_t[itm_train] ** d for d in range(degree + 1)])
+    beta = np.linalg.lstsq(X_train, Y[itm_train], rcond=None)[0]
+
+    X_test = np.column_stack([S_t[itm_test] ** d for d in range(degree + 1)])
+    return X_test @ beta
+
+
+def new_step(S_t, Y, itm_mask, train_mask, degree, design, K, basis):
+    itm_train = np.flatnonzero(itm_mask & train_mask)
+    itm_test = np.flatnonzero(itm_mask & ~train_mask)
+
+    X_train, scaling = RegressionBasis.fill(S_t[itm_train], K, degree, basis, out=design)
+    beta = RegressionBasis.solve(X_train, Y[itm_train])
+
+    X_test, _ = RegressionBasis.fill(S_t[itm_test], K, degree, basis, out=design, scaling=scaling)
+    return X_test @ beta
+
+
+def run_benchmark(n_paths=50_000, n_steps=50, degrees=(1, 2, 3, 4, 5)):
+    K = 100.0
+    S = GBMPaths.simulate(100.0, 0.05, 0.2, 1.0, n_paths, n_steps, seed=42, time_major=True)
+    Y = np.maximum(K - S[-1], 0.0)
+
+    perm = np.random.default_rng(0).permutation(n_paths)
+    split = int(0.7 * n_paths)
+    train_idx, test_idx = perm[:split], perm[split:]
+    train_mask = np.zeros(n_paths, dtype=bool)
+    train_mask[train_idx] = True
+
+    print(f"Split-path regression over {n_steps - 1} dates, {n_paths:,} paths")
+    print(f"{'degree':>7} {'legacy':>9} {'power':>9} {'chebyshev':>10} {'speedup':>8}")
+
+    for degree in degrees:
+        design = np.empty((n_paths, degree + 1))
+        timings = []
+
+        for step in (
+            lambda S_t, itm_mask: legacy_step(
+                S_t, Y, np.flatnonzero(itm_mask), train_idx, test_idx, degree),
+            lambda S_t, itm_mask: new_step(
+                S_t, Y, itm_mask, train_mask, degree, design, K, "power"),
+            lambda S_t, itm_mask: new_step(
+                S_t, Y, itm_mask, train_mask, degree, design, K, "chebyshev"),
+        ):
+            start = time.perf_counter()
+            for t in range(n_steps - 1, 0, -1):
+                step(S[t], S[t] < K)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{degree:>7} {timings[0]:>8.3f}s {timings[1]:>8.3f}s "
+              f"{timings[2]:>9.3f}s {timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
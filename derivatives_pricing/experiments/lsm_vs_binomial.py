@@ -1,6 +1,7 @@
 import numpy as np
 from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
 from derivatives_pricing.models.binomial import BinomialPricer
+from derivatives_pricing.models.lattice import LatticePricer
 
 
 def run_benchmark():
@@ -15,7 +16,8 @@ def run_benchmark():
     print("\nBinomial Prices:")
     for n in binomial_steps:
         price = BinomialPricer.american_put(S0, K, r, sigma, T, n_steps=n)
-        print(f"  Steps={n}: {price:.4f}")
+        bbsr = LatticePricer.price(S0, K, r, sigma, T, n_steps=n, smoothing=True, richardson=True)
+        print(f"  Steps={n}: CRR {price:.4f}, BBSR {bbsr[()]:.4f}")
 
 
 if __name__ == "__main__":
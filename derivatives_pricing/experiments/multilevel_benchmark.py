@@ -0,0 +1,32 @@
+import time
+
+from derivatives_pricing.models.multilevel import MultilevelMonteCarlo
+
+
+def run_benchmark():
+    S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+    M = 2
+    sampler = MultilevelMonteCarlo.gbm_level_sampler(
+        MultilevelMonteCarlo.asian_call_payoff(K), S0, r, sigma, T, M=M
+    )
+
+    print("Arithmetic Asian call, continuous averaging")
+    print(f"{'RMSE':>8s} {'price':>9s} {'levels':>6s} {'MLMC cost':>12s} "
+          f"{'MC cost':>12s} {'saving':>7s} {'time':>7s}")
+    for target_rmse in (0.02, 0.01, 0.005, 0.0025):
+        start = time.perf_counter()
+        result = MultilevelMonteCarlo.estimate(sampler, target_rmse, M=M, seed=42)
+        elapsed = time.perf_counter() - start
+
+        # Plain MC on the finest grid needs Var[P_L] / (eps^2 / 2) paths;
+        # Var[P_L] is close to the level-0 variance
+        finest = len(result.n_paths) - 1
+        mc_cost = 2 * result.level_variances[0] / target_rmse ** 2 * M ** finest
+
+        print(f"{target_rmse:8.4f} {result.price:9.5f} {finest + 1:6d} "
+              f"{result.cost:12.3e} {mc_cost:12.3e} {mc_cost / result.cost:6.1f}x "
+              f"{elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,36 @@
+import timeit
+
+import numpy as np
+from scipy.stats import norm
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.utils.normal import norm_cdf, norm_pdf
+
+
+def run_benchmark(batch_sizes=(1, 10, 100, 10_000), n_loops=2_000):
+    rng = np.random.default_rng(42)
+
+    print(f"{'batch':>8} {'norm.cdf':>12} {'norm_cdf':>12} "
+          f"{'norm.pdf':>12} {'norm_pdf':>12} {'call_price':>12}   (us per call)")
+
+    for n in batch_sizes:
+        x = rng.standard_normal(n)
+        K = rng.uniform(80, 120, n)
+
+        assert np.allclose(norm.cdf(x), norm_cdf(x), rtol=1e-14, atol=0)
+        assert np.allclose(norm.pdf(x), norm_pdf(x), rtol=1e-14, atol=0)
+
+        timings = [
+            timeit.timeit(lambda: norm.cdf(x), number=n_loops),
+            timeit.timeit(lambda: norm_cdf(x), number=n_loops),
+            timeit.timeit(lambda: norm.pdf(x), number=n_loops),
+            timeit.timeit(lambda: norm_pdf(x), number=n_loops),
+            timeit.timeit(lambda: BlackScholes.call_price(100.0, K, 0.05, 0.2, 1.0),
+                          number=n_loops),
+        ]
+
+        print(f"{n:>8} " + " ".join(f"{t / n_loops * 1e6:12.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,45 @@
+import os
+import time
+import tracemalloc
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.models.parallel_monte_carlo import ParallelMonteCarloPricer
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run_benchmark(n_paths=20_000_000, chunk_size=500_000):
+    S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+    bs_price = BlackScholes.call_price(S0, K, r, sigma, T)
+
+    print(f"{n_paths:,} paths, Black-Scholes = {bs_price:.5f}, {os.cpu_count()} CPUs\n")
+
+    price, elapsed, peak = measure(
+        lambda: MonteCarloPricer.european_call(S0, K, r, sigma, T, n_paths, seed=42)
+    )
+    print(f"{'Monolithic array':<22}: {price:.5f}{'':<21} "
+          f"{elapsed:6.2f} s  peak {peak / 2 ** 20:8.1f} MiB")
+
+    for n_workers in sorted({1, 2, os.cpu_count() or 1}):
+        result, elapsed, peak = measure(
+            lambda: ParallelMonteCarloPricer.european_call(
+                S0, K, r, sigma, T, n_paths, seed=42,
+                chunk_size=chunk_size, n_workers=n_workers,
+            )
+        )
+        low, high = result.conf_interval
+        print(f"{f'Chunked, {n_workers} worker(s)':<22}: {result.price:.5f} "
+              f"[{low:.5f}, {high:.5f}] {elapsed:6.2f} s  peak {peak / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.paths import GBMPaths
+
+
+def legacy_paths(S0, r, sigma, T, n_paths, n_steps):
+    """
+    Per-step loop and legacy global RNG previously used by
+    LongstaffSchwartzPricer.
+    """
+    dt = T / n_steps
+
+    S = np.zeros((n_paths, n_steps + 1))
+    S[:, 0] = S0
+
+    Z = np.random.standard_normal((n_paths, n_steps))
+
+    for t in range(1, n_steps + 1):
+        S[:, t] = S[:, t - 1] * np.exp(
+            (r - 0.5 * sigma ** 2) * dt
+            + sigma * np.sqrt(dt) * Z[:, t - 1]
+        )
+
+    return S
+
+
+def timed(generate, n_paths, chunk_size):
+    """
+    Run a generator chunk by chunk so large grids fit in memory.
+    """
+    start = time.perf_counter()
+    for first in range(0, n_paths, chunk_size):
+        generate(min(chunk_size, n_paths - first))
+    return time.perf_counter() - start
+
+
+def run_benchmark(grids=((100_000, 50), (1_000_000, 252)), chunk_size=100_000):
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    np.random.seed(42)
+
+    methods = {
+        "Per-step loop (legacy)": lambda n, m: legacy_paths(S0, r, sigma, T, n, m),
+        "Cumsum, path-major f64": lambda n, m: GBMPaths.simulate(S0, r, sigma, T, n, m),
+        "Cumsum, time-major f64": lambda n, m: GBMPaths.simulate(
+            S0, r, sigma, T, n, m, time_major=True),
+        "Cumsum, time-major f32": lambda n, m: GBMPaths.simulate(
+            S0, r, sigma, T, n, m, time_major=True, dtype=np.float32),
+    }
+
+    for n_paths, n_steps in grids:
+        print(f"\n{n_paths:,} paths x {n_steps} steps (chunks of {chunk_size:,})")
+        baseline = None
+        for name, method in methods.items():
+            elapsed = timed(lambda n: method(n, n_steps), n_paths, chunk_size)
+            baseline = baseline or elapsed
+            print(f"  {name:<24}: {elapsed:7.2f} s  ({baseline / elapsed:4.1f}x)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,60 @@
+import argparse
+
+import numpy as np
+import matplotlib
+
+from derivatives_pricing.experiments.sweep import load_results
+
+
+def plot_sweep(results_path, x, y, hue=None, save=None, title=None, logx=False, reference=None):
+    """
+    Plot one result column against a swept parameter, one line per value
+    of ``hue``. Saves to ``save`` without opening a window when given.
+
+    ``reference`` draws a dashed horizontal line (e.g. a closed-form price).
+    """
+    if save is not None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    results = load_results(results_path)
+    groups = np.unique(results[hue]) if hue else [None]
+
+    plt.figure(figsize=(9, 5))
+    for group in groups:
+        mask = results[hue] == group if hue else np.ones(len(results[x]), dtype=bool)
+        order = np.argsort(results[x][mask])
+        label = f"{hue}={group}" if hue else y
+        plt.plot(results[x][mask][order], results[y][mask][order], marker="o", label=label)
+
+    if reference is not None:
+        plt.axhline(reference, linestyle="--", color="black", label="reference")
+    if logx:
+        plt.xscale("log")
+    if title:
+        plt.title(title)
+    plt.xlabel(x)
+    plt.ylabel(y)
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+
+    if save is not None:
+        plt.savefig(save)
+    else:
+        plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot tidy sweep results.")
+    parser.add_argument("results")
+    parser.add_argument("--x", required=True)
+    parser.add_argument("--y", default="price")
+    parser.add_argument("--hue", default=None)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--title", default=None)
+    parser.add_argument("--logx", action="store_true")
+    parser.add_argument("--reference", type=float, default=None)
+    args = parser.parse_args()
+
+    plot_sweep(args.results, args.x, args.y, args.hue, args.save, args.title, args.logx, args.reference)
@@ -0,0 +1,37 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.risk.portfolio import PortfolioRisk
+
+
+def run_benchmark(n_positions=1_000_000, n_underlyings=500):
+    rng = np.random.default_rng(42)
+
+    names = np.array([f"U{i:04d}" for i in range(n_underlyings)])
+    spots = dict(zip(names, rng.uniform(20, 500, n_underlyings)))
+    vols = dict(zip(names, rng.uniform(0.1, 0.6, n_underlyings)))
+
+    underlying = names[rng.integers(n_underlyings, size=n_positions)]
+    spot = np.array([spots[name] for name in names])[np.searchsorted(names, underlying)]
+    book = {
+        "underlying": underlying,
+        "strike": spot * rng.uniform(0.7, 1.3, n_positions),
+        "expiry": rng.uniform(0.01, 3.0, n_positions),
+        "is_call": rng.random(n_positions) < 0.5,
+        "quantity": rng.integers(-100, 100, n_positions).astype(float),
+    }
+
+    start = time.perf_counter()
+    ladders = PortfolioRisk.ladders(book, spots, 0.03, vols)
+    elapsed = time.perf_counter() - start
+
+    print(f"{n_positions:,} positions on {n_underlyings} underlyings: {elapsed:.2f} s "
+          f"({n_positions / elapsed:,.0f} positions/s)")
+    print(f"  Ladder shape : {ladders.delta.shape}")
+    print(f"  Net delta    : {ladders.delta.sum():,.1f}")
+    print(f"  Net vega     : {ladders.vega.sum():,.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
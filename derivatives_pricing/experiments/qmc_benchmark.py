@@ -0,0 +1,53 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.models.parallel_monte_carlo import ParallelMonteCarloPricer
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+
+
+def european_comparison(S0, K, r, sigma, T, n_replicates=16):
+    bs_price = BlackScholes.call_price(S0, K, r, sigma, T)
+    print(f"European call (Black-Scholes = {bs_price:.5f})")
+    print(f"{'paths':>10} {'MC std err':>12} {'RQMC std err':>13} {'variance ratio':>15}")
+
+    for log2_n in (10, 12, 14, 16):
+        n_paths = 2 ** log2_n
+        total = n_paths * n_replicates
+
+        mc = ParallelMonteCarloPricer.european_call(S0, K, r, sigma, T, total, seed=1, n_workers=1)
+        rqmc = MonteCarloPricer.european_call_rqmc(
+            S0, K, r, sigma, T, n_paths, n_replicates=n_replicates, seed=1
+        )
+
+        ratio = (mc.std_error / rqmc.std_error) ** 2
+        print(f"{total:>10,} {mc.std_error:>12.2e} {rqmc.std_error:>13.2e} {ratio:>15.0f}")
+
+
+def american_comparison(S0, K, r, sigma, T, n_paths=2 ** 13, n_replicates=16):
+    print(f"\nAmerican put, {n_replicates} replicates x {n_paths:,} paths")
+
+    start = time.perf_counter()
+    pseudo = [
+        LongstaffSchwartzPricer.american_put(S0, K, r, sigma, T, n_paths=n_paths, seed=seed)
+        for seed in range(n_replicates)
+    ]
+    pseudo_time = time.perf_counter() - start
+    pseudo_error = np.std(pseudo, ddof=1) / np.sqrt(n_replicates)
+
+    start = time.perf_counter()
+    rqmc = LongstaffSchwartzPricer.american_put_rqmc(
+        S0, K, r, sigma, T, n_paths=n_paths, n_replicates=n_replicates, seed=1
+    )
+    rqmc_time = time.perf_counter() - start
+
+    print(f"  Pseudo-random: {np.mean(pseudo):.4f} +/- {pseudo_error:.4f} ({pseudo_time:.2f} s)")
+    print(f"  Sobol RQMC   : {rqmc.price:.4f} +/- {rqmc.std_error:.4f} ({rqmc_time:.2f} s)")
+    print(f"  Paths saved at equal error: {(pseudo_error / rqmc.std_error) ** 2:.1f}x")
+
+
+if __name__ == "__main__":
+    european_comparison(100.0, 100.0, 0.05, 0.2, 1.0)
+    american_comparison(100.0, 100.0, 0.05, 0.2, 1.0)
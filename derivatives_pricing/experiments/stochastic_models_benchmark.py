@@ -0,0 +1,38 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.models.stochastic import (
+    GBMModel, HestonModel, JumpDiffusionModel,
+)
+
+
+def run_benchmark(n_paths=1_000_000, n_steps=50):
+    S0, K, r, T = 100.0, 100.0, 0.05, 1.0
+    models = {
+        "GBM": GBMModel(0.2),
+        "Heston (QE)": HestonModel(0.04, 1.5, 0.04, 0.5, -0.7),
+        "Merton jumps": JumpDiffusionModel(0.2, 0.5, -0.1, 0.15),
+    }
+
+    print(f"Path generation, {n_paths:,} paths x {n_steps} steps (float32 storage)")
+    for name, model in models.items():
+        start = time.perf_counter()
+        model.simulate(S0, r, T, n_paths, n_steps, seed=42, time_major=True, dtype=np.float32)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<13}: {elapsed:6.2f} s ({n_paths * n_steps / elapsed / 1e6:6.1f} M steps/s)")
+
+    print(f"American put LSM, {n_paths:,} paths")
+    for dtype in (np.float64, np.float32):
+        start = time.perf_counter()
+        price = LongstaffSchwartzPricer.american_put_model(
+            models["Heston (QE)"], S0, K, r, T,
+            n_paths=n_paths, n_steps=n_steps, seed=42, dtype=dtype,
+        )
+        elapsed = time.perf_counter() - start
+        print(f"  Heston, {np.dtype(dtype).name:<7}: {price:.4f} in {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,65 @@
+import csv
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from derivatives_pricing.data.store import OptionChainStore
+from derivatives_pricing.models.black_scholes import BlackScholes
+
+
+def run_benchmark(n_rows=2_000_000, n_underlyings=2_000):
+    rng = np.random.default_rng(42)
+    names = np.array([f"U{i:04d}" for i in range(n_underlyings)])
+    spots = dict(zip(names, rng.uniform(20, 500, n_underlyings)))
+
+    chain = {
+        "underlying": names[rng.integers(n_underlyings, size=n_rows)],
+        "expiry": rng.choice(np.arange(1, 25) / 12, size=n_rows),
+        "strike": np.round(rng.uniform(10, 600, n_rows), 1),
+        "is_call": rng.random(n_rows) < 0.5,
+        "sigma": rng.uniform(0.1, 0.6, n_rows),
+    }
+
+    with tempfile.TemporaryDirectory() as root:
+        # Baseline: the CSV round trip this store replaces, on a 10% sample
+        csv_path = os.path.join(root, "chain.csv")
+        sample = n_rows // 10
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(chain))
+            writer.writerows(zip(*(values[:sample] for values in chain.values())))
+        start = time.perf_counter()
+        with open(csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        csv_time = (time.perf_counter() - start) * n_rows / sample
+
+        start = time.perf_counter()
+        OptionChainStore.ingest(os.path.join(root, "snapshot"), chain, spots, r=0.03)
+        ingest_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = OptionChainStore(os.path.join(root, "snapshot"))
+        open_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        selection = store.select(names[0], expiry=0.5)
+        call, put = BlackScholes.price_chain(store.pricing_inputs(selection))
+        slice_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        call, put = BlackScholes.price_chain(store.pricing_inputs(store.select()))
+        full_time = time.perf_counter() - start
+        del store, selection, rows
+
+    print(f"{n_rows:,}-row snapshot, {n_underlyings:,} underlyings")
+    print(f"  CSV parse (extrapolated)  : {csv_time:8.3f} s")
+    print(f"  Ingest to .npy            : {ingest_time:8.3f} s")
+    print(f"  Cold open (memory-mapped) : {open_time * 1e3:8.3f} ms")
+    print(f"  Slice + price one expiry  : {slice_time * 1e3:8.3f} ms")
+    print(f"  Price the full snapshot   : {full_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    run_benchmark()
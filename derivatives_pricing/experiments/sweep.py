@@ -0,0 +1,331 @@
+"""
+Headless parameter-sweep runner with process-pool execution and an
+on-disk result cache.
+
+Each grid cell is keyed by a SHA-256 hash of the job name, its
+parameters and the seed; cached cells are read back instead of being
+recomputed, so changing one axis of a sweep only prices the new cells.
+Results are tidy (one row per cell) and can be written to CSV, NPZ or
+Parquet for the plotting scripts.
+
+Example
+-------
+python -m derivatives_pricing.experiments.sweep lsm_put_shared_paths \\
+    --grid basis_degree=1,2,3,4,5 split_paths=0,1 --out overfitting.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.models.parallel_monte_carlo import ParallelMonteCarloPricer
+
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "sweeps")
+
+
+def lsm_put(
+    S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0,
+    n_paths=50_000, n_steps=50, basis_degree=2, split_paths=False,
+    basis="power", sampler="pseudo", seed=None
+):
+    """
+    LSM American put, with the Black-Scholes European put for reference.
+    """
+    price = LongstaffSchwartzPricer.american_put(
+        S0, K, r, sigma, T,
+        n_paths=int(n_paths), n_steps=int(n_steps), seed=seed,
+        basis_degree=int(basis_degree), split_paths=bool(split_paths), basis=basis,
+        sampler=sampler,
+    )
+    european = BlackScholes.put_price(S0, K, r, sigma, T)
+    return {"price": price, "european": european, "premium": price - european}
+
+
+# Parameters that fix an LSM path set; cells agreeing on them share one
+SHARED_PATH_KEYS = ("r", "sigma", "T", "n_steps", "sampler")
+
+
+def lsm_put_shared_paths(cells, seed=None):
+    """
+    LSM American puts for cells that share one simulated path set.
+
+    The paths are simulated once, for the largest ``n_paths`` in the
+    group, and each cell prices off its leading ``n_paths`` columns with
+    ``american_put_from_paths``, so S0, K, basis, degree, split and path
+    count vary without re-simulating. Use with
+    ``run_sweep(..., group_by=SHARED_PATH_KEYS)``.
+    """
+    defaults = dict(
+        S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0, n_paths=50_000, n_steps=50,
+        basis_degree=2, split_paths=False, basis="power", sampler="pseudo",
+    )
+    cells = [{**defaults, **cell} for cell in cells]
+    r, sigma, T, n_steps, sampler = (cells[0][name] for name in SHARED_PATH_KEYS)
+
+    paths = LongstaffSchwartzPricer.simulate_paths(
+        r, sigma, T, n_paths=max(int(cell["n_paths"]) for cell in cells),
+        n_steps=int(n_steps), seed=seed, sampler=sampler,
+    )
+
+    results = []
+    for cell in cells:
+        price = LongstaffSchwartzPricer.american_put_from_paths(
+            paths[:, :int(cell["n_paths"])], cell["S0"], cell["K"], r, T,
+            basis_degree=int(cell["basis_degree"]), split_paths=bool(cell["split_paths"]),
+            seed=seed, basis=cell["basis"],
+        )
+        european = BlackScholes.put_price(cell["S0"], cell["K"], r, sigma, T)
+        results.append({"price": price, "european": european, "premium": price - european})
+
+    return results
+
+
+def mc_call(
+    S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0, n_paths=100_000,
+    method="plain", n_replicates=8, seed=None
+):
+    """
+    Monte Carlo European call with standard error and Black-Scholes error.
+
+    ``method`` is "plain", "control_variate" or "rqmc" (``n_replicates``
+    scrambled Sobol sets sharing the ``n_paths`` budget).
+    """
+    n_paths = int(n_paths)
+    if method == "plain":
+        result = ParallelMonteCarloPricer.european_call(
+            S0, K, r, sigma, T, n_paths, seed=seed, n_workers=1
+        )
+    elif method == "control_variate":
+        result = MonteCarloPricer.european(
+            S0, K, r, sigma, T, n_paths, seed=seed, control_variate=True
+        )
+    elif method == "rqmc":
+        n_replicates = int(n_replicates)
+        result = MonteCarloPricer.european_call_rqmc(
+            S0, K, r, sigma, T, n_paths // n_replicates, n_replicates=n_replicates, seed=seed
+        )
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
+
+    error = result.price - BlackScholes.call_price(S0, K, r, sigma, T)
+    return {"price": result.price, "std_error": result.std_error, "error": error}
+
+
+JOBS = {"lsm_put": lsm_put, "lsm_put_shared_paths": lsm_put_shared_paths, "mc_call": mc_call}
+
+# Grouping keys of the jobs that take a list of cells
+GROUP_BY = {"lsm_put_shared_paths": SHARED_PATH_KEYS}
+
+
+def parameter_grid(**axes):
+    """
+    Cartesian product of parameter axes as a list of dicts.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def cache_key(job, params, seed):
+    """
+    Stable hash of a job, its parameters and the seed.
+    """
+    payload = json.dumps(
+        {"job": f"{job.__module__}.{job.__qualname__}", "params": params, "seed": seed},
+        sort_keys=True, default=float,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _as_floats(result):
+    if not isinstance(result, dict):
+        result = {"value": result}
+    return {key: float(value) for key, value in result.items()}
+
+
+def _evaluate(job, cells, seed, grouped):
+    if grouped:
+        return [_as_floats(result) for result in job(cells, seed=seed)]
+    return [_as_floats(job(**cells[0], seed=seed))]
+
+
+def run_sweep(job, grid, seed=None, cache_dir=DEFAULT_CACHE_DIR, n_workers=None, group_by=None):
+    """
+    Evaluate ``job`` on every cell of ``grid``, reusing cached cells.
+
+    Parameters
+    ----------
+    job : callable
+        Module-level function ``job(**params, seed=seed)`` returning a
+        float or a dict of floats (must be picklable for the pool). With
+        ``group_by``, ``job(cells, seed=seed)`` instead receives a list
+        of cells and returns one result per cell.
+    grid : list of dict
+        Parameter cells, e.g. from ``parameter_grid``
+    seed : int, optional
+        Seed passed to every cell (common random numbers across the grid)
+    cache_dir : str or None
+        Directory for cached cells; None disables caching. Unseeded runs
+        are never cached, since each is a fresh random draw
+    n_workers : int, optional
+        Process-pool size (defaults to the CPU count); 1 runs serially
+    group_by : sequence of str, optional
+        Parameters whose values define a group. Cells of one group are
+        passed to ``job`` together (one pool task), so it can share work
+        such as a simulated path set across them. A group is cached as a
+        unit: its cells are keyed on the whole group, and any change to
+        the group recomputes all of them.
+
+    Returns
+    -------
+    list of dict
+        One row per cell: parameters followed by results, in grid order
+    """
+    rows = [None] * len(grid)
+    pending = []
+
+    if seed is None:
+        cache_dir = None
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    if group_by is None:
+        units = [[i] for i in range(len(grid))]
+    else:
+        groups = {}
+        for i, params in enumerate(grid):
+            groups.setdefault(tuple(params.get(name) for name in group_by), []).append(i)
+        units = list(groups.values())
+
+    for unit in units:
+        cells = [grid[i] for i in unit]
+        paths = [None] * len(unit)
+        if cache_dir is not None:
+            keys = [
+                params if group_by is None else {"cell": params, "group": cells}
+                for params in cells
+            ]
+            paths = [os.path.join(cache_dir, cache_key(job, key, seed) + ".json") for key in keys]
+            if all(os.path.exists(path) for path in paths):
+                for i, params, path in zip(unit, cells, paths):
+                    with open(path) as f:
+                        rows[i] = {**params, **json.load(f)}
+                continue
+        pending.append((unit, cells, paths))
+
+    grouped = group_by is not None
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(pending) <= 1:
+        results = [_evaluate(job, cells, seed, grouped) for _, cells, _ in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_evaluate, job, cells, seed, grouped) for _, cells, _ in pending]
+            results = [future.result() for future in futures]
+
+    for (unit, cells, paths), unit_results in zip(pending, results):
+        for i, params, path, result in zip(unit, cells, paths, unit_results):
+            rows[i] = {**params, **result}
+            if path is not None:
+                with open(path, "w") as f:
+                    json.dump(result, f)
+
+    return rows
+
+
+def write_results(rows, path):
+    """
+    Write tidy sweep rows to .csv, .npz or .parquet (needs pandas).
+    """
+    columns = list(rows[0])
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    elif extension == ".npz":
+        np.savez(path, **{name: np.array([row[name] for row in rows]) for name in columns})
+    elif extension == ".parquet":
+        import pandas as pd
+
+        pd.DataFrame(rows, columns=columns).to_parquet(path)
+    else:
+        raise ValueError(f"Unsupported results format: {extension!r}")
+
+
+def load_results(path):
+    """
+    Load sweep results as a dict of column arrays.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        columns = {name: [row[name] for row in rows] for name in rows[0]} if rows else {}
+        return {name: _to_array(values) for name, values in columns.items()}
+    if extension == ".npz":
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    if extension == ".parquet":
+        import pandas as pd
+
+        frame = pd.read_parquet(path)
+        return {name: frame[name].to_numpy() for name in frame.columns}
+
+    raise ValueError(f"Unsupported results format: {extension!r}")
+
+
+def _to_array(values):
+    try:
+        return np.array([float(value) for value in values])
+    except ValueError:
+        return np.array(values)
+
+
+def _parse_value(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("job", choices=sorted(JOBS))
+    parser.add_argument("--grid", nargs="+", default=[], metavar="NAME=V1,V2,...")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="sweep_results.csv")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    axes = {}
+    for item in args.grid:
+        name, values = item.split("=", 1)
+        axes[name] = [_parse_value(value) for value in values.split(",")]
+
+    rows = run_sweep(
+        JOBS[args.job], parameter_grid(**axes),
+        seed=args.seed, cache_dir=args.cache_dir, n_workers=args.workers,
+        group_by=GROUP_BY.get(args.job),
+    )
+    write_results(rows, args.out)
+    print(f"Wrote {len(rows)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
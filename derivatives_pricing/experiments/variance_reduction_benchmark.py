@@ -0,0 +1,37 @@
+import time
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+
+
+def run_benchmark(n_paths=500_000):
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+
+    configurations = [
+        ("Plain", {}),
+        ("Antithetic", {"antithetic": True}),
+        ("Moment matching", {"moment_matching": True}),
+        ("Control variates", {"control_variate": True}),
+        ("Antithetic + CV", {"antithetic": True, "control_variate": True}),
+        ("Importance sampling", {"importance_sampling": True}),
+    ]
+
+    for K in (100.0, 170.0):
+        exact = BlackScholes.call_price(S0, K, r, sigma, T)
+        print(f"European call, K = {K:.0f} (exact {exact:.5f}), {n_paths:,} paths")
+
+        baseline = None
+        for name, options in configurations:
+            start = time.perf_counter()
+            result = MonteCarloPricer.european(S0, K, r, sigma, T, n_paths, seed=42, **options)
+            elapsed = time.perf_counter() - start
+
+            # Efficiency: inverse of variance x time, relative to plain MC
+            cost = result.std_error ** 2 * elapsed
+            baseline = baseline or cost
+            print(f"  {name:<20}: {result.price:9.5f} +/- {result.std_error:.1e} "
+                  f"{elapsed * 1e3:6.1f} ms, efficiency {baseline / cost:7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
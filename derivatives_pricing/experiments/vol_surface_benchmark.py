@@ -0,0 +1,51 @@
+import time
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.vol_surface import VolSurface
+
+
+def run_benchmark(n_lookups=2_000_000):
+    S, r = 100.0, 0.03
+    rng = np.random.default_rng(42)
+
+    # A skewed market smile sampled on a listed-style chain
+    expiries = np.array([1 / 12, 0.25, 0.5, 1.0, 2.0, 3.0])
+    K = np.tile(np.linspace(60, 150, 40), len(expiries))
+    T = np.repeat(expiries, 40)
+    k = np.log(K / (S * np.exp(r * T)))
+    iv = 0.2 - 0.15 * k / np.sqrt(T + 0.25) + 0.1 * k ** 2 + rng.normal(0, 0.002, K.size)
+
+    start = time.perf_counter()
+    surface = VolSurface.from_quotes(S, r, K, T, iv)
+    build_time = time.perf_counter() - start
+
+    mask = T == 0.5
+    start = time.perf_counter()
+    surface.fit_slice(0.5, K[mask], iv[mask] + 0.005)
+    refit_time = time.perf_counter() - start
+
+    K_query = rng.uniform(50, 160, n_lookups)
+    T_query = rng.uniform(0.05, 3.0, n_lookups)
+
+    timings = {}
+    for name, exact in [("Cached grid", False), ("Exact SVI", True)]:
+        start = time.perf_counter()
+        sigma = surface.implied_vol(K_query, T_query, exact=exact)
+        timings[name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BlackScholes.prices(S, K_query, r, sigma, T_query)
+    pricing_time = time.perf_counter() - start
+
+    print(f"Surface build ({len(expiries)} slices): {build_time * 1e3:7.1f} ms")
+    print(f"Single-expiry refit       : {refit_time * 1e3:7.1f} ms")
+    for name, elapsed in timings.items():
+        print(f"{name:<26}: {n_lookups / elapsed:12,.0f} lookups/s")
+    print(f"Black-Scholes off surface : {n_lookups / pricing_time:12,.0f} prices/s")
+    print(f"Min butterfly g(k)        : {surface.arbitrage_report()['butterfly'].min():.4f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
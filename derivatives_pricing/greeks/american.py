@@ -0,0 +1,81 @@
+import numpy as np
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.utils.statistics import RunningStats
+
+
+class AmericanGreeks:
+    """
+    American option Greeks from a single Longstaff–Schwartz run.
+
+    The exercise policy estimated by LSM is held fixed and the
+    discounted payoff at each path's stopping time is differentiated
+    with respect to the inputs. By the envelope argument the policy's
+    own sensitivity contributes nothing at first order, so no paths are
+    re-simulated and no regressions are re-run.
+    """
+
+    @staticmethod
+    def american_put(
+        S0, K, r, sigma, T,
+        n_paths=100_000,
+        n_steps=50,
+        seed=None,
+        basis_degree=2,
+        basis="power",
+        regression="gram",
+        confidence=0.95
+    ):
+        """
+        Price, Delta, Gamma and Vega of an American put.
+
+        Per path, with stopping time tau and D = exp(-r tau):
+
+        - Delta: pathwise, -D 1{exercised} S_tau / S0
+        - Vega: pathwise, -D 1{exercised} S_tau (W_tau - sigma tau)
+        - Gamma: the pathwise Delta weighted by the likelihood-ratio
+          score of the first step, since the put's Delta is not
+          differentiable along a path
+
+        These are exactly the adjoints of the discounted payoff under
+        the frozen policy, so an explicit reverse-mode pass would
+        return the same numbers.
+
+        Returns
+        -------
+        dict
+            Keys ``price``, ``delta``, ``gamma``, ``vega``, each a
+            MonteCarloResult with the estimate and its standard error
+        """
+        paths = LongstaffSchwartzPricer.simulate_paths(
+            r, sigma, T, n_paths, n_steps, seed=seed
+        )
+        cashflow, exercise_step, _, _ = LongstaffSchwartzPricer._backward_induction(
+            ((t, paths[t]) for t in range(n_steps, 0, -1)),
+            K / S0, r, T, n_paths, n_steps, None,
+            basis_degree, False, basis, regression,
+        )
+
+        dt = T / n_steps
+        tau = exercise_step * dt
+        discount = np.exp(-r * tau)
+
+        # Unit-spot path value at the stopping time, and the Brownian
+        # motion that drove it there
+        X_tau = paths[exercise_step, np.arange(n_paths)]
+        W_tau = (np.log(X_tau) - (r - 0.5 * sigma ** 2) * tau) / sigma
+        Z_1 = (np.log(paths[1]) - (r - 0.5 * sigma ** 2) * dt) / (sigma * np.sqrt(dt))
+
+        exercised = cashflow > 0
+        dpayoff_dS = -discount * exercised * S0 * X_tau
+
+        samples = {
+            "price": S0 * discount * cashflow,
+            "delta": dpayoff_dS / S0,
+            "gamma": dpayoff_dS / S0 ** 2 * (Z_1 / (sigma * np.sqrt(dt)) - 1),
+            "vega": dpayoff_dS * (W_tau - sigma * tau),
+        }
+
+        return {
+            name: RunningStats.from_samples(values).to_result(confidence)
+            for name, values in samples.items()
+        }
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import norm
+from derivatives_pricing.utils.normal import norm_cdf, norm_pdf
 from derivatives_pricing.models.black_scholes import BlackScholes
 
 
@@ -14,7 +14,7 @@ class BlackScholesGreeks:
         Delta of a European call option.
         """
         d1 = BlackScholes._d1(S, K, r, sigma, T)
-        return norm.cdf(d1)
+        return norm_cdf(d1)
 
     @staticmethod
     def delta_put(S, K, r, sigma, T):
@@ -22,7 +22,7 @@ class BlackScholesGreeks:
         Delta of a European put option.
         """
         d1 = BlackScholes._d1(S, K, r, sigma, T)
-        return norm.cdf(d1) - 1
+        return norm_cdf(d1) - 1
 
     @staticmethod
     def gamma(S, K, r, sigma, T):
@@ -30,7 +30,7 @@ class BlackScholesGreeks:
         Gamma of a European option (same for call and put).
         """
         d1 = BlackScholes._d1(S, K, r, sigma, T)
-        return norm.pdf(d1) / (S * sigma * np.sqrt(T))
+        return norm_pdf(d1) / (S * sigma * np.sqrt(T))
 
     @staticmethod
     def vega(S, K, r, sigma, T):
@@ -38,7 +38,7 @@ class BlackScholesGreeks:
         Vega of a European option.
         """
         d1 = BlackScholes._d1(S, K, r, sigma, T)
-        return S * np.sqrt(T) * norm.pdf(d1)
+        return S * np.sqrt(T) * norm_pdf(d1)
 
     @staticmethod
     def theta_call(S, K, r, sigma, T):
@@ -48,8 +48,8 @@ class BlackScholesGreeks:
         d1 = BlackScholes._d1(S, K, r, sigma, T)
         d2 = BlackScholes._d2(S, K, r, sigma, T)
 
-        term1 = - (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
-        term2 = - r * K * np.exp(-r * T) * norm.cdf(d2)
+        term1 = - (S * norm_pdf(d1) * sigma) / (2 * np.sqrt(T))
+        term2 = - r * K * np.exp(-r * T) * norm_cdf(d2)
 
         return term1 + term2
 
@@ -61,7 +61,69 @@ class BlackScholesGreeks:
         d1 = BlackScholes._d1(S, K, r, sigma, T)
         d2 = BlackScholes._d2(S, K, r, sigma, T)
 
-        term1 = - (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
-        term2 = r * K * np.exp(-r * T) * norm.cdf(-d2)
+        term1 = - (S * norm_pdf(d1) * sigma) / (2 * np.sqrt(T))
+        term2 = r * K * np.exp(-r * T) * norm_cdf(-d2)
 
         return term1 + term2
+
+    @staticmethod
+    def rho_call(S, K, r, sigma, T):
+        """
+        Rho of a European call option.
+        """
+        d2 = BlackScholes._d2(S, K, r, sigma, T)
+        return K * T * np.exp(-r * T) * norm_cdf(d2)
+
+    @staticmethod
+    def rho_put(S, K, r, sigma, T):
+        """
+        Rho of a European put option.
+        """
+        d2 = BlackScholes._d2(S, K, r, sigma, T)
+        return -K * T * np.exp(-r * T) * norm_cdf(-d2)
+
+    @staticmethod
+    def all_greeks(S, K, r, sigma, T):
+        """
+        Prices and all analytical Greeks for calls and puts in one pass.
+
+        d1, d2, the normal pdf/cdf and the discount factor are evaluated
+        once per contract and shared by every output. Inputs broadcast
+        against each other, so whole chains are handled in one call.
+
+        Returns
+        -------
+        dict of ndarray
+            Keys: call_price, put_price, delta_call, delta_put, gamma,
+            vega, theta_call, theta_put, rho_call, rho_put
+        """
+        S, K, r, sigma, T = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (S, K, r, sigma, T))
+        )
+
+        sqrt_T = np.sqrt(T)
+        d1, d2 = BlackScholes._d1_d2(S, K, r, sigma, T)
+
+        pdf_d1 = norm_pdf(d1)
+        cdf_d1 = norm_cdf(d1)
+        cdf_d2 = norm_cdf(d2)
+        discounted_K = K * np.exp(-r * T)
+
+        call = S * cdf_d1 - discounted_K * cdf_d2
+        put = call + discounted_K - S
+
+        decay = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
+        rate_term = r * discounted_K
+
+        return {
+            "call_price": call,
+            "put_price": put,
+            "delta_call": cdf_d1,
+            "delta_put": cdf_d1 - 1,
+            "gamma": pdf_d1 / (S * sigma * sqrt_T),
+            "vega": S * sqrt_T * pdf_d1,
+            "theta_call": decay - rate_term * cdf_d2,
+            "theta_put": decay + rate_term * (1 - cdf_d2),
+            "rho_call": T * discounted_K * cdf_d2,
+            "rho_put": -T * discounted_K * (1 - cdf_d2),
+        }
@@ -1,10 +1,16 @@
 import numpy as np
-from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.greeks.numerical import NumericalGreeks
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.random import make_rng, seed_sequence
+from derivatives_pricing.utils.statistics import MonteCarloResult, RunningStats
+from derivatives_pricing.utils.variance_reduction import antithetic_normals, pair_average
 
 
 class MonteCarloGreeks:
     """
     Monte Carlo estimators for option Greeks.
+
+    ``seed`` may be None, an int, a numpy SeedSequence or a Generator.
     """
 
     @staticmethod
@@ -13,16 +19,91 @@ class MonteCarloGreeks:
     ):
         """
         Delta via bump-and-revalue using central differences.
+
+        Both legs are priced off one draw of normals, so they see common
+        random numbers.
         """
-        price_up = MonteCarloPricer.european_call(
-            S0 + eps, K, r, sigma, T, n_paths, seed
-        )
-        price_down = MonteCarloPricer.european_call(
-            S0 - eps, K, r, sigma, T, n_paths, seed
-        )
+        Z = make_rng(seed).standard_normal(n_paths)
+
+        ST = GBMPaths.terminal_from_normals(np.array([[S0 + eps], [S0 - eps]]), r, sigma, T, Z)
+        price_up, price_down = np.exp(-r * T) * np.mean(np.maximum(ST - K, 0.0), axis=1)
 
         return (price_up - price_down) / (2 * eps)
 
+    @staticmethod
+    def ladder_bump_and_revalue(
+        S0, K, r, sigma, T, n_paths,
+        is_call=True,
+        seed=None,
+        h_S=None,
+        h_sigma=1e-3,
+        h_r=1e-4,
+        h_T=1e-4,
+        model=None,
+        n_steps=50
+    ):
+        """
+        Full bump-and-revalue Greek ladder with common random numbers.
+
+        One set of normals is drawn and every unique bumped scenario from
+        ``NumericalGreeks.ladder`` is priced off it in a single broadcast,
+        so the bump legs differ only through their inputs. ``h_S``
+        defaults to 1% of spot, since second differences of a kinked
+        Monte Carlo payoff need a bump wider than the sampling noise.
+
+        With a ``models.stochastic`` path ``model`` (Heston, jump
+        diffusion, local volatility, ...), each distinct (spot, rate,
+        maturity) scenario is simulated over ``n_steps`` dates from the
+        same seed, so the legs again share their random numbers.
+        ``sigma`` is then unused and the volatility Greeks (vega, volga,
+        vanna) are left out, since the model has no single volatility.
+        Theta is left out too: a maturity bump changes the step size,
+        and schemes with branching or rejection sampling (Heston QE,
+        Poisson and gamma draws) then consume their random numbers
+        differently, which breaks the common random numbers.
+        """
+        if h_S is None:
+            h_S = 0.01 * S0
+
+        if model is not None:
+            return MonteCarloGreeks._model_ladder(
+                model, S0, K, r, T, n_paths, n_steps, is_call, seed, h_S, h_r, h_T
+            )
+
+        Z = make_rng(seed).standard_normal(n_paths)
+
+        def price_fn(S, vol, rate, mat):
+            S, vol, rate, mat = (x[:, np.newaxis] for x in (S, vol, rate, mat))
+            ST = GBMPaths.terminal_from_normals(S, rate, vol, mat, Z)
+            payoff = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+            return np.exp(-rate[:, 0] * mat[:, 0]) * np.mean(payoff, axis=1)
+
+        return NumericalGreeks.ladder(price_fn, S0, sigma, r, T, h_S, h_sigma, h_r, h_T)
+
+    @staticmethod
+    def _model_ladder(model, S0, K, r, T, n_paths, n_steps, is_call, seed, h_S, h_r, h_T):
+        """
+        Price, Delta, Gamma and Rho under a path model.
+
+        Every (spot, rate) scenario is simulated from the same
+        SeedSequence, which gives the legs common random numbers.
+        """
+        root = seed_sequence(seed)
+
+        def price_fn(S, vol, rate, mat):
+            prices = np.empty(len(S))
+            for i, (spot, rate_i, mat_i) in enumerate(zip(S, rate, mat)):
+                ST = model.terminal(spot, rate_i, mat_i, n_paths, n_steps, root)
+                payoff = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+                prices[i] = np.exp(-rate_i * mat_i) * np.mean(payoff)
+            return prices
+
+        # The model has no single volatility, so sigma is not applicable
+        return NumericalGreeks.ladder(
+            price_fn, S0, np.nan, r, T, h_S=h_S, h_r=h_r, h_T=h_T,
+            greeks=("price", "delta", "gamma", "rho"),
+        )
+
     @staticmethod
     def delta_pathwise(
             S0, K, r, sigma, T, n_paths, seed=None
@@ -30,15 +111,9 @@ class MonteCarloGreeks:
         """
         Pathwise Monte Carlo estimator for Delta of a European call option.
         """
-        if seed is not None:
-            np.random.seed(seed)
-
-        Z = np.random.standard_normal(n_paths)
+        Z = make_rng(seed).standard_normal(n_paths)
 
-        ST = S0 * np.exp(
-            (r - 0.5 * sigma ** 2) * T
-            + sigma * np.sqrt(T) * Z
-        )
+        ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
 
         indicator = (ST > K).astype(float)
 
@@ -53,18 +128,99 @@ class MonteCarloGreeks:
         """
         Monte Carlo Vega using Likelihood Ratio Method (LRM).
         """
-        if seed is not None:
-            np.random.seed(seed)
+        Z = make_rng(seed).standard_normal(n_paths)
 
-        Z = np.random.standard_normal(n_paths)
-
-        ST = S0 * np.exp(
-            (r - 0.5 * sigma ** 2) * T
-            + sigma * np.sqrt(T) * Z
-        )
+        ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
 
         payoff = np.maximum(ST - K, 0.0)
 
         weight = (Z ** 2 - 1) / sigma - Z * np.sqrt(T)
 
         return np.exp(-r * T) * np.mean(payoff * weight)
+
+    @staticmethod
+    def risk_pass(
+        S0, K, r, sigma, T, n_paths,
+        is_call=True,
+        seed=None,
+        chunk_size=100_000,
+        confidence=0.95,
+        antithetic=False
+    ):
+        """
+        Price and Greeks for a batch of European options from one path set.
+
+        ``K``, ``T`` and ``is_call`` broadcast against each other; every
+        contract on the underlying is priced off the same normals, drawn
+        once per chunk of ``chunk_size`` paths, and the per-contract
+        statistics are merged across chunks. Per path, with discount D,
+        payoff P, phi = +1 for calls and -1 for puts:
+
+        - delta: pathwise, D phi 1{ITM} S_T / S0
+        - vega: pathwise, D phi 1{ITM} S_T (sqrt(T) Z - sigma T)
+        - vega_lr: likelihood ratio, D P ((Z^2 - 1) / sigma - Z sqrt(T))
+        - gamma: likelihood ratio, D P (Z^2 - 1 - sigma sqrt(T) Z) / (S0 sigma)^2 T
+        - rho: pathwise, -T D P + D phi 1{ITM} S_T T
+        - theta: pathwise -dV/dT
+
+        With ``antithetic`` every draw is paired with its negative and
+        statistics are taken over pair averages (``n_paths`` and
+        ``chunk_size`` must be even).
+
+        Returns
+        -------
+        dict
+            Keys price, delta, gamma, vega, vega_lr, rho, theta, each a
+            MonteCarloResult whose fields have the broadcast shape of
+            (K, T, is_call)
+        """
+        K, T, is_call = np.broadcast_arrays(
+            np.asarray(K, dtype=float), np.asarray(T, dtype=float), np.asarray(is_call)
+        )
+        shape = K.shape
+        K, T = K.reshape(-1, 1), T.reshape(-1, 1)
+        phi = np.where(is_call.reshape(-1, 1), 1.0, -1.0)
+
+        discount = np.exp(-r * T)
+        sqrt_T = np.sqrt(T)
+        rng = make_rng(seed)
+        stats = {}
+
+        for start in range(0, n_paths, chunk_size):
+            size = min(chunk_size, n_paths - start)
+            Z = antithetic_normals(rng, size) if antithetic else rng.standard_normal(size)
+            Z2 = Z ** 2
+            ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
+
+            intrinsic = phi * (ST - K)
+            payoff = discount * np.maximum(intrinsic, 0.0)
+            # dP/dS_T times S_T, shared by every pathwise estimator
+            dpayoff = np.where(intrinsic > 0, discount * phi, 0.0) * ST
+
+            samples = {
+                "price": payoff,
+                "delta": dpayoff / S0,
+                "gamma": payoff * ((Z2 - 1) / (S0 * sigma) ** 2 / T - Z / (S0 ** 2 * sigma * sqrt_T)),
+                "vega": dpayoff * (sqrt_T * Z - sigma * T),
+                "vega_lr": payoff * ((Z2 - 1) / sigma - Z * sqrt_T),
+                "rho": T * (dpayoff - payoff),
+                "theta": r * payoff - dpayoff * (r - 0.5 * sigma ** 2 + 0.5 * sigma * Z / sqrt_T),
+            }
+
+            for name, values in samples.items():
+                if antithetic:
+                    values = pair_average(values, axis=1)
+                stats.setdefault(name, RunningStats()).merge(
+                    RunningStats.from_samples(values, axis=1)
+                )
+
+        results = {}
+        for name, stat in stats.items():
+            low, high = stat.confidence_interval(confidence)
+            results[name] = MonteCarloResult(
+                stat.mean.reshape(shape),
+                stat.std_error.reshape(shape),
+                (low.reshape(shape), high.reshape(shape)),
+                n_paths,
+            )
+        return results
@@ -1,6 +1,8 @@
 """
 Numerical Greeks using finite differences.
 """
+import numpy as np
+
 
 class NumericalGreeks:
     @staticmethod
@@ -58,3 +60,89 @@ class NumericalGreeks:
             dV_dT = (price_fn(T + h) - price_fn(T - h)) / (2 * h)
 
         return -dV_dT
+
+    @staticmethod
+    def ladder(price_fn, S, sigma, r, T, h_S=1e-2, h_sigma=1e-4, h_r=1e-4, h_T=1e-5, greeks=None):
+        """
+        Full finite-difference Greek ladder from a single batched call.
+
+        Every bumped scenario needed by the Greeks below is collected,
+        shared points (the base price, used by price, Gamma and Volga)
+        are evaluated once, and the unique scenarios are passed to
+        ``price_fn`` together. A Monte Carlo ``price_fn`` that prices
+        all scenarios off the same normals therefore gives common random
+        numbers across every leg.
+
+        Parameters
+        ----------
+        price_fn : callable
+            Vectorized pricer with signature price_fn(S, sigma, r, T),
+            where each argument is a 1-D array with one entry per
+            scenario; must return one price per scenario
+        S, sigma, r, T : float
+            Base point
+        h_S, h_sigma, h_r, h_T : float
+            Bump sizes; Theta falls back to a backward difference when
+            T <= h_T, as in ``theta``
+        greeks : sequence of str, optional
+            Subset of the keys below; only the scenarios those Greeks
+            need are priced
+
+        Returns
+        -------
+        dict
+            Keys price, delta, gamma, vega, volga, vanna, rho, theta (or
+            the requested subset)
+        """
+        if T <= h_T:
+            theta_legs = {(0, 0, 0, 0): -1.0 / h_T, (0, 0, 0, -1): 1.0 / h_T}
+        else:
+            theta_legs = {(0, 0, 0, 1): -0.5 / h_T, (0, 0, 0, -1): 0.5 / h_T}
+
+        # Each Greek as weights on scenarios given by (dS, dsigma, dr, dT)
+        # multiples of the bump sizes
+        stencils = {
+            "price": {(0, 0, 0, 0): 1.0},
+            "delta": {(1, 0, 0, 0): 0.5 / h_S, (-1, 0, 0, 0): -0.5 / h_S},
+            "gamma": {
+                (1, 0, 0, 0): 1.0 / h_S ** 2,
+                (0, 0, 0, 0): -2.0 / h_S ** 2,
+                (-1, 0, 0, 0): 1.0 / h_S ** 2,
+            },
+            "vega": {(0, 1, 0, 0): 0.5 / h_sigma, (0, -1, 0, 0): -0.5 / h_sigma},
+            "volga": {
+                (0, 1, 0, 0): 1.0 / h_sigma ** 2,
+                (0, 0, 0, 0): -2.0 / h_sigma ** 2,
+                (0, -1, 0, 0): 1.0 / h_sigma ** 2,
+            },
+            "vanna": {
+                (i, j, 0, 0): 0.25 * i * j / (h_S * h_sigma)
+                for i in (1, -1) for j in (1, -1)
+            },
+            "rho": {(0, 0, 1, 0): 0.5 / h_r, (0, 0, -1, 0): -0.5 / h_r},
+            "theta": theta_legs,
+        }
+
+        if greeks is not None:
+            unknown = set(greeks) - set(stencils)
+            if unknown:
+                raise ValueError(f"Unknown Greeks: {sorted(unknown)}")
+            stencils = {name: stencils[name] for name in greeks}
+
+        scenarios = list(dict.fromkeys(
+            point for stencil in stencils.values() for point in stencil
+        ))
+        bumps = np.array(scenarios, dtype=float)
+
+        prices = np.asarray(price_fn(
+            S + h_S * bumps[:, 0],
+            sigma + h_sigma * bumps[:, 1],
+            r + h_r * bumps[:, 2],
+            T + h_T * bumps[:, 3],
+        ))
+        index = {point: i for i, point in enumerate(scenarios)}
+
+        return {
+            name: sum(weight * prices[index[point]] for point, weight in stencil.items())
+            for name, stencil in stencils.items()
+        }
@@ -1,4 +1,4 @@
-import numpy as np
+from derivatives_pricing.models.lattice import LatticePricer
 
 
 class BinomialPricer:
@@ -8,20 +8,8 @@ class BinomialPricer:
 
     @staticmethod
     def american_put(S0, K, r, sigma, T, n_steps=200):
-        dt = T / n_steps
-        u = np.exp(sigma * np.sqrt(dt))
-        d = 1 / u
-        p = (np.exp(r * dt) - d) / (u - d)
-        discount = np.exp(-r * dt)
-
-        # Terminal prices
-        S = S0 * d ** np.arange(n_steps, -1, -1) * u ** np.arange(0, n_steps + 1)
-        V = np.maximum(K - S, 0.0)
-
-        # Backward induction
-        for _ in range(n_steps):
-            V = discount * (p * V[1:] + (1 - p) * V[:-1])
-            S = S[:-1] / d
-            V = np.maximum(V, K - S)
-
-        return V[0]
\ No newline at end of file
+        """
+        American put on a CRR tree; see LatticePricer for batched pricing,
+        calls, trinomial trees and BBSR acceleration.
+        """
+        return LatticePricer.price(S0, K, r, sigma, T, n_steps=n_steps)[()]
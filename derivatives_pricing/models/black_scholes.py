@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.stats import norm
+from derivatives_pricing.utils.normal import norm_cdf
 
 
 class BlackScholes:
@@ -18,6 +18,15 @@ class BlackScholes:
     def _d2(S, K, r, sigma, T):
         return BlackScholes._d1(S, K, r, sigma, T) - sigma * np.sqrt(T)
 
+    @staticmethod
+    def _d1_d2(S, K, r, sigma, T):
+        """
+        Compute d1 and d2 together, sharing sigma * sqrt(T).
+        """
+        vol_sqrt_T = sigma * np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / vol_sqrt_T
+        return d1, d1 - vol_sqrt_T
+
     @staticmethod
     def call_price(S, K, r, sigma, T):
         """
@@ -36,10 +45,9 @@ class BlackScholes:
         T : float
             Time to maturity (in years)
         """
-        d1 = BlackScholes._d1(S, K, r, sigma, T)
-        d2 = BlackScholes._d2(S, K, r, sigma, T)
+        d1, d2 = BlackScholes._d1_d2(S, K, r, sigma, T)
 
-        return S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        return S * norm_cdf(d1) - K * np.exp(-r * T) * norm_cdf(d2)
 
     @staticmethod
     def put_price(S, K, r, sigma, T):
@@ -48,3 +56,54 @@ class BlackScholes:
         """
         call = BlackScholes.call_price(S, K, r, sigma, T)
         return call + K * np.exp(-r * T) - S
+
+    @staticmethod
+    def prices(S, K, r, sigma, T):
+        """
+        Vectorized call and put prices for a batch of contracts.
+
+        All inputs are broadcast against each other, so a whole option
+        chain is priced in a single NumPy pass: d1, d2 and the discount
+        factor are evaluated once and shared by both legs.
+
+        Parameters
+        ----------
+        S, K, r, sigma, T : float or array_like
+            Spot, strike, rate, volatility and maturity (broadcastable)
+
+        Returns
+        -------
+        call, put : ndarray
+            Call and put prices with the broadcast shape of the inputs
+        """
+        S, K, r, sigma, T = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (S, K, r, sigma, T))
+        )
+
+        d1, d2 = BlackScholes._d1_d2(S, K, r, sigma, T)
+        discounted_K = K * np.exp(-r * T)
+
+        call = S * norm_cdf(d1) - discounted_K * norm_cdf(d2)
+        put = call + discounted_K - S
+
+        return call, put
+
+    @staticmethod
+    def price_chain(chain):
+        """
+        Price a columnar option chain.
+
+        Parameters
+        ----------
+        chain : mapping or structured ndarray
+            Columns named ``S``, ``K``, ``r``, ``sigma`` and ``T``
+            (e.g. a dict of arrays or a NumPy record array)
+
+        Returns
+        -------
+        call, put : ndarray
+            Call and put prices, one per row of the chain
+        """
+        return BlackScholes.prices(
+            chain["S"], chain["K"], chain["r"], chain["sigma"], chain["T"]
+        )
@@ -0,0 +1,189 @@
+import numpy as np
+
+from derivatives_pricing.utils.normal import norm_cdf, norm_pdf
+
+
+class ImpliedVolatility:
+    """
+    Vectorized Black-Scholes implied volatility solver.
+
+    Every quote is mapped to its out-of-the-money leg through put-call
+    parity (deep ITM time value is tiny and loses precision otherwise),
+    started from a Corrado-Miller rational guess and refined with
+    Newton steps on the log price, safeguarded by a per-contract
+    bisection bracket.
+    """
+
+    CONVERGED = 0
+    BELOW_INTRINSIC = 1
+    ABOVE_UPPER_BOUND = 2
+    MAX_ITERATIONS = 3
+    INVALID_INPUT = 4
+
+    @staticmethod
+    def _otm_price_and_vega(S, X, sigma, T, is_call):
+        """
+        Price and vega of the OTM leg with discounted strike X.
+        """
+        sqrt_T = np.sqrt(T)
+        vol_sqrt_T = sigma * sqrt_T
+        d1 = np.log(S / X) / vol_sqrt_T + 0.5 * vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+
+        sign = np.where(is_call, 1.0, -1.0)
+        price = sign * (S * norm_cdf(sign * d1) - X * norm_cdf(sign * d2))
+        vega = S * sqrt_T * norm_pdf(d1)
+
+        return price, vega
+
+    @staticmethod
+    def _initial_guess(call, otm_price, S, X, T):
+        """
+        Corrado-Miller approximation near the money. In the wings, where
+        it breaks down, the leading term of the normalized OTM price
+        asymptotics log(c) ~ -x^2 / (2 v^2) with x = log(S/X) and
+        v = sigma * sqrt(T) is inverted instead.
+        """
+        half_moneyness = 0.5 * (S - X)
+        excess = call - half_moneyness
+        discriminant = excess ** 2 - (S - X) ** 2 / np.pi
+
+        with np.errstate(invalid="ignore"):
+            corrado_miller = (
+                np.sqrt(2 * np.pi / T) / (S + X)
+                * (excess + np.sqrt(discriminant))
+            )
+
+        log_moneyness = np.log(S / X)
+        log_normalized = np.log(otm_price / np.sqrt(S * X))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            asymptotic = np.abs(log_moneyness) / np.sqrt(-2 * log_normalized * T)
+
+        near_money = (
+            (discriminant > 0)
+            & np.isfinite(corrado_miller)
+            & (corrado_miller > 0)
+            & (log_normalized > -np.abs(log_moneyness) - 2)
+        )
+        return np.where(near_money, corrado_miller, asymptotic)
+
+    @staticmethod
+    def solve(
+        price, S, K, r, T,
+        is_call=True,
+        tol=1e-12,
+        max_iter=100,
+        sigma_min=1e-6,
+        sigma_max=10.0
+    ):
+        """
+        Invert Black-Scholes prices for volatility.
+
+        Parameters
+        ----------
+        price : float or array_like
+            Observed option prices
+        S, K, r, T : float or array_like
+            Spot, strike, rate and maturity (broadcastable with price)
+        is_call : bool or array_like of bool
+            True for calls, False for puts
+        tol : float
+            Relative price tolerance on the OTM leg
+        max_iter : int
+            Maximum number of Newton/bisection iterations
+        sigma_min, sigma_max : float
+            Initial bisection bracket
+
+        Returns
+        -------
+        sigma : ndarray
+            Implied volatilities (NaN where no solution exists)
+        status : ndarray of int
+            Per-contract status: CONVERGED, BELOW_INTRINSIC,
+            ABOVE_UPPER_BOUND, MAX_ITERATIONS or INVALID_INPUT (a
+            non-finite input, or a non-positive spot, strike or
+            maturity)
+        """
+        price, S, K, r, T, is_call = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (price, S, K, r, T)),
+            np.asarray(is_call, dtype=bool),
+        )
+        shape = price.shape
+        price, S, K, r, T, is_call = (
+            np.ravel(x) for x in (price, S, K, r, T, is_call)
+        )
+
+        invalid = (
+            ~(np.isfinite(price) & np.isfinite(S) & np.isfinite(K) & np.isfinite(r) & np.isfinite(T))
+            | (S <= 0) | (K <= 0) | (T <= 0)
+        )
+
+        X = K * np.exp(-r * T)
+        call = np.where(is_call, price, price + S - X)
+
+        # Map every quote to its out-of-the-money leg, using the quote
+        # directly when it already is that leg
+        otm_is_call = S <= X
+        converted = is_call != otm_is_call
+        target = np.where(
+            converted,
+            np.where(otm_is_call, call, call - S + X),
+            price,
+        )
+        upper = np.where(otm_is_call, S, X)
+
+        # Time value lost in the parity rounding carries no information
+        noise_floor = np.where(converted, 16 * np.finfo(float).eps * (S + X), 0.0)
+
+        sigma = np.full(price.shape, np.nan)
+        status = np.full(price.shape, ImpliedVolatility.MAX_ITERATIONS, dtype=int)
+        status[target <= noise_floor] = ImpliedVolatility.BELOW_INTRINSIC
+        status[target >= upper] = ImpliedVolatility.ABOVE_UPPER_BOUND
+        status[invalid] = ImpliedVolatility.INVALID_INPUT
+
+        active = np.flatnonzero(status == ImpliedVolatility.MAX_ITERATIONS)
+
+        a_S, a_X, a_T = S[active], X[active], T[active]
+        a_call, a_target, a_is_call = call[active], target[active], otm_is_call[active]
+        log_target = np.log(a_target)
+
+        lo = np.full(active.size, sigma_min)
+        hi = np.full(active.size, sigma_max)
+        x = ImpliedVolatility._initial_guess(a_call, a_target, a_S, a_X, a_T)
+        x = np.clip(np.nan_to_num(x, nan=0.2), sigma_min, sigma_max)
+
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+
+            p, vega = ImpliedVolatility._otm_price_and_vega(a_S, a_X, x, a_T, a_is_call)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                f = np.log(p) - log_target
+                step = f * p / vega
+
+            done = np.abs(f) <= tol
+            sigma[active[done]] = x[done]
+            status[active[done]] = ImpliedVolatility.CONVERGED
+
+            # Price is increasing in sigma, so f tightens the bracket
+            hi = np.where(f > 0, x, hi)
+            lo = np.where(f <= 0, x, lo)
+
+            x_new = x - step
+            use_bisection = ~np.isfinite(x_new) | (x_new <= lo) | (x_new >= hi)
+            x_new = np.where(use_bisection, 0.5 * (lo + hi), x_new)
+
+            # Bracket collapsed to machine precision
+            collapsed = (hi - lo) <= 4 * np.finfo(float).eps * x_new
+            collapsed &= ~done
+            sigma[active[collapsed]] = x_new[collapsed]
+            status[active[collapsed]] = ImpliedVolatility.CONVERGED
+
+            keep = ~(done | collapsed)
+            active = active[keep]
+            a_S, a_X, a_T = a_S[keep], a_X[keep], a_T[keep]
+            a_is_call, log_target = a_is_call[keep], log_target[keep]
+            lo, hi, x = lo[keep], hi[keep], x_new[keep]
+
+        return sigma.reshape(shape), status.reshape(shape)
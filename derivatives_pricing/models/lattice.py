@@ -0,0 +1,145 @@
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+
+
+class LatticePricer:
+    """
+    Batched binomial (CRR) and trinomial lattice pricer.
+
+    A whole set of contracts is priced at once on a 2-D lattice (one row
+    per contract). Node prices are strided views into a single
+    precomputed grid S0 * u^k, and option values are rolled back in place
+    on preallocated buffers, so nothing is allocated inside the time loop.
+
+    Black-Scholes smoothing (BBS) replaces the last step with closed-form
+    European values, and Richardson extrapolation (BBSR) combines n and
+    n/2 steps, giving prices at 100 steps comparable to plain CRR with a
+    few thousand steps.
+    """
+
+    @staticmethod
+    def _roll_back(S0, K, r, sigma, T, n_steps, is_call, american, tree, smoothing):
+        dt = T / n_steps
+        discount = np.exp(-r * dt)
+        sign = np.where(is_call, 1.0, -1.0)
+
+        if tree == "binomial":
+            u = np.exp(sigma * np.sqrt(dt))
+            p_up = (np.exp(r * dt) - 1 / u) / (u - 1 / u)
+            weights = ((1 - p_up) * discount, p_up * discount)
+            stride, width = 2, n_steps + 1
+
+            def n_nodes(i):
+                return i + 1
+        elif tree == "trinomial":
+            u = np.exp(sigma * np.sqrt(3 * dt))
+            drift = (r - 0.5 * sigma ** 2) * np.sqrt(dt / (12 * sigma ** 2))
+            weights = (
+                (1 / 6 - drift) * discount,
+                2 / 3 * discount,
+                (1 / 6 + drift) * discount,
+            )
+            stride, width = 1, 2 * n_steps + 1
+
+            def n_nodes(i):
+                return 2 * i + 1
+        else:
+            raise ValueError(f"Unknown tree: {tree!r}")
+
+        # Every node price of every step is S0 * u^k for k in [-n, n]
+        grid = S0 * u ** np.arange(-n_steps, n_steps + 1)
+
+        def node_prices(i):
+            return grid[:, n_steps - i:n_steps + i + 1:stride]
+
+        V = np.empty((len(S0), width))
+        buffer = np.empty_like(V)
+
+        np.multiply(sign, node_prices(n_steps) - K, out=V)
+        np.maximum(V, 0.0, out=V)
+
+        for i in range(n_steps - 1, -1, -1):
+            m = n_nodes(i)
+            value, tmp = V[:, :m], buffer[:, :m]
+
+            if smoothing and i == n_steps - 1:
+                call, put = BlackScholes.prices(node_prices(i), K, r, sigma, dt)
+                np.copyto(value, np.where(is_call, call, put))
+            else:
+                # Expected discounted value over the child nodes; the
+                # lowest child shares the parent's index, so scaling
+                # `value` in place last keeps the update correct
+                np.multiply(weights[-1], V[:, len(weights) - 1:len(weights) - 1 + m], out=tmp)
+                for offset in range(len(weights) - 2, 0, -1):
+                    tmp += weights[offset] * V[:, offset:offset + m]
+                value *= weights[0]
+                value += tmp
+
+            if american:
+                np.subtract(node_prices(i), K, out=tmp)
+                tmp *= sign
+                np.maximum(value, tmp, out=value)
+
+        return V[:, 0].copy()
+
+    @staticmethod
+    def price(
+        S0, K, r, sigma, T,
+        n_steps=100,
+        is_call=False,
+        american=True,
+        tree="binomial",
+        smoothing=False,
+        richardson=False
+    ):
+        """
+        Price a batch of options on a lattice.
+
+        Parameters
+        ----------
+        S0, K, r, sigma, T : float or array_like
+            Contract parameters (broadcastable)
+        n_steps : int
+            Number of time steps (even and at least 2 with ``richardson``,
+            so both lattices share the same parity)
+        is_call : bool or array_like of bool
+            True for calls, False for puts
+        american : bool
+            Allow early exercise
+        tree : {"binomial", "trinomial"}
+            Lattice type
+        smoothing : bool
+            Black-Scholes smoothing of the last step (BBS)
+        richardson : bool
+            Richardson extrapolation 2 * V(n) - V(n / 2) (BBSR when combined
+            with smoothing)
+
+        Returns
+        -------
+        ndarray
+            Prices with the broadcast shape of the inputs
+        """
+        if n_steps < 1:
+            raise ValueError(f"n_steps must be positive, got {n_steps}")
+        if richardson and n_steps % 2:
+            raise ValueError(f"Richardson extrapolation needs an even n_steps >= 2, got {n_steps}")
+
+        S0, K, r, sigma, T, is_call = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (S0, K, r, sigma, T)),
+            np.asarray(is_call, dtype=bool),
+        )
+        shape = S0.shape
+        S0, K, r, sigma, T = (x.reshape(-1, 1) for x in (S0, K, r, sigma, T))
+        is_call = is_call.reshape(-1, 1)
+
+        args = (S0, K, r, sigma, T)
+        options = (is_call, american, tree, smoothing)
+
+        value = LatticePricer._roll_back(*args, n_steps, *options)
+
+        if richardson:
+            coarse = LatticePricer._roll_back(*args, n_steps // 2, *options)
+            value = 2 * value - coarse
+
+        return value.reshape(shape)
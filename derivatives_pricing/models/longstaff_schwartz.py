@@ -1,5 +1,13 @@
 import numpy as np
 
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.models.regression import RegressionBasis
+from derivatives_pricing.utils.random import make_rng, spawn_rngs
+from derivatives_pricing.utils.statistics import (
+    ControlVariateStats, MonteCarloResult, RunningStats,
+)
+
 
 class LongstaffSchwartzPricer:
     """
@@ -8,126 +16,399 @@ class LongstaffSchwartzPricer:
     """
 
     @staticmethod
-    def american_put(
-        S0, K, r, sigma, T,
-        n_paths=100_000,
-        n_steps=50,
-        seed=None,
-        basis_degree=2,
-        split_paths=False,
-        return_boundary=False
-    ):
-        if seed is not None:
-            np.random.seed(seed)
+    def _forward_paths(S0, r, sigma, T, n_paths, n_steps, rng, dtype):
+        """
+        Simulate and store full time-major GBM paths, then yield S_t
+        for t = n_steps..1.
+        """
+        S = GBMPaths.simulate(
+            S0, r, sigma, T, n_paths, n_steps,
+            seed=rng, time_major=True, dtype=dtype,
+        )
+
+        for t in range(n_steps, 0, -1):
+            yield t, S[t]
+
+    @staticmethod
+    def _sobol_paths(S0, r, sigma, T, n_paths, n_steps, rng, dtype):
+        """
+        Scrambled Sobol paths with Brownian bridge construction.
+        """
+        S = GBMPaths.simulate_sobol(
+            S0, r, sigma, T, n_paths, n_steps,
+            seed=rng, time_major=True, dtype=dtype,
+        )
+
+        for t in range(n_steps, 0, -1):
+            yield t, S[t]
 
+    @staticmethod
+    def _bridge_paths(S0, r, sigma, T, n_paths, n_steps, rng, dtype):
+        """
+        Generate GBM paths backwards in time with a Brownian bridge.
+
+        Only the current Brownian level W_t is kept: given W_{t+1}, the
+        bridge from W_0 = 0 gives
+        W_t ~ N(W_{t+1} * t / (t + 1), dt * t / (t + 1)),
+        so memory is O(n_paths) instead of O(n_paths * n_steps).
+        """
         dt = T / n_steps
-        discount = np.exp(-r * dt)
+        drift = r - 0.5 * sigma ** 2
 
-        # 1. Simulate GBM paths
-        S = np.zeros((n_paths, n_steps + 1))
-        S[:, 0] = S0
+        W = np.sqrt(T) * rng.standard_normal(n_paths)
 
-        Z = np.random.standard_normal((n_paths, n_steps))
+        for t in range(n_steps, 0, -1):
+            if t < n_steps:
+                weight = t / (t + 1)
+                W *= weight
+                W += np.sqrt(dt * weight) * rng.standard_normal(n_paths)
 
-        for t in range(1, n_steps + 1):
-            S[:, t] = S[:, t - 1] * np.exp(
-                (r - 0.5 * sigma ** 2) * dt
-                + sigma * np.sqrt(dt) * Z[:, t - 1]
-            )
+            yield t, (S0 * np.exp(drift * t * dt + sigma * W)).astype(dtype, copy=False)
+
+    @staticmethod
+    def _backward_induction(
+        paths, K, r, T, n_paths, n_steps, rng,
+        basis_degree, split_paths, basis, regression
+    ):
+        """
+        LSM backward induction over (t, S_t) pairs yielded from
+        t = n_steps down to 1.
+
+        Returns the exercise policy: each path's cash flow, the step at
+        which it is received, and the exercise boundary per date; plus
+        the undiscounted European put payoff of each path.
+        """
+        dt = T / n_steps
+        discount = np.exp(-r * dt)
 
-        # 2. Initialize payoff
-        V = np.zeros_like(S)
-        V[:, -1] = np.maximum(K - S[:, -1], 0.0)
+        # 2. Initialize payoff at maturity
+        _, S_T = next(paths)
+        cashflow = np.maximum(K - S_T.astype(float), 0.0)
+        european = cashflow.copy()
+        exercise_step = np.full(n_paths, n_steps)
 
         exercise_boundary = []
 
         # Optional path splitting
         if split_paths:
-            perm = np.random.permutation(n_paths)
+            perm = rng.permutation(n_paths)
             split = int(0.7 * n_paths)
-            train_idx = perm[:split]
-            test_idx = perm[split:]
+            train_mask = np.zeros(n_paths, dtype=bool)
+            train_mask[perm[:split]] = True
         else:
-            train_idx = test_idx = None
+            train_mask = None
 
-        # 3. Backward induction
-        for t in range(n_steps - 1, 0, -1):
-            itm = np.where(K - S[:, t] > 0)[0]
-            otm = np.where(K - S[:, t] <= 0)[0]
+        # Regression design matrix, reused at every date
+        design = np.empty((n_paths, basis_degree + 1))
+        discount_powers = discount ** np.arange(n_steps + 1)
 
-            # OTM paths must continue
-            V[otm, t] = discount * V[otm, t + 1]
+        # 3. Backward induction
+        for t, S_t in paths:
+            S_t = S_t.astype(float, copy=False)
+            itm_mask = S_t < K
 
-            if len(itm) == 0:
+            if not itm_mask.any():
                 exercise_boundary.append(np.nan)
                 continue
 
             # Select regression set
             if split_paths:
-                itm_train = np.intersect1d(itm, train_idx)
-                itm_test = np.intersect1d(itm, test_idx)
+                itm_train = np.flatnonzero(itm_mask & train_mask)
+                itm_test = np.flatnonzero(itm_mask & ~train_mask)
 
                 if len(itm_train) == 0 or len(itm_test) == 0:
-                    V[itm, t] = discount * V[itm, t + 1]
                     exercise_boundary.append(np.nan)
                     continue
 
-                X_train = np.column_stack(
-                    [S[itm_train, t] ** d for d in range(basis_degree + 1)]
+                X_train, scaling = RegressionBasis.fill(
+                    S_t[itm_train], K, basis_degree, basis, out=design
                 )
-                Y_train = discount * V[itm_train, t + 1]
+                Y_train = cashflow[itm_train] * discount_powers[exercise_step[itm_train] - t]
 
-                beta = np.linalg.lstsq(X_train, Y_train, rcond=None)[0]
+                beta = RegressionBasis.solve(X_train, Y_train, regression)
 
-                X_test = np.column_stack(
-                    [S[itm_test, t] ** d for d in range(basis_degree + 1)]
+                X_test, _ = RegressionBasis.fill(
+                    S_t[itm_test], K, basis_degree, basis, out=design, scaling=scaling
                 )
                 continuation = X_test @ beta
 
-                exercise = K - S[itm_test, t]
+                exercise = K - S_t[itm_test]
                 exercise_now = exercise > continuation
 
-                if np.any(exercise_now):
-                    boundary = np.max(S[itm_test[exercise_now], t])
-                else:
-                    boundary = np.nan
-
-                exercise_boundary.append(boundary)
-
-                V[itm_test, t] = np.where(exercise_now, exercise, discount * V[itm_test, t + 1])
-                exercised_paths = itm_test[exercise_now]
-                V[exercised_paths, t + 1:] = 0.0
-
                 # Train paths always continue
-                V[itm_train, t] = discount * V[itm_train, t + 1]
+                exercised_paths = itm_test[exercise_now]
+                exercise = exercise[exercise_now]
 
             else:
                 # Standard LSM (in-sample regression)
-                X = np.column_stack(
-                    [S[itm, t] ** d for d in range(basis_degree + 1)]
-                )
-                Y = discount * V[itm, t + 1]
+                itm = np.flatnonzero(itm_mask)
+
+                X, _ = RegressionBasis.fill(S_t[itm], K, basis_degree, basis, out=design)
+                Y = cashflow[itm] * discount_powers[exercise_step[itm] - t]
 
-                beta = np.linalg.lstsq(X, Y, rcond=None)[0]
+                beta = RegressionBasis.solve(X, Y, regression)
                 continuation = X @ beta
 
-                exercise = K - S[itm, t]
+                exercise = K - S_t[itm]
                 exercise_now = exercise > continuation
 
-                if np.any(exercise_now):
-                    boundary = np.max(S[itm[exercise_now], t])
-                else:
-                    boundary = np.nan
+                exercised_paths = itm[exercise_now]
+                exercise = exercise[exercise_now]
 
-                exercise_boundary.append(boundary)
+            if len(exercised_paths) > 0:
+                boundary = np.max(S_t[exercised_paths])
+            else:
+                boundary = np.nan
 
-                V[itm, t] = np.where(exercise_now, exercise, Y)
-                exercised_paths = itm[exercise_now]
-                V[exercised_paths, t + 1:] = 0.0
+            exercise_boundary.append(boundary)
+
+            # Exercising replaces the path's cash flow and stopping time
+            cashflow[exercised_paths] = exercise
+            exercise_step[exercised_paths] = t
+
+        return cashflow, exercise_step, exercise_boundary[::-1], european
+
+    @staticmethod
+    def _policy_value(cashflow, exercise_step, r, T, n_steps, european=None, european_price=None):
+        """
+        Mean of the cash flows discounted from their stopping times.
+
+        Given each path's European payoff and its Black–Scholes value,
+        the discounted European put is used as a control variate with a
+        fitted coefficient.
+        """
+        values = cashflow * np.exp(-r * T / n_steps * exercise_step)
+        if european is None:
+            return np.mean(values)
+
+        stats = ControlVariateStats.from_samples(values, np.exp(-r * T) * european)
+        return stats.to_stats(european_price).mean
+
+    @staticmethod
+    def american_put(
+        S0, K, r, sigma, T,
+        n_paths=100_000,
+        n_steps=50,
+        seed=None,
+        basis_degree=2,
+        split_paths=False,
+        return_boundary=False,
+        low_memory=False,
+        dtype=np.float64,
+        sampler="pseudo",
+        basis="power",
+        regression="gram",
+        control_variate=False
+    ):
+        """
+        Price an American put with Longstaff–Schwartz.
+
+        Each path carries a single cash flow and the step at which it is
+        received (its stopping time); continuation values are discounted
+        from there, so no (n_paths, n_steps + 1) value matrix is needed.
+
+        Parameters
+        ----------
+        seed : None, int, SeedSequence or Generator
+            Source of randomness for path simulation and path splitting
+        low_memory : bool
+            Regenerate paths backwards in time with a Brownian bridge
+            instead of storing the full path matrix (O(n_paths) memory)
+        dtype : numpy dtype
+            Storage precision for simulated prices (e.g. np.float32)
+        sampler : {"pseudo", "sobol"}
+            Pseudo-random normals, or scrambled Sobol points with Brownian
+            bridge construction (use a power of two for n_paths)
+        basis : str
+            Regression basis, one of RegressionBasis.KINDS, built on S / K
+        regression : {"gram", "qr", "lstsq"}
+            Least-squares solver for the continuation value
+        control_variate : bool
+            Use the European put on the same paths, valued by
+            Black–Scholes, as a control variate
+        """
+        rng = make_rng(seed)
+
+        # 1. GBM paths, visited backwards from maturity
+        if sampler == "sobol":
+            if low_memory:
+                raise ValueError("low_memory is not supported with the Sobol sampler")
+            simulate = LongstaffSchwartzPricer._sobol_paths
+        elif sampler == "pseudo":
+            simulate = (
+                LongstaffSchwartzPricer._bridge_paths if low_memory
+                else LongstaffSchwartzPricer._forward_paths
+            )
+        else:
+            raise ValueError(f"Unknown sampler: {sampler!r}")
+        paths = simulate(S0, r, sigma, T, n_paths, n_steps, rng, dtype)
+
+        cashflow, exercise_step, boundary, european = LongstaffSchwartzPricer._backward_induction(
+            paths, K, r, T, n_paths, n_steps, rng,
+            basis_degree, split_paths, basis, regression,
+        )
+        european_price = None
+        if control_variate:
+            european_price = BlackScholes.put_price(S0, K, r, sigma, T)
+        else:
+            european = None
+        price = LongstaffSchwartzPricer._policy_value(
+            cashflow, exercise_step, r, T, n_steps, european, european_price
+        )
+
+        if return_boundary:
+            return price, boundary
 
-        price = discount * np.mean(V[:, 1])
+        return price
+
+    @staticmethod
+    def simulate_paths(
+        r, sigma, T,
+        n_paths=100_000,
+        n_steps=50,
+        seed=None,
+        dtype=np.float64,
+        sampler="pseudo"
+    ):
+        """
+        Simulate a normalized (S0 = 1) time-major GBM path set.
+
+        GBM prices scale linearly with S0, so one path set serves every
+        spot and strike in a sweep through ``american_put_from_paths``.
+
+        Returns
+        -------
+        ndarray of shape (n_steps + 1, n_paths)
+        """
+        if sampler == "sobol":
+            return GBMPaths.simulate_sobol(
+                1.0, r, sigma, T, n_paths, n_steps,
+                seed=seed, time_major=True, dtype=dtype,
+            )
+        if sampler == "pseudo":
+            return GBMPaths.simulate(
+                1.0, r, sigma, T, n_paths, n_steps,
+                seed=seed, time_major=True, dtype=dtype,
+            )
+        raise ValueError(f"Unknown sampler: {sampler!r}")
+
+    @staticmethod
+    def american_put_from_paths(
+        paths, S0, K, r, T,
+        basis_degree=2,
+        split_paths=False,
+        return_boundary=False,
+        seed=None,
+        basis="power",
+        regression="gram",
+        sigma=None
+    ):
+        """
+        Run LSM backward induction on a precomputed normalized path set.
+
+        The put is homogeneous of degree one in (S0, K), so it is priced
+        on the unit-spot paths with strike K / S0 and rescaled; the path
+        set is never copied. ``r`` and ``T`` must match the simulation.
+
+        Parameters
+        ----------
+        paths : ndarray of shape (n_steps + 1, n_paths)
+            Output of ``simulate_paths``; leading columns may be sliced
+            off to use fewer paths
+        seed : None, int, SeedSequence or Generator
+            Randomness for the path-splitting permutation
+        sigma : float, optional
+            Volatility the paths were simulated with; when given, the
+            European put is used as a control variate
+        """
+        n_steps = paths.shape[0] - 1
+        n_paths = paths.shape[1]
+
+        cashflow, exercise_step, boundary, european = LongstaffSchwartzPricer._backward_induction(
+            ((t, paths[t]) for t in range(n_steps, 0, -1)),
+            K / S0, r, T, n_paths, n_steps, make_rng(seed),
+            basis_degree, split_paths, basis, regression,
+        )
+        european_price = None
+        if sigma is None:
+            european = None
+        else:
+            european_price = BlackScholes.put_price(1.0, K / S0, r, sigma, T)
+        price = S0 * LongstaffSchwartzPricer._policy_value(
+            cashflow, exercise_step, r, T, n_steps, european, european_price
+        )
 
         if return_boundary:
-            return price, exercise_boundary[::-1]
+            return price, [S0 * b for b in boundary]
+
+        return price
+
+    @staticmethod
+    def american_put_model(
+        model, S0, K, r, T,
+        n_paths=100_000,
+        n_steps=50,
+        seed=None,
+        basis_degree=2,
+        split_paths=False,
+        dtype=np.float64,
+        basis="power",
+        regression="gram"
+    ):
+        """
+        American put under any ``models.stochastic`` path model.
+
+        The regression uses the spot only, so under stochastic
+        volatility the exercise policy ignores the variance state and
+        the price is a (slightly) lower bound.
+
+        Parameters
+        ----------
+        model : PathModel
+            E.g. HestonModel, LocalVolModel or JumpDiffusionModel
+        dtype : numpy dtype
+            Storage precision of the simulated path array
+        """
+        rng = make_rng(seed)
+        paths = model.simulate(S0, r, T, n_paths, n_steps, seed=rng, time_major=True, dtype=dtype)
+
+        cashflow, exercise_step, _, _ = LongstaffSchwartzPricer._backward_induction(
+            ((t, paths[t]) for t in range(n_steps, 0, -1)),
+            K, r, T, n_paths, n_steps, rng,
+            basis_degree, split_paths, basis, regression,
+        )
+        return LongstaffSchwartzPricer._policy_value(cashflow, exercise_step, r, T, n_steps)
+
+    @staticmethod
+    def american_put_rqmc(
+        S0, K, r, sigma, T,
+        n_paths=2 ** 14,
+        n_replicates=16,
+        seed=None,
+        **kwargs
+    ):
+        """
+        American put via randomized QMC replicates of Sobol-driven LSM.
+
+        Each replicate runs ``american_put`` on an independently scrambled
+        Sobol path set; the replicate spread gives the standard error.
+        Extra keyword arguments are passed to ``american_put``.
+
+        Returns
+        -------
+        MonteCarloResult
+            (price, std_error, conf_interval, n_paths) with n_paths the
+            total over all replicates
+        """
+        estimates = [
+            LongstaffSchwartzPricer.american_put(
+                S0, K, r, sigma, T,
+                n_paths=n_paths, seed=rng, sampler="sobol", **kwargs
+            )
+            for rng in spawn_rngs(seed, n_replicates)
+        ]
 
-        return price
\ No newline at end of file
+        stats = RunningStats.from_samples(estimates)
+        return MonteCarloResult(
+            stats.mean, stats.std_error, stats.confidence_interval(), n_paths * n_replicates
+        )
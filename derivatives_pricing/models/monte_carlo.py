@@ -1,9 +1,21 @@
 import numpy as np
 
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.qmc import sobol_normals
+from derivatives_pricing.utils.random import make_rng, spawn_rngs
+from derivatives_pricing.utils.statistics import (
+    ControlVariateStats, MonteCarloResult, RunningStats,
+)
+from derivatives_pricing.utils.variance_reduction import (
+    antithetic_normals, importance_shift, likelihood_ratio, moment_match, pair_average,
+)
+
 
 class MonteCarloPricer:
     """
     Monte Carlo pricer for European options under GBM.
+
+    ``seed`` may be None, an int, a numpy SeedSequence or a Generator.
     """
 
     @staticmethod
@@ -11,14 +23,7 @@ class MonteCarloPricer:
         """
         Simulate terminal stock prices under GBM.
         """
-        if seed is not None:
-            np.random.seed(seed)
-
-        Z = np.random.standard_normal(n_paths)
-        drift = (r - 0.5 * sigma ** 2) * T
-        diffusion = sigma * np.sqrt(T) * Z
-
-        return S0 * np.exp(drift + diffusion)
+        return GBMPaths.terminal(S0, r, sigma, T, n_paths, seed)
 
     @staticmethod
     def european_call(S0, K, r, sigma, T, n_paths, seed=None):
@@ -37,15 +42,9 @@ class MonteCarloPricer:
         """
         Monte Carlo European call pricing using Black-Scholes as control variate.
         """
-        if seed is not None:
-            np.random.seed(seed)
-
-        Z = np.random.standard_normal(n_paths)
+        Z = make_rng(seed).standard_normal(n_paths)
 
-        ST = S0 * np.exp(
-            (r - 0.5 * sigma ** 2) * T
-            + sigma * np.sqrt(T) * Z
-        )
+        ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
 
         payoff = np.exp(-r * T) * np.maximum(ST - K, 0.0)
 
@@ -55,7 +54,140 @@ class MonteCarloPricer:
         # Known expectation of control
         control_expectation = S0
 
-        cov = np.cov(payoff, control, ddof=1)
-        beta = cov[0, 1] / cov[1, 1]
+        stats = ControlVariateStats.from_samples(payoff, control)
+        return stats.to_stats(control_expectation).mean
+
+    @staticmethod
+    def european_model(
+        model, S0, K, r, T, n_paths,
+        n_steps=50,
+        is_call=True,
+        seed=None,
+        confidence=0.95
+    ):
+        """
+        European option under any ``models.stochastic`` path model
+        (local volatility, Heston, jump diffusion, GBM).
+
+        Only the current date is held in memory while stepping to T.
+        """
+        ST = model.terminal(S0, r, T, n_paths, n_steps, seed)
+        payoff = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+        return RunningStats.from_samples(np.exp(-r * T) * payoff).to_result(confidence)
+
+    @staticmethod
+    def european(
+        S0, K, r, sigma, T, n_paths,
+        is_call=True,
+        seed=None,
+        antithetic=False,
+        moment_matching=False,
+        control_variate=False,
+        importance_sampling=False,
+        chunk_size=100_000,
+        confidence=0.95
+    ):
+        """
+        European option with composable variance reduction.
+
+        Paths are simulated in chunks of ``chunk_size`` and the estimator
+        is accumulated across chunks, so memory stays bounded and the
+        control-variate coefficients are fitted over all paths without
+        storing them.
+
+        Parameters
+        ----------
+        antithetic : bool
+            Pair each draw with its negative; standard errors are taken
+            over pair averages (``n_paths`` and ``chunk_size`` must be even)
+        moment_matching : bool
+            Rescale each chunk's draws to exact zero mean and unit variance
+        control_variate : bool
+            Use the discounted terminal price and its square, whose
+            expectations are known in closed form, as control variates
+            with optimal coefficients
+        importance_sampling : bool
+            Shift the draws so the terminal price is centred on the
+            strike; pays off for deep out-of-the-money options
+
+        Returns
+        -------
+        MonteCarloResult
+        """
+        rng = make_rng(seed)
+        discount = np.exp(-r * T)
+        theta = importance_shift(S0, K, r, sigma, T) if importance_sampling else 0.0
+        stats = ControlVariateStats() if control_variate else RunningStats()
+
+        for start in range(0, n_paths, chunk_size):
+            size = min(chunk_size, n_paths - start)
+            Z = antithetic_normals(rng, size) if antithetic else rng.standard_normal(size)
+            if moment_matching:
+                Z = moment_match(Z)
+
+            weight = discount
+            if importance_sampling:
+                Z = Z + theta
+                weight = discount * likelihood_ratio(Z, theta)
 
-        return np.mean(payoff + beta * (control_expectation - control))
\ No newline at end of file
+            ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
+            payoff = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+            Y = weight * payoff
+
+            if control_variate:
+                X = np.column_stack([weight * ST, weight * ST ** 2])
+                if antithetic:
+                    Y, X = pair_average(Y), pair_average(X, axis=0)
+                stats.update(Y, X)
+            else:
+                stats.update(pair_average(Y) if antithetic else Y)
+
+        if control_variate:
+            control_means = [S0, S0 ** 2 * np.exp((r + sigma ** 2) * T)]
+            stats = stats.to_stats(control_means)
+
+        return stats.to_result(confidence)._replace(n_paths=n_paths)
+
+    @staticmethod
+    def _european_rqmc(S0, K, r, sigma, T, n_paths, n_replicates, seed, is_call):
+        discount = np.exp(-r * T)
+        estimates = []
+
+        for rng in spawn_rngs(seed, n_replicates):
+            Z = sobol_normals(n_paths, 1, rng)[:, 0]
+            ST = GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
+            payoff = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+            estimates.append(discount * np.mean(payoff))
+
+        stats = RunningStats.from_samples(estimates)
+        return MonteCarloResult(
+            stats.mean, stats.std_error, stats.confidence_interval(), n_paths * n_replicates
+        )
+
+    @staticmethod
+    def european_call_rqmc(S0, K, r, sigma, T, n_paths, n_replicates=16, seed=None):
+        """
+        European call via randomized quasi-Monte Carlo.
+
+        Each of ``n_replicates`` independently scrambled Sobol sets of
+        ``n_paths`` points gives one estimate; their mean is the price and
+        their spread the standard error.
+
+        Returns
+        -------
+        MonteCarloResult
+            (price, std_error, conf_interval, n_paths) with n_paths the
+            total over all replicates
+        """
+        return MonteCarloPricer._european_rqmc(
+            S0, K, r, sigma, T, n_paths, n_replicates, seed, is_call=True
+        )
+
+    @staticmethod
+    def european_put_rqmc(S0, K, r, sigma, T, n_paths, n_replicates=16, seed=None):
+        """
+        European put via randomized quasi-Monte Carlo.
+        """
+        return MonteCarloPricer._european_rqmc(
+            S0, K, r, sigma, T, n_paths, n_replicates, seed, is_call=False
+        )
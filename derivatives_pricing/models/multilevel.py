@@ -0,0 +1,209 @@
+"""
+Multilevel Monte Carlo (Giles) on coupled GBM time grids.
+
+Level l simulates ``base_steps * M**l`` steps. Its estimator is the mean
+of P_l - P_{l-1}, with the coarse path driven by the summed Brownian
+increments of the fine one. The two payoffs are then strongly
+correlated, so the variance of the correction shrinks with l. Most paths
+go to the cheap coarse levels and only a few to the fine ones, which
+brings the cost of an RMSE eps down from O(eps^-3) to O(eps^-2) when
+the correction variance decays faster than the cost grows.
+
+Limitations: early exercise is not supported. An LSM exercise policy
+is fitted by regression per level, and coupling two regressions across
+levels needs its own treatment.
+"""
+
+from collections import namedtuple
+from functools import partial
+
+import numpy as np
+
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.random import make_rng
+from derivatives_pricing.utils.statistics import RunningStats
+
+
+MLMCResult = namedtuple(
+    "MLMCResult",
+    ["price", "std_error", "n_paths", "level_means", "level_variances", "cost"],
+)
+
+
+def _coupled_gbm_paths(rng, n, level, S0, r, sigma, T, M, base_steps, scheme):
+    """
+    Fine paths on base_steps * M**level steps and, for level > 0, coarse
+    paths on the grid M times coarser driven by the same increments.
+    """
+    n_fine = base_steps * M ** level
+    Z = rng.standard_normal((n, n_fine))
+
+    def build(Z_level):
+        if scheme == "exact":
+            return GBMPaths.from_normals(S0, r, sigma, T, Z_level)
+        if scheme == "euler":
+            dt = T / Z_level.shape[1]
+            growth = 1.0 + r * dt + sigma * np.sqrt(dt) * Z_level
+            paths = np.empty((n, Z_level.shape[1] + 1))
+            paths[:, 0] = S0
+            np.cumprod(growth, axis=1, out=paths[:, 1:])
+            paths[:, 1:] *= S0
+            return paths
+        raise ValueError(f"Unknown scheme: {scheme!r}")
+
+    fine = build(Z)
+    if level == 0:
+        return fine, None
+
+    # Summed fine increments, rescaled back to standard normals
+    Z_coarse = Z.reshape(n, n_fine // M, M).sum(axis=2) / np.sqrt(M)
+    return fine, build(Z_coarse)
+
+
+def _gbm_level_samples(rng, n, level, payoff, S0, r, sigma, T, M, base_steps, scheme):
+    fine, coarse = _coupled_gbm_paths(rng, n, level, S0, r, sigma, T, M, base_steps, scheme)
+    samples = payoff(fine)
+    if coarse is not None:
+        samples = samples - payoff(coarse)
+    return np.exp(-r * T) * samples
+
+
+def _trapezoid_mean(values):
+    return (0.5 * (values[:, 0] + values[:, -1]) + values[:, 1:-1].sum(axis=1)) / (
+        values.shape[1] - 1
+    )
+
+
+class MultilevelMonteCarlo:
+    """
+    Multilevel Monte Carlo estimator with optimal path allocation.
+
+    ``seed`` may be None, an int, a numpy SeedSequence or a Generator.
+    """
+
+    @staticmethod
+    def estimate(
+        level_sampler, target_rmse,
+        M=2,
+        min_levels=3,
+        max_levels=10,
+        n_initial=10_000,
+        seed=None
+    ):
+        """
+        Giles' adaptive MLMC algorithm.
+
+        Starting from ``min_levels`` levels with ``n_initial`` paths each,
+        the number of paths per level is set to the variance-optimal
+        N_l ~ sqrt(V_l / C_l) so that the sampling variance is
+        target_rmse^2 / 2. Levels are added while the extrapolated bias
+        of the finest level is above target_rmse / sqrt(2).
+
+        Parameters
+        ----------
+        level_sampler : callable
+            ``level_sampler(rng, n, level)`` returning n samples of
+            P_0 (level 0) or P_level - P_{level-1}
+        target_rmse : float
+            Target root mean squared error
+        M : int
+            Refinement factor between levels; level l costs M**l
+
+        Returns
+        -------
+        MLMCResult
+            price, sampling std_error, paths per level, the per-level
+            means and variances, and the total cost in fine-step units
+        """
+        rng = make_rng(seed)
+        theta = 0.5
+
+        stats = [RunningStats() for _ in range(min_levels)]
+        extra = np.full(min_levels, n_initial)
+
+        while extra.sum() > 0:
+            for level, n in enumerate(extra):
+                if n > 0:
+                    stats[level].update(level_sampler(rng, int(n), level))
+
+            n_paths = np.array([s.count for s in stats])
+            means = np.abs([s.mean for s in stats])
+            variances = np.array([s.variance for s in stats])
+            costs = float(M) ** np.arange(len(stats))
+
+            # Decay rates of |E[P_l - P_l-1]| and V_l, fitted on levels >= 1
+            levels = np.arange(1, len(stats))
+            alpha = max(0.5, -np.polyfit(levels, np.log2(means[1:] + 1e-300), 1)[0] / np.log2(M))
+            beta = max(0.5, -np.polyfit(levels, np.log2(variances[1:] + 1e-300), 1)[0] / np.log2(M))
+
+            optimal = np.ceil(
+                np.sqrt(variances / costs) * np.sum(np.sqrt(variances * costs))
+                / ((1 - theta) * target_rmse ** 2)
+            )
+            extra = np.maximum(0, optimal - n_paths).astype(int)
+
+            if np.all(extra <= 0.01 * n_paths):
+                # Weak-error estimate from the last three corrections
+                recent = means[-1:-4:-1] / float(M) ** (alpha * np.arange(3))
+                bias = recent.max() / (float(M) ** alpha - 1)
+
+                if bias > np.sqrt(theta) * target_rmse and len(stats) < max_levels:
+                    stats.append(RunningStats())
+                    variances = np.append(variances, variances[-1] / float(M) ** beta)
+                    costs = float(M) ** np.arange(len(stats))
+                    n_paths = np.append(n_paths, 0)
+
+                    optimal = np.ceil(
+                        np.sqrt(variances / costs) * np.sum(np.sqrt(variances * costs))
+                        / ((1 - theta) * target_rmse ** 2)
+                    )
+                    extra = np.maximum(0, optimal - n_paths).astype(int)
+
+        n_paths = np.array([s.count for s in stats])
+        means = np.array([s.mean for s in stats])
+        variances = np.array([s.variance for s in stats])
+
+        return MLMCResult(
+            float(means.sum()),
+            float(np.sqrt(np.sum(variances / n_paths))),
+            n_paths,
+            means,
+            variances,
+            float(np.sum(n_paths * float(M) ** np.arange(len(stats)))),
+        )
+
+    @staticmethod
+    def gbm_level_sampler(payoff, S0, r, sigma, T, M=2, base_steps=1, scheme="exact"):
+        """
+        Coupled GBM level sampler for ``estimate``.
+
+        Parameters
+        ----------
+        payoff : callable
+            Undiscounted payoff of an (n_paths, n_steps + 1) path array
+        scheme : {"exact", "euler"}
+            Exact log-normal steps (the bias is then only in the payoff's
+            monitoring), or Euler–Maruyama steps on S
+        """
+        return partial(
+            _gbm_level_samples,
+            payoff=payoff, S0=S0, r=r, sigma=sigma, T=T,
+            M=M, base_steps=base_steps, scheme=scheme,
+        )
+
+    @staticmethod
+    def european_call_payoff(K):
+        """
+        Payoff on the terminal value of each path.
+        """
+        return lambda paths: np.maximum(paths[:, -1] - K, 0.0)
+
+    @staticmethod
+    def asian_call_payoff(K, geometric=False):
+        """
+        Call on the continuous time average of the path, approximated by
+        the trapezoidal rule on the simulation grid.
+        """
+        if geometric:
+            return lambda paths: np.maximum(np.exp(_trapezoid_mean(np.log(paths))) - K, 0.0)
+        return lambda paths: np.maximum(_trapezoid_mean(paths) - K, 0.0)
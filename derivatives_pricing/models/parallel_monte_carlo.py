@@ -0,0 +1,285 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.random import seed_sequence
+from derivatives_pricing.utils.statistics import RunningStats
+
+
+def _call_samples(rng, n, S0, K, r, sigma, T):
+    ST = GBMPaths.terminal(S0, r, sigma, T, n, rng)
+    return np.exp(-r * T) * np.maximum(ST - K, 0.0)
+
+
+def _put_samples(rng, n, S0, K, r, sigma, T):
+    ST = GBMPaths.terminal(S0, r, sigma, T, n, rng)
+    return np.exp(-r * T) * np.maximum(K - ST, 0.0)
+
+
+def _call_delta_pathwise_samples(rng, n, S0, K, r, sigma, T):
+    ST = GBMPaths.terminal(S0, r, sigma, T, n, rng)
+    return np.exp(-r * T) * (ST > K) * (ST / S0)
+
+
+def _chunk_stats(sampler, task):
+    """
+    Simulate one chunk from its own seed and reduce it to RunningStats.
+    """
+    n, child_seed = task
+    return RunningStats.from_samples(sampler(np.random.default_rng(child_seed), n))
+
+
+class ParallelMonteCarloPricer:
+    """
+    Multi-core Monte Carlo engine with chunked, mergeable reduction.
+
+    Paths are split into chunks, each simulated from its own SeedSequence
+    child and reduced to a RunningStats accumulator; only the accumulators
+    travel back, so memory is bounded by ``chunk_size * n_workers``.
+    Chunks are merged in chunk order, so the result is bit-identical for
+    any number of workers.
+    """
+
+    @staticmethod
+    def run(
+        sampler, n_paths,
+        chunk_size=1_000_000,
+        seed=None,
+        n_workers=None,
+        use_processes=False
+    ):
+        """
+        Estimate E[sampler] over n_paths samples in parallel.
+
+        Parameters
+        ----------
+        sampler : callable
+            ``sampler(rng, n)`` returning n i.i.d. samples; must be
+            picklable (module-level function or partial) for processes
+        n_paths : int
+            Total number of samples
+        chunk_size : int
+            Samples per chunk (the unit of work and of RNG streams)
+        seed : None, int, SeedSequence or Generator
+            Root seed; chunk streams are spawned from it
+        n_workers : int, optional
+            Pool size (defaults to the CPU count)
+        use_processes : bool
+            Use a process pool instead of a thread pool. NumPy releases
+            the GIL in its RNG and ufunc loops, so threads usually scale
+            and avoid pickling overhead.
+
+        Returns
+        -------
+        RunningStats
+            Merged accumulator over all chunks
+        """
+        sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+        tasks = list(zip(sizes, seed_sequence(seed).spawn(len(sizes))))
+
+        n_workers = n_workers or os.cpu_count() or 1
+        worker = partial(_chunk_stats, sampler)
+
+        stats = RunningStats()
+        if n_workers == 1 or len(tasks) == 1:
+            for task in tasks:
+                stats.merge(worker(task))
+            return stats
+
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_cls(max_workers=n_workers) as executor:
+            for chunk in executor.map(worker, tasks):
+                stats.merge(chunk)
+
+        return stats
+
+    @staticmethod
+    def run_adaptive(
+        sampler,
+        abs_tol=None,
+        rel_tol=None,
+        chunk_size=100_000,
+        min_paths=None,
+        max_paths=10_000_000,
+        max_time=None,
+        seed=None,
+        n_workers=None,
+        use_processes=False
+    ):
+        """
+        Estimate E[sampler] until its standard error meets a tolerance.
+
+        Paths are simulated in rounds. After each round the running
+        variance projects how many paths the tolerance needs, and the
+        next round simulates that shortfall (plus 10%, at most doubling
+        the sample) in chunks of ``chunk_size``, each from the next
+        spawned child seed. Round
+        sizes depend only on the merged statistics, so results do not
+        depend on ``n_workers`` unless ``max_time`` cuts a run short.
+
+        Parameters
+        ----------
+        abs_tol, rel_tol : float, optional
+            Stop once std_error <= abs_tol or std_error <= rel_tol * |mean|;
+            at least one is required
+        min_paths : int, optional
+            Size of the first round (defaults to ``chunk_size``; at
+            least 2)
+        max_paths : int
+            Path budget
+        max_time : float, optional
+            Wall-clock budget in seconds, checked between rounds
+
+        Returns
+        -------
+        RunningStats
+            Merged accumulator; ``count`` is the number of paths used
+        """
+        if abs_tol is None and rel_tol is None:
+            raise ValueError("Provide abs_tol and/or rel_tol")
+
+        def target(stats):
+            tolerances = []
+            if abs_tol is not None:
+                tolerances.append(abs_tol)
+            if rel_tol is not None:
+                tolerances.append(rel_tol * abs(stats.mean))
+            return max(tolerances)
+
+        root = seed_sequence(seed)
+        n_workers = n_workers or os.cpu_count() or 1
+        worker = partial(_chunk_stats, sampler)
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        start_time = time.perf_counter()
+
+        stats = RunningStats()
+        # Two paths are the fewest with a sample variance to project from
+        round_size = min(max(min_paths or chunk_size, 2), max_paths)
+
+        with executor_cls(max_workers=n_workers) as executor:
+            while round_size > 0:
+                sizes = [
+                    min(chunk_size, round_size - start)
+                    for start in range(0, round_size, chunk_size)
+                ]
+                tasks = list(zip(sizes, root.spawn(len(sizes))))
+                for chunk in executor.map(worker, tasks):
+                    stats.merge(chunk)
+
+                tolerance = target(stats)
+                if stats.std_error <= tolerance:
+                    break
+                if max_time is not None and time.perf_counter() - start_time >= max_time:
+                    break
+
+                if not math.isfinite(stats.variance):
+                    # No usable variance yet: grow the sample instead
+                    needed = 2 * stats.count
+                elif tolerance > 0:
+                    needed = math.ceil(1.1 * stats.variance / tolerance ** 2)
+                else:
+                    needed = max_paths
+                # At most double the sample per round so the variance
+                # estimate and the time budget are revisited regularly
+                round_size = min(
+                    max(needed - stats.count, chunk_size),
+                    stats.count,
+                    max_paths - stats.count,
+                )
+
+        return stats
+
+    @staticmethod
+    def european_call(
+        S0, K, r, sigma, T, n_paths,
+        seed=None,
+        chunk_size=1_000_000,
+        n_workers=None,
+        use_processes=False,
+        confidence=0.95
+    ):
+        """
+        European call price with standard error and confidence interval.
+
+        Returns
+        -------
+        MonteCarloResult
+            (price, std_error, conf_interval, n_paths)
+        """
+        sampler = partial(_call_samples, S0=S0, K=K, r=r, sigma=sigma, T=T)
+        stats = ParallelMonteCarloPricer.run(
+            sampler, n_paths, chunk_size, seed, n_workers, use_processes
+        )
+        return stats.to_result(confidence)
+
+    @staticmethod
+    def european_put(
+        S0, K, r, sigma, T, n_paths,
+        seed=None,
+        chunk_size=1_000_000,
+        n_workers=None,
+        use_processes=False,
+        confidence=0.95
+    ):
+        """
+        European put price with standard error and confidence interval.
+        """
+        sampler = partial(_put_samples, S0=S0, K=K, r=r, sigma=sigma, T=T)
+        stats = ParallelMonteCarloPricer.run(
+            sampler, n_paths, chunk_size, seed, n_workers, use_processes
+        )
+        return stats.to_result(confidence)
+
+    @staticmethod
+    def delta_pathwise(
+        S0, K, r, sigma, T, n_paths,
+        seed=None,
+        chunk_size=1_000_000,
+        n_workers=None,
+        use_processes=False,
+        confidence=0.95
+    ):
+        """
+        Pathwise delta of a European call with standard error.
+        """
+        sampler = partial(_call_delta_pathwise_samples, S0=S0, K=K, r=r, sigma=sigma, T=T)
+        stats = ParallelMonteCarloPricer.run(
+            sampler, n_paths, chunk_size, seed, n_workers, use_processes
+        )
+        return stats.to_result(confidence)
+
+    @staticmethod
+    def european_adaptive(
+        S0, K, r, sigma, T,
+        is_call=True,
+        abs_tol=None,
+        rel_tol=None,
+        seed=None,
+        chunk_size=100_000,
+        max_paths=10_000_000,
+        max_time=None,
+        n_workers=None,
+        use_processes=False,
+        confidence=0.95
+    ):
+        """
+        European option priced to a target standard error.
+
+        Returns
+        -------
+        MonteCarloResult
+            Achieved std_error and the n_paths actually simulated
+        """
+        samples = _call_samples if is_call else _put_samples
+        sampler = partial(samples, S0=S0, K=K, r=r, sigma=sigma, T=T)
+        stats = ParallelMonteCarloPricer.run_adaptive(
+            sampler, abs_tol, rel_tol, chunk_size,
+            max_paths=max_paths, max_time=max_time, seed=seed,
+            n_workers=n_workers, use_processes=use_processes,
+        )
+        return stats.to_result(confidence)
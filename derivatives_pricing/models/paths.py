@@ -0,0 +1,169 @@
+import numpy as np
+
+from derivatives_pricing.utils.qmc import brownian_bridge, sobol_normals
+from derivatives_pricing.utils.random import make_rng, spawn_rngs
+
+
+class GBMPaths:
+    """
+    Vectorized risk-neutral GBM path generation shared by the Monte Carlo,
+    Monte Carlo Greeks and Longstaff–Schwartz pricers.
+
+    Paths are built from log-price increments with a single cumulative sum
+    and one exponential over the whole array, all in place on the output
+    buffer. Two layouts are supported:
+
+    - path-major: shape (n_paths, n_steps + 1), one row per path
+    - time-major: shape (n_steps + 1, n_paths), one contiguous row per date,
+      which suits backward induction that visits one date at a time
+
+    The layouts consume random numbers in a different order, so the same
+    seed gives different (equally distributed) paths in each.
+    """
+
+    @staticmethod
+    def terminal_from_normals(S0, r, sigma, T, Z):
+        """
+        Terminal GBM prices from standard normal draws Z.
+        """
+        drift = (r - 0.5 * sigma ** 2) * T
+        diffusion = sigma * np.sqrt(T) * Z
+
+        return S0 * np.exp(drift + diffusion)
+
+    @staticmethod
+    def terminal(S0, r, sigma, T, n_paths, seed=None):
+        """
+        Simulate terminal stock prices under GBM.
+        """
+        Z = make_rng(seed).standard_normal(n_paths)
+
+        return GBMPaths.terminal_from_normals(S0, r, sigma, T, Z)
+
+    @staticmethod
+    def _build_in_place(paths, S0, r, sigma, T, time_major):
+        """
+        Turn a buffer holding standard normals after its first date into
+        GBM paths, in place.
+        """
+        axis = 0 if time_major else 1
+        n_steps = paths.shape[axis] - 1
+        dt = T / n_steps
+
+        initial = paths[0] if time_major else paths[:, 0]
+        increments = paths[1:] if time_major else paths[:, 1:]
+
+        # Log-price increments, accumulated once along the time axis
+        initial[...] = np.log(S0)
+        increments *= sigma * np.sqrt(dt)
+        increments += (r - 0.5 * sigma ** 2) * dt
+        np.cumsum(paths, axis=axis, out=paths)
+        np.exp(paths, out=paths)
+        initial[...] = S0
+
+        return paths
+
+    @staticmethod
+    def from_normals(S0, r, sigma, T, Z, time_major=False, dtype=np.float64):
+        """
+        Build full GBM paths (including S0) from standard normal draws.
+
+        Parameters
+        ----------
+        Z : ndarray
+            Normals of shape (n_paths, n_steps), or (n_steps, n_paths)
+            when ``time_major`` is True
+        time_major : bool
+            Layout of both Z and the returned paths
+        dtype : numpy dtype
+            Precision of the returned paths (e.g. np.float32)
+
+        Returns
+        -------
+        ndarray
+            Paths of shape (n_paths, n_steps + 1), or (n_steps + 1, n_paths)
+        """
+        axis = 0 if time_major else 1
+
+        shape = list(Z.shape)
+        shape[axis] += 1
+        paths = np.empty(shape, dtype=dtype)
+
+        if time_major:
+            paths[1:] = Z
+        else:
+            paths[:, 1:] = Z
+
+        return GBMPaths._build_in_place(paths, S0, r, sigma, T, time_major)
+
+    @staticmethod
+    def simulate(
+        S0, r, sigma, T, n_paths, n_steps,
+        seed=None,
+        time_major=False,
+        dtype=np.float64
+    ):
+        """
+        Simulate GBM paths on an equally spaced grid of n_steps dates.
+
+        ``seed`` may be None, an int, a SeedSequence or a Generator.
+        """
+        rng = make_rng(seed)
+
+        if time_major:
+            # Later dates are one contiguous block: draw straight into it
+            paths = np.empty((n_steps + 1, n_paths), dtype=dtype)
+            rng.standard_normal(out=paths[1:], dtype=paths.dtype)
+        else:
+            paths = np.empty((n_paths, n_steps + 1), dtype=dtype)
+            paths[:, 1:] = rng.standard_normal((n_paths, n_steps), dtype=paths.dtype)
+
+        return GBMPaths._build_in_place(paths, S0, r, sigma, T, time_major)
+
+    @staticmethod
+    def simulate_chunks(
+        S0, r, sigma, T, n_paths, n_steps,
+        chunk_size=100_000,
+        seed=None,
+        time_major=False,
+        dtype=np.float64
+    ):
+        """
+        Generate GBM paths in chunks of at most ``chunk_size`` paths.
+
+        Yields arrays with the same layout as ``simulate``; peak memory is
+        bounded by the chunk size rather than n_paths. Each chunk draws
+        from its own stream spawned from ``seed``.
+        """
+        starts = range(0, n_paths, chunk_size)
+
+        for start, rng in zip(starts, spawn_rngs(seed, len(starts))):
+            size = min(chunk_size, n_paths - start)
+            yield GBMPaths.simulate(
+                S0, r, sigma, T, size, n_steps,
+                seed=rng, time_major=time_major, dtype=dtype,
+            )
+
+    @staticmethod
+    def simulate_sobol(
+        S0, r, sigma, T, n_paths, n_steps,
+        seed=None,
+        time_major=False,
+        dtype=np.float64
+    ):
+        """
+        GBM paths from scrambled Sobol points with Brownian bridge
+        construction (one randomized QMC replicate per seed).
+
+        Use a power of two for n_paths to keep Sobol balance properties.
+        """
+        Z = sobol_normals(n_paths, n_steps, seed)
+        W = brownian_bridge(Z, T)
+
+        times = np.arange(1, n_steps + 1)[:, None] * (T / n_steps)
+
+        paths = np.empty((n_steps + 1, n_paths), dtype=dtype)
+        paths[0] = S0
+        paths[1:] = S0 * np.exp((r - 0.5 * sigma ** 2) * times + sigma * W)
+
+        return paths if time_major else paths.T.copy()
@@ -0,0 +1,131 @@
+import numpy as np
+
+
+class RegressionBasis:
+    """
+    Continuation-value regression for Longstaff–Schwartz.
+
+    Basis columns are written into a caller-provided buffer (reused across
+    time steps) from a scaled state x = S / K, using three-term
+    recurrences so higher degrees stay well conditioned:
+
+    - "power":     1, x, x^2, ...
+    - "laguerre":  exp(-x / 2) L_n(x), as in Longstaff and Schwartz (2001)
+    - "hermite":   probabilists' He_n of x standardized over the sample
+    - "chebyshev": T_n of x mapped onto [-1, 1] over the sample
+
+    Power, Hermite and Chebyshev span the same polynomial space, so they
+    give the same fitted values in exact arithmetic and differ only in
+    conditioning.
+    """
+
+    KINDS = ("power", "laguerre", "hermite", "chebyshev")
+
+    # Largest Gram-matrix condition number solved by the normal
+    # equations; they square cond(X), so beyond this QR is more accurate
+    GRAM_MAX_CONDITION = 1e8
+
+    @staticmethod
+    def fill(S, K, degree, kind="power", out=None, scaling=None):
+        """
+        Write the design matrix for prices S into ``out``.
+
+        Parameters
+        ----------
+        S : ndarray of shape (n,)
+            Regressor values (e.g. in-the-money prices at one date)
+        K : float
+            Strike, used to scale the state to x = S / K
+        degree : int
+            Highest polynomial degree (degree + 1 columns)
+        kind : str
+            One of RegressionBasis.KINDS
+        out : ndarray, optional
+            Buffer with at least n rows and degree + 1 columns
+        scaling : tuple, optional
+            (shift, scale) for the Hermite/Chebyshev affine map; estimated
+            from S when omitted. Pass the training values to evaluate
+            out-of-sample rows on the same basis.
+
+        Returns
+        -------
+        X : ndarray of shape (n, degree + 1)
+            View into ``out``
+        scaling : tuple
+            The affine map that was used
+        """
+        n = len(S)
+        if out is None:
+            out = np.empty((n, degree + 1))
+        X = out[:n, :degree + 1]
+
+        z = np.divide(S, K)
+
+        if scaling is None:
+            if kind == "hermite":
+                scaling = (z.mean(), z.std() or 1.0)
+            elif kind == "chebyshev":
+                low, high = z.min(), z.max()
+                scaling = (0.5 * (high + low), 0.5 * (high - low) or 1.0)
+            elif kind in ("power", "laguerre"):
+                scaling = (0.0, 1.0)
+            else:
+                raise ValueError(f"Unknown basis: {kind!r}")
+
+        z -= scaling[0]
+        z /= scaling[1]
+
+        X[:, 0] = 1.0
+        if degree >= 1:
+            X[:, 1] = 1.0 - z if kind == "laguerre" else z
+
+        for k in range(1, degree):
+            if kind == "power":
+                np.multiply(X[:, k], z, out=X[:, k + 1])
+            elif kind == "laguerre":
+                # (k + 1) L_{k+1} = (2k + 1 - z) L_k - k L_{k-1}
+                X[:, k + 1] = ((2 * k + 1 - z) * X[:, k] - k * X[:, k - 1]) / (k + 1)
+            elif kind == "hermite":
+                # He_{k+1} = z He_k - k He_{k-1}
+                X[:, k + 1] = z * X[:, k] - k * X[:, k - 1]
+            elif kind == "chebyshev":
+                # T_{k+1} = 2 z T_k - T_{k-1}
+                X[:, k + 1] = 2 * z * X[:, k] - X[:, k - 1]
+            else:
+                raise ValueError(f"Unknown basis: {kind!r}")
+
+        if kind == "laguerre":
+            X *= np.exp(-0.5 * z)[:, None]
+
+        return X, scaling
+
+    @staticmethod
+    def solve(X, y, method="gram"):
+        """
+        Least-squares coefficients for X @ beta ~ y.
+
+        Parameters
+        ----------
+        method : {"gram", "qr", "lstsq"}
+            "gram" solves the small (p x p) normal equations, "qr" uses a
+            reduced QR factorization and "lstsq" the SVD-based solver.
+            "gram" falls back to "qr" when the Gram matrix is worse
+            conditioned than ``GRAM_MAX_CONDITION`` (typically high
+            power or Laguerre degrees) and to "lstsq" when it is
+            singular.
+        """
+        if method == "gram":
+            G = X.T @ X
+            condition = np.linalg.cond(G)
+            if condition <= RegressionBasis.GRAM_MAX_CONDITION:
+                return np.linalg.solve(G, X.T @ y)
+            method = "qr" if np.isfinite(condition) else "lstsq"
+
+        if method == "qr":
+            Q, R = np.linalg.qr(X)
+            return np.linalg.solve(R, Q.T @ y)
+
+        if method == "lstsq":
+            return np.linalg.lstsq(X, y, rcond=None)[0]
+
+        raise ValueError(f"Unknown regression method: {method!r}")
@@ -0,0 +1,305 @@
+"""
+Pluggable risk-neutral path models for the Monte Carlo and LSM engines.
+
+Every model exposes the same interface:
+
+- ``simulate(S0, r, T, n_paths, n_steps, seed=None, time_major=False,
+  dtype=np.float64)`` returns paths in the layouts of
+  ``GBMPaths.simulate``
+- ``terminal(S0, r, T, n_paths, n_steps, seed=None)`` returns S_T only,
+  holding a single date in memory
+
+Both are built on ``_evolve``, a generator that advances the whole path
+set one date at a time with vectorized updates. A model only needs to
+supply that step. ``dtype`` sets the storage precision of the path
+array; the state is always advanced in float64.
+
+Models with a closed-form characteristic function also provide
+``characteristic_function(u, r, T)``, the characteristic function of
+log(S_T / S0) under the risk-neutral measure; ``models.fourier`` prices
+whole strike grids from it.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.random import make_rng
+
+
+class PathModel(ABC):
+    """
+    Base class: subclasses implement ``_evolve``.
+    """
+
+    @abstractmethod
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        """
+        Yield S_t (float64, shape (n_paths,)) for t = 1..n_steps.
+        """
+
+    def simulate(self, S0, r, T, n_paths, n_steps, seed=None, time_major=False, dtype=np.float64):
+        paths = np.empty((n_steps + 1, n_paths), dtype=dtype)
+        paths[0] = S0
+        for t, S_t in enumerate(self._evolve(S0, r, T, n_paths, n_steps, make_rng(seed)), 1):
+            paths[t] = S_t
+
+        return paths if time_major else paths.T.copy()
+
+    def terminal(self, S0, r, T, n_paths, n_steps, seed=None):
+        S_t = None
+        for S_t in self._evolve(S0, r, T, n_paths, n_steps, make_rng(seed)):
+            pass
+        return S_t
+
+
+class GBMModel(PathModel):
+    """
+    Constant-volatility GBM, delegating to ``GBMPaths``.
+    """
+
+    def __init__(self, sigma):
+        self.sigma = sigma
+
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        dt = T / n_steps
+        drift = (r - 0.5 * self.sigma ** 2) * dt
+        log_S = np.full(n_paths, np.log(S0))
+        for _ in range(n_steps):
+            log_S += drift + self.sigma * np.sqrt(dt) * rng.standard_normal(n_paths)
+            yield np.exp(log_S)
+
+    def characteristic_function(self, u, r, T):
+        return np.exp(1j * u * (r - 0.5 * self.sigma ** 2) * T - 0.5 * self.sigma ** 2 * u ** 2 * T)
+
+    def simulate(self, S0, r, T, n_paths, n_steps, seed=None, time_major=False, dtype=np.float64):
+        return GBMPaths.simulate(
+            S0, r, self.sigma, T, n_paths, n_steps,
+            seed=seed, time_major=time_major, dtype=dtype,
+        )
+
+
+class LocalVolModel(PathModel):
+    """
+    Local volatility sigma(S, t), simulated with log-Euler steps.
+
+    Parameters
+    ----------
+    local_vol : callable
+        ``local_vol(S, t)`` returning the local volatility for an array
+        of spots at time t
+    """
+
+    def __init__(self, local_vol):
+        self.local_vol = local_vol
+
+    @classmethod
+    def from_surface(cls, surface, k_points=401, k_range=(-1.5, 1.5), h_T=1e-3):
+        """
+        Dupire local volatility implied by a ``VolSurface``.
+
+        With total variance w(k, T) in log-forward-moneyness,
+
+            sigma_loc^2 = dw/dT / (1 - k w_k / w
+                                   + (-1/4 - 1/w + k^2 / w^2) w_k^2 / 4
+                                   + w_kk / 2)
+
+        Derivatives are taken by finite differences of the exact SVI
+        surface on a k grid at each simulation date; paths then
+        interpolate that grid, which keeps every step vectorized.
+        """
+        k = np.linspace(k_range[0], k_range[1], k_points)
+        h_k = k[1] - k[0]
+
+        def local_vol(S, t):
+            t = max(t, 2 * h_T)
+            w = surface.total_variance(k, t, exact=True)
+            w_T = (
+                surface.total_variance(k, t + h_T, exact=True)
+                - surface.total_variance(k, t - h_T, exact=True)
+            ) / (2 * h_T)
+            w_k = np.gradient(w, h_k)
+            w_kk = np.gradient(w_k, h_k)
+
+            denominator = (
+                1 - k * w_k / w
+                + 0.25 * (-0.25 - 1 / w + k ** 2 / w ** 2) * w_k ** 2
+                + 0.5 * w_kk
+            )
+            sigma_grid = np.sqrt(np.clip(w_T / denominator, 1e-8, 25.0))
+
+            log_moneyness = np.log(S / (surface.S * np.exp(surface.r * t)))
+            return np.interp(log_moneyness, k, sigma_grid)
+
+        return cls(local_vol)
+
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        dt = T / n_steps
+        log_S = np.full(n_paths, np.log(S0))
+        S = np.full(n_paths, float(S0))
+        for step in range(n_steps):
+            sigma = self.local_vol(S, step * dt)
+            log_S += (r - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * rng.standard_normal(n_paths)
+            S = np.exp(log_S)
+            yield S
+
+
+class HestonModel(PathModel):
+    """
+    Heston stochastic volatility with Andersen's quadratic-exponential
+    (QE) variance scheme.
+
+    dS = r S dt + sqrt(v) S dW_1,  dv = kappa (theta - v) dt + xi sqrt(v) dW_2,
+    d<W_1, W_2> = rho dt.
+
+    The variance is drawn from a moment-matched quadratic normal or, for
+    large psi = s^2 / m^2, an exponential mixture with an atom at zero,
+    so it stays non-negative without truncation. log S uses the central
+    (gamma1 = gamma2 = 1/2) discretization of the integrated variance.
+    """
+
+    PSI_CRITICAL = 1.5
+
+    def __init__(self, v0, kappa, theta, xi, rho):
+        self.v0 = v0
+        self.kappa = kappa
+        self.theta = theta
+        self.xi = xi
+        self.rho = rho
+
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        dt = T / n_steps
+        decay = np.exp(-kappa * dt)
+
+        K0 = -rho * kappa * theta / xi * dt
+        K1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+        K2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+        K3 = 0.5 * dt * (1 - rho ** 2)
+
+        log_S = np.full(n_paths, np.log(S0))
+        v = np.full(n_paths, float(self.v0))
+
+        for _ in range(n_steps):
+            m = theta + (v - theta) * decay
+            s2 = (
+                v * xi ** 2 * decay / kappa * (1 - decay)
+                + theta * xi ** 2 / (2 * kappa) * (1 - decay) ** 2
+            )
+            psi = s2 / (m * m)
+            v_next = np.empty(n_paths)
+
+            # Quadratic branch: v' = a (b + Z)^2
+            quadratic = psi <= self.PSI_CRITICAL
+            inv_psi = 2 / psi[quadratic]
+            b2 = inv_psi - 1 + np.sqrt(inv_psi * (inv_psi - 1))
+            Z_v = rng.standard_normal(b2.size)
+            v_next[quadratic] = m[quadratic] / (1 + b2) * (np.sqrt(b2) + Z_v) ** 2
+
+            # Exponential branch: atom at zero with probability p
+            exponential = ~quadratic
+            if exponential.any():
+                psi_e = psi[exponential]
+                p = (psi_e - 1) / (psi_e + 1)
+                beta = (1 - p) / m[exponential]
+                U = rng.random(psi_e.size)
+                v_next[exponential] = np.where(
+                    U <= p, 0.0, np.log((1 - p) / np.maximum(1 - U, 1e-300)) / beta
+                )
+
+            log_S += (
+                r * dt + K0 + K1 * v + K2 * v_next
+                + np.sqrt(K3 * (v + v_next)) * rng.standard_normal(n_paths)
+            )
+            v = v_next
+            yield np.exp(log_S)
+
+    def characteristic_function(self, u, r, T):
+        """
+        Heston characteristic function in the "little trap" form of
+        Albrecher et al., which avoids the branch-cut discontinuity of
+        the complex logarithm for long maturities.
+        """
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+        beta = kappa - 1j * rho * xi * u
+        d = np.sqrt(beta ** 2 + xi ** 2 * (1j * u + u ** 2))
+        g = (beta - d) / (beta + d)
+        decay = np.exp(-d * T)
+
+        C = kappa * theta / xi ** 2 * (
+            (beta - d) * T - 2 * np.log((1 - g * decay) / (1 - g))
+        )
+        D = (beta - d) / xi ** 2 * (1 - decay) / (1 - g * decay)
+
+        return np.exp(1j * u * r * T + C + D * self.v0)
+
+
+class JumpDiffusionModel(PathModel):
+    """
+    Merton jump diffusion: GBM with compound Poisson log-normal jumps.
+
+    Jumps arrive at rate ``lam`` with log sizes N(mu_j, sigma_j^2); the
+    drift is compensated so the discounted price is a martingale. Each
+    step is sampled exactly.
+    """
+
+    def __init__(self, sigma, lam, mu_j, sigma_j):
+        self.sigma = sigma
+        self.lam = lam
+        self.mu_j = mu_j
+        self.sigma_j = sigma_j
+
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        dt = T / n_steps
+        compensator = self.lam * (np.exp(self.mu_j + 0.5 * self.sigma_j ** 2) - 1)
+        drift = (r - compensator - 0.5 * self.sigma ** 2) * dt
+
+        log_S = np.full(n_paths, np.log(S0))
+        for _ in range(n_steps):
+            n_jumps = rng.poisson(self.lam * dt, n_paths)
+            jumps = self.mu_j * n_jumps + self.sigma_j * np.sqrt(n_jumps) * rng.standard_normal(n_paths)
+            log_S += drift + self.sigma * np.sqrt(dt) * rng.standard_normal(n_paths) + jumps
+            yield np.exp(log_S)
+
+    def characteristic_function(self, u, r, T):
+        compensator = self.lam * (np.exp(self.mu_j + 0.5 * self.sigma_j ** 2) - 1)
+        jump = np.exp(1j * u * self.mu_j - 0.5 * self.sigma_j ** 2 * u ** 2) - 1
+        return np.exp(
+            1j * u * (r - compensator - 0.5 * self.sigma ** 2) * T
+            - 0.5 * self.sigma ** 2 * u ** 2 * T
+            + self.lam * T * jump
+        )
+
+
+class VarianceGammaModel(PathModel):
+    """
+    Variance Gamma: Brownian motion with drift ``theta`` and volatility
+    ``sigma`` run on a gamma clock with variance rate ``nu``.
+
+    The drift correction omega = log(1 - theta nu - sigma^2 nu / 2) / nu
+    makes the discounted price a martingale. Steps are sampled exactly.
+    """
+
+    def __init__(self, sigma, nu, theta):
+        self.sigma = sigma
+        self.nu = nu
+        self.theta = theta
+
+    def _omega(self):
+        return np.log(1 - self.theta * self.nu - 0.5 * self.sigma ** 2 * self.nu) / self.nu
+
+    def _evolve(self, S0, r, T, n_paths, n_steps, rng):
+        dt = T / n_steps
+        drift = (r + self._omega()) * dt
+
+        log_S = np.full(n_paths, np.log(S0))
+        for _ in range(n_steps):
+            G = rng.gamma(dt / self.nu, self.nu, n_paths)
+            log_S += drift + self.theta * G + self.sigma * np.sqrt(G) * rng.standard_normal(n_paths)
+            yield np.exp(log_S)
+
+    def characteristic_function(self, u, r, T):
+        return np.exp(1j * u * (r + self._omega()) * T) * (
+            1 - 1j * u * self.theta * self.nu + 0.5 * self.sigma ** 2 * self.nu * u ** 2
+        ) ** (-T / self.nu)
@@ -0,0 +1,228 @@
+"""
+Implied volatility surface from raw SVI slices.
+
+Each expiry T_i carries a raw SVI smile in total implied variance
+w = sigma^2 T as a function of log-moneyness k = log(K / F), with
+F = S exp(r T):
+
+    w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + s^2))
+
+Between expiries the surface is linear in total variance at fixed k.
+Below the first expiry, variance scales with T; beyond the last, w is
+held flat in volatility. If the slices are free of calendar
+arbitrage, this interpolation adds none.
+"""
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from derivatives_pricing.models.implied_volatility import ImpliedVolatility
+
+
+class VolSurface:
+    """
+    SVI volatility surface with a cached lookup grid.
+
+    Lookups interpolate a precomputed (expiry x log-moneyness) grid of
+    total variance: linear in k on a uniform grid, linear in T between
+    slices, so millions of (K, T) queries cost a few array operations.
+    Refitting one expiry recomputes that slice's parameters and its grid
+    row only.
+
+    Parameters
+    ----------
+    S, r : float
+        Spot and rate used to convert strikes to log-moneyness
+    k_range : (float, float)
+        Log-moneyness span of the cached grid; lookups outside it are
+        evaluated from the SVI formula directly
+    n_grid : int
+        Grid points per slice
+    """
+
+    def __init__(self, S, r, k_range=(-1.5, 1.5), n_grid=1024):
+        self.S = S
+        self.r = r
+        self.k_grid = np.linspace(k_range[0], k_range[1], n_grid)
+        self.expiries = np.empty(0)
+        self.params = np.empty((0, 5))
+        self.grid = np.empty((0, n_grid))
+
+    @staticmethod
+    def svi_total_variance(k, params):
+        """
+        Raw SVI total variance; ``params`` = (a, b, rho, m, s) broadcast
+        against ``k`` along the last axis.
+        """
+        a, b, rho, m, s = np.moveaxis(np.asarray(params), -1, 0)
+        x = k - m
+        return a + b * (rho * x + np.sqrt(x * x + s * s))
+
+    @staticmethod
+    def fit_svi(k, w, weights=None):
+        """
+        Least-squares raw SVI fit of total variances ``w`` at ``k``.
+
+        Returns
+        -------
+        ndarray
+            (a, b, rho, m, s)
+        """
+        k = np.asarray(k, dtype=float)
+        w = np.asarray(w, dtype=float)
+        weights = np.ones_like(w) if weights is None else np.asarray(weights, dtype=float)
+
+        s0 = 0.1
+        b0 = max((w.max() - w.min()) / max(np.ptp(k), 1e-8), 1e-3)
+        x0 = [w.min() - b0 * s0, b0, 0.0, k[np.argmin(w)], s0]
+        bounds = (
+            [-w.max(), 0.0, -0.999, 2 * k.min() - 1, 1e-4],
+            [w.max(), 10.0, 0.999, 2 * k.max() + 1, 5.0],
+        )
+        x0 = np.clip(x0, bounds[0], bounds[1])
+
+        fit = least_squares(
+            lambda p: weights * (VolSurface.svi_total_variance(k, p) - w),
+            x0, bounds=bounds, method="trf",
+        )
+        return fit.x
+
+    def fit_slice(self, T, K, iv, weights=None):
+        """
+        Fit (or refit) the SVI slice at expiry ``T`` from implied vols.
+
+        Only this slice's parameters and grid row are recomputed.
+        """
+        k = np.log(np.asarray(K, dtype=float) / self._forward(T))
+        w = np.asarray(iv, dtype=float) ** 2 * T
+        params = VolSurface.fit_svi(k, w, weights)
+        row = VolSurface.svi_total_variance(self.k_grid, params)
+
+        i = np.searchsorted(self.expiries, T)
+        if i < len(self.expiries) and np.isclose(self.expiries[i], T):
+            self.params[i] = params
+            self.grid[i] = row
+        else:
+            self.expiries = np.insert(self.expiries, i, T)
+            self.params = np.insert(self.params, i, params, axis=0)
+            self.grid = np.insert(self.grid, i, row, axis=0)
+
+        return params
+
+    @classmethod
+    def from_quotes(cls, S, r, K, T, iv, **kwargs):
+        """
+        Surface with one SVI slice per distinct expiry in ``T``.
+        """
+        surface = cls(S, r, **kwargs)
+        K, T, iv = (np.asarray(x, dtype=float) for x in (K, T, iv))
+        for expiry in np.unique(T):
+            mask = T == expiry
+            surface.fit_slice(expiry, K[mask], iv[mask])
+        return surface
+
+    @classmethod
+    def from_prices(cls, S, r, K, T, price, is_call=True, **kwargs):
+        """
+        Surface from option prices, inverted with ``ImpliedVolatility``;
+        quotes that fail to converge are dropped.
+        """
+        K, T, price = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (K, T, price))
+        )
+        iv, status = ImpliedVolatility.solve(price, S, K, r, T, is_call=is_call)
+        ok = status == ImpliedVolatility.CONVERGED
+        return cls.from_quotes(S, r, K[ok], T[ok], iv[ok], **kwargs)
+
+    def _forward(self, T):
+        return self.S * np.exp(self.r * np.asarray(T, dtype=float))
+
+    def total_variance(self, k, T, exact=False):
+        """
+        Total implied variance at log-moneyness ``k`` and expiry ``T``.
+
+        Parameters
+        ----------
+        exact : bool
+            Evaluate the SVI formula instead of the cached grid
+        """
+        k, T = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(T, dtype=float))
+        shape = k.shape
+        k, T = k.ravel(), T.ravel()
+        n = len(self.expiries)
+        if n == 0:
+            raise ValueError("Surface has no fitted slices")
+
+        # Bracketing slices and the weight of the upper one
+        upper = np.clip(np.searchsorted(self.expiries, T), 1, max(n - 1, 1))
+        lower = upper - 1 if n > 1 else np.zeros_like(upper)
+        upper = upper if n > 1 else np.zeros_like(upper)
+        T_lo, T_hi = self.expiries[lower], self.expiries[upper]
+        span = np.where(T_hi > T_lo, T_hi - T_lo, 1.0)
+        weight = np.clip((T - T_lo) / span, 0.0, 1.0)
+
+        w_lo = self._slice_variance(k, lower, exact)
+        w_hi = self._slice_variance(k, upper, exact)
+        w = (1 - weight) * w_lo + weight * w_hi
+
+        # Short end: variance proportional to T; long end: flat volatility
+        first, last = self.expiries[0], self.expiries[-1]
+        w = np.where(T < first, w_lo * T / first, w)
+        return np.where(T > last, w_hi * T / last, w).reshape(shape)
+
+    def _slice_variance(self, k, index, exact):
+        if exact:
+            return VolSurface.svi_total_variance(k, self.params[index])
+
+        k_min, k_max = self.k_grid[0], self.k_grid[-1]
+        step = self.k_grid[1] - self.k_grid[0]
+        position = (np.clip(k, k_min, k_max) - k_min) / step
+        left = np.minimum(position.astype(np.intp), len(self.k_grid) - 2)
+        frac = position - left
+
+        w = (1 - frac) * self.grid[index, left] + frac * self.grid[index, left + 1]
+
+        outside = (k < k_min) | (k > k_max)
+        if outside.any():
+            w[outside] = VolSurface.svi_total_variance(k[outside], self.params[index[outside]])
+        return w
+
+    def implied_vol(self, K, T, exact=False):
+        """
+        Implied volatility at strikes ``K`` and expiries ``T``, ready to
+        pass as ``sigma`` to ``BlackScholes`` or ``LongstaffSchwartzPricer``.
+        """
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        k = np.log(K / self._forward(T))
+        return np.sqrt(np.maximum(self.total_variance(k, T, exact), 0.0) / T)
+
+    def arbitrage_report(self, k=None):
+        """
+        Static-arbitrage diagnostics on a log-moneyness grid.
+
+        Returns
+        -------
+        dict
+            ``butterfly``: per slice, the minimum of Gatheral's density
+            function g(k), negative where the slice admits butterfly
+            arbitrage; ``calendar``: per adjacent pair of slices, the
+            minimum increase of total variance, negative where w
+            decreases with T; ``negative_variance``: per slice, whether
+            a + b s sqrt(1 - rho^2) < 0
+        """
+        k = self.k_grid if k is None else np.asarray(k, dtype=float)
+        a, b, rho, m, s = self.params.T[..., np.newaxis]
+
+        x = k - m
+        root = np.sqrt(x * x + s * s)
+        w = a + b * (rho * x + root)
+        dw = b * (rho + x / root)
+        d2w = b * s * s / root ** 3
+        g = (1 - k * dw / (2 * w)) ** 2 - dw ** 2 / 4 * (1 / w + 0.25) + d2w / 2
+        g = np.where(w > 0, g, -np.inf)
+
+        return {
+            "butterfly": g.min(axis=1),
+            "calendar": np.diff(w, axis=0).min(axis=1),
+            "negative_variance": (a + b * s * np.sqrt(1 - rho ** 2))[:, 0] < 0,
+        }
@@ -0,0 +1,149 @@
+"""
+Portfolio-level Greeks aggregated by underlying and expiry bucket.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from derivatives_pricing.greeks.analytical import BlackScholesGreeks
+
+
+RiskLadders = namedtuple(
+    "RiskLadders",
+    ["underlyings", "bucket_edges", "value", "delta", "gamma", "vega", "theta", "rho"],
+)
+
+# Expiry bucket edges in years: 1M, 3M, 6M, 1Y, 2Y, 5Y
+DEFAULT_BUCKETS = (0.0, 1 / 12, 0.25, 0.5, 1.0, 2.0, 5.0, np.inf)
+
+GREEKS = ("value", "delta", "gamma", "vega", "theta", "rho")
+
+
+class PortfolioRisk:
+    """
+    Vectorized risk for a columnar book of European options.
+
+    A book is a mapping or structured ndarray with columns
+    ``underlying``, ``strike``, ``expiry`` (years), ``is_call`` and
+    ``quantity``, plus an optional per-position ``sigma``. Positions
+    are mapped to integer underlying codes once. Market data is then
+    gathered with fancy indexing, Greeks come from one
+    ``BlackScholesGreeks.all_greeks`` call per block, and ladders are
+    summed with ``np.bincount``. No per-row or per-underlying pricing
+    happens in Python.
+    """
+
+    @staticmethod
+    def _market(book, spots, vols):
+        """
+        Underlying names, per-position codes, spots and volatilities.
+
+        ``spots`` and ``vols`` map underlying names to values; ``vols``
+        is only needed when the book has no ``sigma`` column.
+        """
+        names, codes = np.unique(np.asarray(book["underlying"]), return_inverse=True)
+
+        spot = np.array([spots[name] for name in names], dtype=float)[codes]
+        if vols is None:
+            sigma = np.asarray(book["sigma"], dtype=float)
+        else:
+            sigma = np.array([vols[name] for name in names], dtype=float)[codes]
+
+        return names, codes, spot, sigma
+
+    @staticmethod
+    def position_greeks(book, spots, r, vols=None):
+        """
+        Quantity-weighted value and Greeks of every position.
+
+        Returns
+        -------
+        dict of ndarray
+            Keys value, delta, gamma, vega, theta, rho
+        """
+        _, _, spot, sigma = PortfolioRisk._market(book, spots, vols)
+        return PortfolioRisk._block_greeks(
+            spot,
+            np.asarray(book["strike"], dtype=float), r, sigma,
+            np.asarray(book["expiry"], dtype=float),
+            np.asarray(book["is_call"], dtype=bool), np.asarray(book["quantity"], dtype=float),
+        )
+
+    @staticmethod
+    def _block_greeks(S, K, r, sigma, T, is_call, quantity):
+        # Expired positions (T <= 0) are worth their intrinsic value, with
+        # Delta 0 or +/-1 and no other sensitivities
+        expired = T <= 0
+        greeks = BlackScholesGreeks.all_greeks(S, K, r, sigma, np.where(expired, 1.0, T))
+
+        sign = np.where(is_call, 1.0, -1.0)
+        intrinsic = np.maximum(sign * (S - K), 0.0)
+
+        def pick(call_key, put_key, at_expiry=0.0):
+            values = np.where(is_call, greeks[call_key], greeks[put_key])
+            return quantity * np.where(expired, at_expiry, values)
+
+        return {
+            "value": pick("call_price", "put_price", intrinsic),
+            "delta": pick("delta_call", "delta_put", sign * (intrinsic > 0)),
+            "gamma": pick("gamma", "gamma"),
+            "vega": pick("vega", "vega"),
+            "theta": pick("theta_call", "theta_put"),
+            "rho": pick("rho_call", "rho_put"),
+        }
+
+    @staticmethod
+    def ladders(book, spots, r, vols=None, bucket_edges=DEFAULT_BUCKETS, chunk_size=1_000_000):
+        """
+        Value and Greek ladders by underlying and expiry bucket.
+
+        Parameters
+        ----------
+        book : mapping or structured ndarray
+            Position columns (see class docstring)
+        spots : mapping
+            Spot price per underlying name
+        r : float
+            Risk-free rate
+        vols : mapping, optional
+            Volatility per underlying; defaults to the book's ``sigma``
+        bucket_edges : sequence of float
+            Increasing expiry edges; bucket j holds edges[j] <= T < edges[j + 1]
+        chunk_size : int
+            Positions priced per block, bounding temporary memory
+
+        Returns
+        -------
+        RiskLadders
+            Each Greek is an (n_underlyings, n_buckets) array, rows in
+            the order of ``underlyings``
+        """
+        names, codes, spot, sigma = PortfolioRisk._market(book, spots, vols)
+        edges = np.asarray(bucket_edges, dtype=float)
+        n_buckets = len(edges) - 1
+
+        strike = np.asarray(book["strike"], dtype=float)
+        expiry = np.asarray(book["expiry"], dtype=float)
+        is_call = np.asarray(book["is_call"], dtype=bool)
+        quantity = np.asarray(book["quantity"], dtype=float)
+
+        # One flat cell index per position: underlying-major, then bucket
+        bucket = np.clip(np.searchsorted(edges, expiry, side="right") - 1, 0, n_buckets - 1)
+        cell = codes * n_buckets + bucket
+        n_cells = len(names) * n_buckets
+
+        totals = {name: np.zeros(n_cells) for name in GREEKS}
+        for start in range(0, len(cell), chunk_size):
+            block = slice(start, start + chunk_size)
+            greeks = PortfolioRisk._block_greeks(
+                spot[block], strike[block], r, sigma[block], expiry[block],
+                is_call[block], quantity[block],
+            )
+            for name in GREEKS:
+                totals[name] += np.bincount(cell[block], weights=greeks[name], minlength=n_cells)
+
+        shape = (len(names), n_buckets)
+        return RiskLadders(
+            names, edges, *(totals[name].reshape(shape) for name in GREEKS)
+        )
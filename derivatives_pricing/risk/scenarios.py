@@ -0,0 +1,185 @@
+"""
+Full-revaluation scenario P&L, Value-at-Risk and Expected Shortfall.
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.risk.portfolio import PortfolioRisk
+
+
+ScenarioResult = namedtuple("ScenarioResult", ["pnl", "var", "es", "revalued"])
+
+# Bytes of temporaries per (scenario, position) cell during revaluation
+_BYTES_PER_CELL = 8 * 12
+
+
+class ScenarioRisk:
+    """
+    Revalue a book under spot, volatility and rate shock scenarios.
+
+    The book has the same columns as for ``PortfolioRisk``. Shock
+    matrices have one row per scenario and one column per underlying,
+    in sorted name order (as in ``RiskLadders.underlyings``):
+
+    - ``spot_shocks``: relative moves, S -> S (1 + shock)
+    - ``vol_shocks``: absolute volatility moves, sigma -> sigma + shock
+    - ``rate_shocks``: one absolute rate move per scenario
+
+    Every position is repriced under every scenario in broadcast
+    (scenarios x positions) blocks sized to ``memory_budget`` bytes.
+    Scenario blocks run on a thread pool, since NumPy releases the GIL
+    in its ufunc loops.
+    """
+
+    @staticmethod
+    def _revalue(spot, strike, sigma, expiry, is_call, quantity, codes, r,
+                 spot_shocks, vol_shocks, rate_shocks, scenarios, block_positions):
+        """
+        Shocked book value for the given scenario rows.
+        """
+        values = np.zeros(len(scenarios))
+
+        for start in range(0, len(strike), block_positions):
+            block = slice(start, start + block_positions)
+            underlying = codes[block]
+
+            S = spot[block] * (1.0 + spot_shocks[np.ix_(scenarios, underlying)])
+            vol = np.maximum(sigma[block] + vol_shocks[np.ix_(scenarios, underlying)], 1e-4)
+            rate = r + rate_shocks[scenarios, np.newaxis]
+
+            # Expired positions are revalued at intrinsic, as in the base
+            T = expiry[block]
+            expired = T <= 0
+            call, put = BlackScholes.prices(S, strike[block], rate, vol, np.where(expired, 1.0, T))
+            value = np.where(is_call[block], call, put)
+            intrinsic = np.maximum(np.where(is_call[block], 1.0, -1.0) * (S - strike[block]), 0.0)
+            values += np.where(expired, intrinsic, value) @ quantity[block]
+
+        return values
+
+    @staticmethod
+    def pnl(
+        book, spots, r,
+        spot_shocks,
+        vol_shocks=None,
+        rate_shocks=None,
+        vols=None,
+        level=0.99,
+        prefilter=None,
+        memory_budget=256 * 2 ** 20,
+        n_workers=None
+    ):
+        """
+        Scenario P&L vector with VaR and ES.
+
+        Parameters
+        ----------
+        book, spots, r, vols
+            As for ``PortfolioRisk.ladders``
+        spot_shocks : ndarray of shape (n_scenarios, n_underlyings)
+        vol_shocks : ndarray of shape (n_scenarios, n_underlyings), optional
+        rate_shocks : ndarray of shape (n_scenarios,), optional
+        level : float
+            VaR / ES confidence level
+        prefilter : float, optional
+            Fraction of scenarios to fully revalue. Every scenario is
+            first scored with a delta-gamma-vega-rho approximation and
+            only the worst ``prefilter`` fraction (at least the VaR
+            tail) is repriced; the others keep their approximate P&L.
+        memory_budget : int
+            Bytes of temporaries allowed per worker
+        n_workers : int, optional
+            Threads (defaults to the CPU count)
+
+        Returns
+        -------
+        ScenarioResult
+            pnl per scenario, VaR and ES as positive losses, and a
+            boolean mask of the scenarios that were fully revalued
+        """
+        names, codes, spot, sigma = PortfolioRisk._market(book, spots, vols)
+        strike = np.asarray(book["strike"], dtype=float)
+        expiry = np.asarray(book["expiry"], dtype=float)
+        is_call = np.asarray(book["is_call"], dtype=bool)
+        quantity = np.asarray(book["quantity"], dtype=float)
+
+        spot_shocks = np.asarray(spot_shocks, dtype=float)
+        n_scenarios = spot_shocks.shape[0]
+        if vol_shocks is None:
+            vol_shocks = np.zeros_like(spot_shocks)
+        if rate_shocks is None:
+            rate_shocks = np.zeros(n_scenarios)
+        vol_shocks = np.asarray(vol_shocks, dtype=float)
+        rate_shocks = np.asarray(rate_shocks, dtype=float)
+
+        base_greeks = PortfolioRisk._block_greeks(
+            spot, strike, r, sigma, expiry, is_call, quantity
+        )
+        base_value = base_greeks["value"].sum()
+
+        revalued = np.ones(n_scenarios, dtype=bool)
+        pnl = np.empty(n_scenarios)
+
+        if prefilter is not None:
+            # Second-order Taylor P&L from Greeks summed per underlying
+            n_names = len(names)
+            delta = np.bincount(codes, base_greeks["delta"] * spot, n_names)
+            gamma = np.bincount(codes, base_greeks["gamma"] * spot ** 2, n_names)
+            vega = np.bincount(codes, base_greeks["vega"], n_names)
+            rho = base_greeks["rho"].sum()
+
+            pnl[:] = (
+                spot_shocks @ delta
+                + 0.5 * spot_shocks ** 2 @ gamma
+                + vol_shocks @ vega
+                + rho * rate_shocks
+            )
+            n_full = max(int(np.ceil(prefilter * n_scenarios)),
+                         int(np.ceil((1 - level) * n_scenarios)) + 1)
+            n_full = min(n_full, n_scenarios)
+            revalued[:] = False
+            revalued[np.argpartition(pnl, n_full - 1)[:n_full]] = True
+
+        scenarios = np.flatnonzero(revalued)
+        block_positions = max(1, min(len(strike), memory_budget // _BYTES_PER_CELL // 64))
+        block_scenarios = max(1, memory_budget // (_BYTES_PER_CELL * block_positions))
+        blocks = [
+            scenarios[start:start + block_scenarios]
+            for start in range(0, len(scenarios), block_scenarios)
+        ]
+
+        def revalue(rows):
+            return ScenarioRisk._revalue(
+                spot, strike, sigma, expiry, is_call, quantity, codes, r,
+                spot_shocks, vol_shocks, rate_shocks, rows, block_positions,
+            )
+
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers == 1 or len(blocks) == 1:
+            values = [revalue(rows) for rows in blocks]
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                values = list(executor.map(revalue, blocks))
+
+        if blocks:
+            pnl[scenarios] = np.concatenate(values) - base_value
+
+        var, es = ScenarioRisk.var_es(pnl, level)
+        return ScenarioResult(pnl, var, es, revalued)
+
+    @staticmethod
+    def var_es(pnl, level=0.99):
+        """
+        Historical VaR and Expected Shortfall of a P&L vector.
+
+        Both are reported as positive losses: VaR is the loss exceeded in
+        a fraction 1 - level of scenarios, ES the mean loss beyond it.
+        """
+        pnl = np.asarray(pnl, dtype=float)
+        threshold = np.quantile(pnl, 1 - level)
+        return -threshold, -pnl[pnl <= threshold].mean()
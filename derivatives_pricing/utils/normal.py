@@ -0,0 +1,45 @@
+"""
+Lean standard normal kernels for pricing hot paths.
+
+``scipy.stats.norm`` routes every call through the generic distribution
+machinery (argument checking, loc/scale handling, shape broadcasting),
+which dominates latency for small batches. These functions call the
+underlying special functions directly.
+
+Accuracy
+--------
+norm_cdf : ``scipy.special.ndtr`` (Cephes). Relative error below ~1e-15
+    over the representable range; the lower tail is evaluated through
+    erfc, so there is no cancellation for large negative arguments.
+norm_pdf : closed form ``exp(-x**2 / 2) / sqrt(2 pi)``, accurate to
+    machine precision (underflows to 0 for |x| > ~38.6).
+norm_ppf : ``scipy.special.ndtri`` (Cephes). Relative error below ~1e-15
+    on (0, 1).
+"""
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def norm_cdf(x):
+    """
+    Standard normal cumulative distribution function.
+    """
+    return ndtr(x)
+
+
+def norm_pdf(x):
+    """
+    Standard normal probability density function.
+    """
+    x = np.asarray(x, dtype=float)
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def norm_ppf(u):
+    """
+    Inverse of the standard normal cumulative distribution function.
+    """
+    return ndtri(u)
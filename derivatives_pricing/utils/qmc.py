@@ -0,0 +1,96 @@
+"""
+Quasi-Monte Carlo building blocks: scrambled Sobol normals and the
+Brownian bridge construction.
+
+With a Brownian bridge the first (best equidistributed) Sobol coordinates
+drive the coarse shape of each path (terminal value, then midpoints),
+which keeps the effective dimension of multi-step payoffs low.
+"""
+
+from collections import deque
+
+import numpy as np
+from scipy.stats import qmc
+
+from derivatives_pricing.utils.normal import norm_ppf
+from derivatives_pricing.utils.random import make_rng
+
+
+def sobol_normals(n_points, dim, seed=None):
+    """
+    Scrambled Sobol points mapped to standard normals.
+
+    Sobol balance properties hold for powers of two; other sizes use the
+    leading ``n_points`` of the next power of two.
+
+    Returns
+    -------
+    ndarray of shape (n_points, dim)
+    """
+    sampler = qmc.Sobol(dim, scramble=True, seed=make_rng(seed))
+    m = max(int(np.ceil(np.log2(n_points))), 0)
+    U = sampler.random_base2(m)[:n_points]
+
+    # Keep the inverse CDF finite at the cube boundary
+    tiny = np.finfo(float).tiny
+    return norm_ppf(np.clip(U, tiny, 1.0 - np.finfo(float).epsneg))
+
+
+def _bridge_schedule(n_steps):
+    """
+    Construction order for a Brownian bridge on grid indices 0..n_steps.
+
+    Returns a list of (index, left, right) with left/right the already
+    built neighbours (left = 0 is W_0 = 0, right = None for the terminal
+    point), in breadth-first order.
+    """
+    schedule = [(n_steps, 0, None)]
+    intervals = deque([(0, n_steps)])
+
+    while intervals:
+        left, right = intervals.popleft()
+        mid = (left + right) // 2
+        if mid == left:
+            continue
+        schedule.append((mid, left, right))
+        intervals.append((left, mid))
+        intervals.append((mid, right))
+
+    return schedule
+
+
+def brownian_bridge(Z, T):
+    """
+    Build Brownian motion on an equally spaced grid from normals Z.
+
+    Parameters
+    ----------
+    Z : ndarray of shape (n_paths, n_steps)
+        Standard normals; column k drives the k-th bridge point
+        (column 0 sets W_T)
+    T : float
+        Horizon
+
+    Returns
+    -------
+    ndarray of shape (n_steps, n_paths)
+        W at t_1..t_n, time-major
+    """
+    n_paths, n_steps = Z.shape
+    dt = T / n_steps
+
+    W = np.zeros((n_steps + 1, n_paths))
+
+    for k, (index, left, right) in enumerate(_bridge_schedule(n_steps)):
+        if right is None:
+            W[index] = np.sqrt(index * dt) * Z[:, k]
+            continue
+
+        t_l, t_m, t_r = left * dt, index * dt, right * dt
+        w_left = (t_r - t_m) / (t_r - t_l)
+        w_right = (t_m - t_l) / (t_r - t_l)
+        std = np.sqrt((t_m - t_l) * (t_r - t_m) / (t_r - t_l))
+
+        W[index] = w_left * W[left] + w_right * W[right] + std * Z[:, k]
+
+    return W[1:]
@@ -0,0 +1,190 @@
+"""
+Streaming, mergeable statistics for Monte Carlo estimators.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from derivatives_pricing.utils.normal import norm_ppf
+
+
+MonteCarloResult = namedtuple(
+    "MonteCarloResult", ["price", "std_error", "conf_interval", "n_paths"]
+)
+
+
+class RunningStats:
+    """
+    Running mean and variance (Welford / Chan et al.).
+
+    Batches are folded in with the pairwise update of Chan, Golub and
+    LeVeque, which stays accurate where naive sums of squares suffer from
+    cancellation. Two accumulators built on disjoint samples can be
+    merged, so chunks simulated on different workers reduce exactly like
+    a single pass.
+    """
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_samples(cls, samples, axis=None):
+        """
+        Accumulator over all samples, or, with ``axis``, one accumulator
+        per slice along the remaining axes (mean and m2 become arrays).
+        """
+        samples = np.asarray(samples, dtype=float)
+        if axis is not None:
+            if samples.shape[axis] == 0:
+                return cls()
+            mean = samples.mean(axis=axis)
+            m2 = np.sum((samples - np.expand_dims(mean, axis)) ** 2, axis=axis)
+            return cls(samples.shape[axis], mean, m2)
+
+        samples = samples.ravel()
+        if samples.size == 0:
+            return cls()
+        mean = samples.mean()
+        return cls(samples.size, mean, float(np.sum((samples - mean) ** 2)))
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one (in place) and return self.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+
+        return self
+
+    def update(self, samples):
+        """
+        Add a batch of samples and return self.
+        """
+        return self.merge(RunningStats.from_samples(samples))
+
+    @property
+    def variance(self):
+        """
+        Unbiased sample variance.
+        """
+        if self.count < 2:
+            return np.nan
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_error(self):
+        """
+        Standard error of the mean.
+        """
+        if self.count < 2:
+            return np.inf
+        return np.sqrt(self.variance / self.count)
+
+    def confidence_interval(self, level=0.95):
+        """
+        Normal-approximation confidence interval for the mean.
+        """
+        half_width = norm_ppf(0.5 + 0.5 * level) * self.std_error
+        return self.mean - half_width, self.mean + half_width
+
+    def to_result(self, level=0.95):
+        return MonteCarloResult(
+            self.mean, self.std_error, self.confidence_interval(level), self.count
+        )
+
+
+class ControlVariateStats:
+    """
+    Streaming accumulator for a control-variate estimator.
+
+    Tracks the joint mean and co-moment matrix of a target Y and k
+    controls X with the same pairwise update as ``RunningStats``, so the
+    optimal coefficients beta = Cov(X, X)^-1 Cov(X, Y) are estimated
+    over every chunk without keeping any samples.
+    """
+
+    def __init__(self, count=0, mean=None, comoment=None):
+        self.count = count
+        self.mean = mean
+        self.comoment = comoment
+
+    @classmethod
+    def from_samples(cls, Y, X):
+        """
+        Parameters
+        ----------
+        Y : array_like of shape (n,)
+        X : array_like of shape (n,) or (n, k)
+        """
+        Y = np.asarray(Y, dtype=float).reshape(-1, 1)
+        X = np.asarray(X, dtype=float).reshape(Y.shape[0], -1)
+        V = np.hstack([Y, X])
+        mean = V.mean(axis=0)
+        centred = V - mean
+        return cls(V.shape[0], mean, centred.T @ centred)
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one (in place) and return self.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.comoment = other.count, other.mean, other.comoment
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.mean = self.mean + delta * other.count / count
+        self.comoment = (
+            self.comoment + other.comoment
+            + np.outer(delta, delta) * self.count * other.count / count
+        )
+        self.count = count
+
+        return self
+
+    def update(self, Y, X):
+        """
+        Add a batch of samples and return self.
+        """
+        return self.merge(ControlVariateStats.from_samples(Y, X))
+
+    @property
+    def beta(self):
+        """
+        Optimal (least-squares) control coefficients.
+
+        A singular control co-moment (e.g. a control that is constant
+        over the sample) gets the minimum-norm solution, so controls
+        without variance have coefficient zero.
+        """
+        return np.linalg.lstsq(self.comoment[1:, 1:], self.comoment[1:, 0], rcond=None)[0]
+
+    def to_stats(self, control_means):
+        """
+        RunningStats of the controlled estimator Y - beta (X - E[X]).
+
+        ``control_means`` are the known expectations of the controls.
+        """
+        beta = self.beta
+        mean = self.mean[0] - beta @ (self.mean[1:] - np.atleast_1d(control_means))
+        m2 = self.comoment[0, 0] - self.comoment[0, 1:] @ beta
+        return RunningStats(self.count, mean, m2)
+
+    def to_result(self, control_means, level=0.95):
+        return self.to_stats(control_means).to_result(level)
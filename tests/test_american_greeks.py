@@ -0,0 +1,33 @@
+from derivatives_pricing.greeks.american import AmericanGreeks
+from derivatives_pricing.greeks.numerical import NumericalGreeks
+from derivatives_pricing.models.lattice import LatticePricer
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+
+def _lattice(S=S0, sigma=SIGMA):
+    return LatticePricer.price(S, K, R, sigma, T, n_steps=1_000)[()]
+
+
+def test_single_run_greeks_match_lattice():
+    greeks = AmericanGreeks.american_put(S0, K, R, SIGMA, T, n_paths=100_000, seed=7)
+
+    delta = NumericalGreeks.delta(_lattice, S0, h=1.0)
+    gamma = NumericalGreeks.gamma(_lattice, S0, h=1.0)
+    vega = NumericalGreeks.vega(lambda sigma: _lattice(sigma=sigma), SIGMA, h=0.01)
+
+    assert abs(greeks["delta"].price - delta) < 0.015
+    assert abs(greeks["gamma"].price - gamma) < 0.003
+    assert abs(greeks["vega"].price - vega) < 1.5
+    assert greeks["delta"].std_error < 0.005
+
+
+def test_price_matches_lsm_pricer():
+    greeks = AmericanGreeks.american_put(S0, K, R, SIGMA, T, n_paths=20_000, seed=3)
+    paths = LongstaffSchwartzPricer.simulate_paths(R, SIGMA, T, n_paths=20_000, seed=3)
+
+    assert abs(
+        greeks["price"].price
+        - LongstaffSchwartzPricer.american_put_from_paths(paths, S0, K, R, T)
+    ) < 1e-10
@@ -76,3 +76,33 @@ def test_put_call_parity():
     rhs = put + S
 
     assert np.isclose(lhs, rhs, atol=1e-6)
+
+
+def test_batch_prices_match_scalar():
+    S = 100.0
+    K = np.array([80.0, 100.0, 120.0])
+    r = 0.05
+    sigma = np.array([0.15, 0.2, 0.3])
+    T = np.array([0.25, 1.0, 2.0])
+
+    calls, puts = BlackScholes.prices(S, K, r, sigma, T)
+
+    for i in range(len(K)):
+        assert np.isclose(calls[i], BlackScholes.call_price(S, K[i], r, sigma[i], T[i]))
+        assert np.isclose(puts[i], BlackScholes.put_price(S, K[i], r, sigma[i], T[i]))
+
+
+def test_price_chain_structured_array():
+    chain = np.zeros(
+        2, dtype=[("S", float), ("K", float), ("r", float), ("sigma", float), ("T", float)]
+    )
+    chain["S"] = 100.0
+    chain["K"] = 100.0
+    chain["r"] = 0.05
+    chain["sigma"] = 0.2
+    chain["T"] = 1.0
+
+    calls, puts = BlackScholes.price_chain(chain)
+
+    assert np.allclose(calls, 10.4506, atol=1e-4)
+    assert np.allclose(puts, 5.5735, atol=1e-4)
@@ -0,0 +1,51 @@
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.fourier import FourierPricer
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.models.stochastic import (
+    GBMModel, HestonModel, JumpDiffusionModel, VarianceGammaModel,
+)
+
+
+S0, R, SIGMA, T = 100.0, 0.05, 0.2, 1.0
+STRIKES = np.linspace(60.0, 160.0, 41)
+
+
+def test_fourier_methods_match_black_scholes_on_a_strike_grid():
+    model = GBMModel(SIGMA)
+    calls = BlackScholes.call_price(S0, STRIKES, R, SIGMA, T)
+    puts = BlackScholes.put_price(S0, STRIKES, R, SIGMA, T)
+
+    assert np.allclose(FourierPricer.cos(model, S0, STRIKES, R, T), calls, atol=1e-10)
+    assert np.allclose(FourierPricer.cos(model, S0, STRIKES, R, T, is_call=False), puts, atol=1e-10)
+    assert np.allclose(FourierPricer.carr_madan(model, S0, STRIKES, R, T), calls, atol=5e-3)
+    assert np.allclose(FourierPricer.carr_madan(model, S0, STRIKES, R, T, is_call=False), puts, atol=5e-3)
+
+
+def test_cos_covers_wide_strikes_at_short_maturity():
+    model = GBMModel(SIGMA)
+    for expiry, strikes in ((0.02, np.linspace(60.0, 160.0, 41)), (0.25, np.linspace(20.0, 300.0, 57))):
+        calls = BlackScholes.call_price(S0, strikes, R, SIGMA, expiry)
+        puts = BlackScholes.put_price(S0, strikes, R, SIGMA, expiry)
+        assert np.allclose(FourierPricer.cos(model, S0, strikes, R, expiry), calls, atol=1e-10)
+        assert np.allclose(FourierPricer.cos(model, S0, strikes, R, expiry, is_call=False), puts, atol=1e-10)
+
+
+def test_cos_and_fft_agree_for_heston_jumps_and_variance_gamma():
+    models = (
+        HestonModel(0.04, 1.5, 0.04, 0.5, -0.7),
+        JumpDiffusionModel(SIGMA, 0.5, -0.1, 0.15),
+        VarianceGammaModel(0.12, 0.2, -0.14),
+    )
+    for model in models:
+        cos = FourierPricer.cos(model, S0, STRIKES, R, T)
+        fft = FourierPricer.carr_madan(model, S0, STRIKES, R, T)
+        assert np.allclose(cos, fft, atol=5e-3)
+        assert np.all(np.diff(cos) < 0)
+
+
+def test_fourier_prices_match_monte_carlo_on_the_path_models():
+    for model in (HestonModel(0.04, 1.5, 0.04, 0.5, -0.7), VarianceGammaModel(0.12, 0.2, -0.14)):
+        price = FourierPricer.cos(model, S0, 100.0, R, T)
+        result = MonteCarloPricer.european_model(model, S0, 100.0, R, T, 200_000, n_steps=20, seed=3)
+        assert abs(result.price - price) < 4 * result.std_error + 0.02
@@ -0,0 +1,140 @@
+import numpy as np
+from derivatives_pricing.greeks.analytical import BlackScholesGreeks
+from derivatives_pricing.greeks.monte_carlo import MonteCarloGreeks
+from derivatives_pricing.greeks.numerical import NumericalGreeks
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.fourier import FourierPricer
+from derivatives_pricing.models.stochastic import HestonModel, JumpDiffusionModel
+
+
+def test_all_greeks_matches_individual_methods():
+    S = 100.0
+    K = np.array([80.0, 100.0, 120.0])
+    r = 0.05
+    sigma = 0.2
+    T = np.array([0.5, 1.0, 2.0])
+
+    greeks = BlackScholesGreeks.all_greeks(S, K, r, sigma, T)
+
+    assert np.allclose(greeks["call_price"], BlackScholes.call_price(S, K, r, sigma, T))
+    assert np.allclose(greeks["put_price"], BlackScholes.put_price(S, K, r, sigma, T))
+    assert np.allclose(greeks["delta_call"], BlackScholesGreeks.delta_call(S, K, r, sigma, T))
+    assert np.allclose(greeks["delta_put"], BlackScholesGreeks.delta_put(S, K, r, sigma, T))
+    assert np.allclose(greeks["gamma"], BlackScholesGreeks.gamma(S, K, r, sigma, T))
+    assert np.allclose(greeks["vega"], BlackScholesGreeks.vega(S, K, r, sigma, T))
+    assert np.allclose(greeks["theta_call"], BlackScholesGreeks.theta_call(S, K, r, sigma, T))
+    assert np.allclose(greeks["theta_put"], BlackScholesGreeks.theta_put(S, K, r, sigma, T))
+    assert np.allclose(greeks["rho_call"], BlackScholesGreeks.rho_call(S, K, r, sigma, T))
+    assert np.allclose(greeks["rho_put"], BlackScholesGreeks.rho_put(S, K, r, sigma, T))
+
+
+def test_rho_against_finite_difference():
+    S, K, r, sigma, T = 100.0, 105.0, 0.03, 0.25, 0.75
+    h = 1e-5
+
+    rho_call = (
+        BlackScholes.call_price(S, K, r + h, sigma, T)
+        - BlackScholes.call_price(S, K, r - h, sigma, T)
+    ) / (2 * h)
+    rho_put = (
+        BlackScholes.put_price(S, K, r + h, sigma, T)
+        - BlackScholes.put_price(S, K, r - h, sigma, T)
+    ) / (2 * h)
+
+    assert np.isclose(BlackScholesGreeks.rho_call(S, K, r, sigma, T), rho_call, atol=1e-4)
+    assert np.isclose(BlackScholesGreeks.rho_put(S, K, r, sigma, T), rho_put, atol=1e-4)
+
+
+def test_numerical_delta_matches_analytical():
+    S, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+    delta = NumericalGreeks.delta(
+        lambda s: BlackScholes.call_price(s, K, r, sigma, T), S
+    )
+
+    assert np.isclose(delta, BlackScholesGreeks.delta_call(S, K, r, sigma, T), atol=1e-6)
+
+
+def test_ladder_matches_analytical_and_batches_one_call():
+    S, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+    calls = []
+
+    def price_fn(s, vol, rate, mat):
+        calls.append(len(s))
+        return BlackScholes.call_price(s, K, rate, vol, mat)
+
+    ladder = NumericalGreeks.ladder(price_fn, S, sigma, r, T)
+    greeks = BlackScholesGreeks.all_greeks(S, K, r, sigma, T)
+
+    # One call; the base point is shared by price, Gamma and Volga
+    assert calls == [13]
+    assert np.isclose(ladder["price"], greeks["call_price"])
+    assert np.isclose(ladder["delta"], greeks["delta_call"], atol=1e-6)
+    assert np.isclose(ladder["gamma"], greeks["gamma"], atol=1e-5)
+    assert np.isclose(ladder["vega"], greeks["vega"], atol=1e-4)
+    assert np.isclose(ladder["rho"], greeks["rho_call"], atol=1e-4)
+    assert np.isclose(ladder["theta"], greeks["theta_call"], atol=1e-4)
+
+    # A subset prices only its own scenarios: base, S +/- h_S, r +/- h_r
+    subset = NumericalGreeks.ladder(price_fn, S, sigma, r, T, greeks=("price", "delta", "gamma", "rho"))
+    assert calls[-1] == 5
+    assert set(subset) == {"price", "delta", "gamma", "rho"}
+    assert all(np.isclose(subset[name], ladder[name]) for name in subset)
+
+
+def test_monte_carlo_ladder_uses_common_random_numbers():
+    S, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+    ladder = MonteCarloGreeks.ladder_bump_and_revalue(
+        S, K, r, sigma, T, n_paths=200_000, is_call=False, seed=11
+    )
+    greeks = BlackScholesGreeks.all_greeks(S, K, r, sigma, T)
+
+    assert np.isclose(ladder["delta"], greeks["delta_put"], atol=0.01)
+    assert np.isclose(ladder["gamma"], greeks["gamma"], atol=0.002)
+    assert np.isclose(ladder["vega"], greeks["vega"], atol=1.0)
+    assert np.isclose(ladder["rho"], greeks["rho_put"], atol=1.0)
+
+
+def test_risk_pass_matches_analytical_over_a_chain():
+    S, r, sigma = 100.0, 0.05, 0.2
+    K = np.array([[90.0], [100.0], [110.0]])
+    T = np.array([0.5, 1.0])
+    is_call = np.array([[True], [False], [True]])
+
+    risk = MonteCarloGreeks.risk_pass(
+        S, K, r, sigma, T, n_paths=200_000, is_call=is_call, seed=5, chunk_size=64_000
+    )
+    greeks = BlackScholesGreeks.all_greeks(S, K, r, sigma, T)
+    call = np.broadcast_to(is_call, (3, 2))
+
+    expected = {
+        "price": np.where(call, greeks["call_price"], greeks["put_price"]),
+        "delta": np.where(call, greeks["delta_call"], greeks["delta_put"]),
+        "gamma": greeks["gamma"],
+        "vega": greeks["vega"],
+        "vega_lr": greeks["vega"],
+        "rho": np.where(call, greeks["rho_call"], greeks["rho_put"]),
+        "theta": np.where(call, greeks["theta_call"], greeks["theta_put"]),
+    }
+
+    for name, value in expected.items():
+        result = risk[name]
+        assert result.price.shape == (3, 2)
+        assert result.n_paths == 200_000
+        assert np.all(np.abs(result.price - value) < 4 * result.std_error + 1e-3), name
+
+
+def test_monte_carlo_ladder_under_path_models_matches_fourier():
+    for model in (HestonModel(0.04, 1.5, 0.04, 0.5, -0.7), JumpDiffusionModel(0.2, 0.5, -0.1, 0.15)):
+        greeks = MonteCarloGreeks.ladder_bump_and_revalue(
+            100.0, 100.0, 0.05, None, 1.0, 200_000, seed=1, model=model, n_steps=20
+        )
+
+        def price(S=100.0, r=0.05):
+            return FourierPricer.cos(model, S, 100.0, r, 1.0)
+
+        assert set(greeks) == {"price", "delta", "gamma", "rho"}
+        assert abs(greeks["delta"] - (price(101.0) - price(99.0)) / 2) < 0.01
+        assert abs(greeks["gamma"] - (price(101.0) - 2 * price() + price(99.0))) < 2e-3
+        assert abs(greeks["rho"] - (price(r=0.0501) - price(r=0.0499)) / 2e-4) < 1.0
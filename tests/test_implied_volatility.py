@@ -0,0 +1,59 @@
+import warnings
+
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.implied_volatility import ImpliedVolatility
+
+
+def test_recovers_volatility_for_calls_and_puts():
+    S = 100.0
+    K = np.array([50.0, 80.0, 100.0, 120.0, 200.0])
+    r = 0.05
+    T = np.array([0.1, 0.5, 1.0, 2.0, 3.0])
+    sigma = np.array([0.6, 0.25, 0.2, 0.35, 0.15])
+
+    calls, puts = BlackScholes.prices(S, K, r, sigma, T)
+
+    implied_calls, status_calls = ImpliedVolatility.solve(calls, S, K, r, T, is_call=True)
+    implied_puts, status_puts = ImpliedVolatility.solve(puts, S, K, r, T, is_call=False)
+
+    assert np.all(status_calls == ImpliedVolatility.CONVERGED)
+    assert np.all(status_puts == ImpliedVolatility.CONVERGED)
+    assert np.allclose(implied_calls, sigma, atol=1e-8)
+    assert np.allclose(implied_puts, sigma, atol=1e-8)
+
+
+def test_deep_in_the_money_call():
+    S, K, r, sigma, T = 100.0, 40.0, 0.05, 0.3, 1.0
+    price = BlackScholes.call_price(S, K, r, sigma, T)
+
+    implied, status = ImpliedVolatility.solve(price, S, K, r, T)
+
+    assert status == ImpliedVolatility.CONVERGED
+    assert np.isclose(implied, sigma, atol=1e-6)
+
+
+def test_arbitrage_bounds_are_reported():
+    S, K, r, T = 100.0, 100.0, 0.05, 1.0
+    intrinsic = S - K * np.exp(-r * T)
+
+    implied, status = ImpliedVolatility.solve(
+        [intrinsic - 1.0, S + 1.0], S, K, r, T
+    )
+
+    assert np.all(np.isnan(implied))
+    assert status[0] == ImpliedVolatility.BELOW_INTRINSIC
+    assert status[1] == ImpliedVolatility.ABOVE_UPPER_BOUND
+
+
+def test_invalid_inputs_are_flagged_without_iterating():
+    S, K, r = 100.0, 100.0, 0.05
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        implied, status = ImpliedVolatility.solve(
+            [np.nan, 10.0, 10.0, 10.0], S, K, r, [1.0, 0.0, -0.5, 1.0], max_iter=100
+        )
+
+    assert np.all(np.isnan(implied[:3]))
+    assert np.all(status[:3] == ImpliedVolatility.INVALID_INPUT)
+    assert status[3] == ImpliedVolatility.CONVERGED
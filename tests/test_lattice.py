@@ -0,0 +1,65 @@
+import numpy as np
+from derivatives_pricing.models.binomial import BinomialPricer
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.lattice import LatticePricer
+
+
+def test_european_prices_converge_to_black_scholes():
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    K = np.array([90.0, 100.0, 110.0])
+    calls, puts = BlackScholes.prices(S0, K, r, sigma, T)
+
+    for tree in ("binomial", "trinomial"):
+        lattice_calls = LatticePricer.price(
+            S0, K, r, sigma, T, n_steps=400, is_call=True, american=False,
+            tree=tree, smoothing=True, richardson=True
+        )
+        lattice_puts = LatticePricer.price(
+            S0, K, r, sigma, T, n_steps=400, is_call=False, american=False,
+            tree=tree, smoothing=True, richardson=True
+        )
+
+        assert np.allclose(lattice_calls, calls, atol=1e-3)
+        assert np.allclose(lattice_puts, puts, atol=1e-3)
+
+
+def test_batch_matches_reference_crr_values():
+    K = np.array([90.0, 100.0, 110.0])
+    sigma = np.array([0.15, 0.2, 0.3])
+    # Scalar CRR backward induction at 150 steps (the original BinomialPricer)
+    reference = np.array([1.1828127643383797, 6.085043263514474, 15.611518092421294])
+
+    batch = LatticePricer.price(100.0, K, 0.05, sigma, 1.0, n_steps=150)
+
+    assert np.allclose(batch, reference, rtol=1e-12)
+    for i in range(len(K)):
+        assert np.isclose(BinomialPricer.american_put(100.0, K[i], 0.05, sigma[i], 1.0, 150), reference[i])
+
+
+def test_richardson_needs_an_even_step_count():
+    for n_steps in (1, 101):
+        try:
+            LatticePricer.price(100.0, 100.0, 0.05, 0.2, 1.0, n_steps=n_steps, richardson=True)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"n_steps={n_steps} was accepted")
+
+
+def test_bbsr_at_100_steps_matches_fine_crr():
+    reference = BinomialPricer.american_put(100.0, 100.0, 0.05, 0.2, 1.0, n_steps=5_000)
+
+    bbsr = LatticePricer.price(
+        100.0, 100.0, 0.05, 0.2, 1.0, n_steps=100, smoothing=True, richardson=True
+    )
+
+    assert abs(bbsr - reference) < 2e-3
+
+
+def test_american_call_without_dividends_equals_european():
+    american = LatticePricer.price(100.0, 100.0, 0.05, 0.2, 1.0, n_steps=300, is_call=True)
+    european = LatticePricer.price(
+        100.0, 100.0, 0.05, 0.2, 1.0, n_steps=300, is_call=True, american=False
+    )
+
+    assert np.isclose(american, european)
@@ -0,0 +1,106 @@
+import numpy as np
+from derivatives_pricing.models.binomial import BinomialPricer
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BENCHMARK = BinomialPricer.american_put(S0, K, R, SIGMA, T, n_steps=1_000)
+
+
+def test_american_put_close_to_binomial():
+    price = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=50_000, n_steps=50, seed=42
+    )
+
+    assert np.isclose(price, BENCHMARK, atol=0.05)
+
+
+def test_low_memory_mode_close_to_binomial():
+    price = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=50_000, n_steps=50, seed=42, low_memory=True
+    )
+
+    assert np.isclose(price, BENCHMARK, atol=0.05)
+
+
+def test_float32_paths_close_to_binomial():
+    price = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=50_000, n_steps=50, seed=42, dtype=np.float32
+    )
+
+    assert np.isclose(price, BENCHMARK, atol=0.05)
+
+
+def test_generator_seed_is_reproducible():
+    price_a = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=10_000, n_steps=20,
+        seed=np.random.default_rng(np.random.SeedSequence(123))
+    )
+    price_b = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=10_000, n_steps=20,
+        seed=np.random.SeedSequence(123)
+    )
+
+    assert price_a == price_b
+
+
+def test_boundary_has_one_entry_per_exercise_date():
+    n_steps = 20
+    _, boundary = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=20_000, n_steps=n_steps, seed=1,
+        return_boundary=True
+    )
+
+    assert len(boundary) == n_steps - 1
+
+
+def test_rqmc_close_to_binomial():
+    result = LongstaffSchwartzPricer.american_put_rqmc(
+        S0, K, R, SIGMA, T, n_paths=2 ** 12, n_replicates=8, n_steps=50, seed=3
+    )
+
+    assert result.n_paths == 8 * 2 ** 12
+    assert np.isclose(result.price, BENCHMARK, atol=0.05)
+
+
+def test_orthogonal_bases_close_to_binomial():
+    for basis in ("laguerre", "chebyshev"):
+        price = LongstaffSchwartzPricer.american_put(
+            S0, K, R, SIGMA, T, n_paths=50_000, n_steps=50, seed=42,
+            basis=basis, basis_degree=3
+        )
+
+        assert np.isclose(price, BENCHMARK, atol=0.05)
+
+
+def test_shared_paths_reproduce_direct_pricing():
+    paths = LongstaffSchwartzPricer.simulate_paths(R, SIGMA, T, n_paths=20_000, n_steps=20, seed=9)
+
+    for spot in (90.0, 100.0, 110.0):
+        direct = LongstaffSchwartzPricer.american_put(
+            spot, K, R, SIGMA, T, n_paths=20_000, n_steps=20, seed=9
+        )
+        shared = LongstaffSchwartzPricer.american_put_from_paths(paths, spot, K, R, T)
+
+        assert np.isclose(shared, direct)
+
+
+def test_european_control_variate_close_to_binomial():
+    price = LongstaffSchwartzPricer.american_put(
+        S0, K, R, SIGMA, T, n_paths=50_000, n_steps=50, seed=42, control_variate=True
+    )
+    paths = LongstaffSchwartzPricer.simulate_paths(R, SIGMA, T, n_paths=50_000, seed=42)
+    shared = LongstaffSchwartzPricer.american_put_from_paths(paths, S0, K, R, T, sigma=SIGMA)
+
+    assert np.isclose(price, BENCHMARK, atol=0.05)
+    assert np.isclose(shared, price)
+
+
+def test_control_variate_with_no_european_payoff():
+    plain = LongstaffSchwartzPricer.american_put(100.0, 40.0, R, 0.1, 0.25, n_paths=10_000, seed=1)
+    price = LongstaffSchwartzPricer.american_put(
+        100.0, 40.0, R, 0.1, 0.25, n_paths=10_000, seed=1, control_variate=True
+    )
+
+    assert plain == 0.0
+    assert np.isclose(price, 0.0)
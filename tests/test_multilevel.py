@@ -0,0 +1,35 @@
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.multilevel import MultilevelMonteCarlo
+from derivatives_pricing.utils.normal import norm_cdf
+
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+
+def test_geometric_asian_matches_closed_form():
+    # The continuous geometric average of GBM is log-normal
+    mu = np.log(S0) + 0.5 * (R - 0.5 * SIGMA ** 2) * T
+    var = SIGMA ** 2 * T / 3
+    d1 = (mu + var - np.log(K)) / np.sqrt(var)
+    exact = np.exp(-R * T) * (np.exp(mu + 0.5 * var) * norm_cdf(d1) - K * norm_cdf(d1 - np.sqrt(var)))
+
+    sampler = MultilevelMonteCarlo.gbm_level_sampler(
+        MultilevelMonteCarlo.asian_call_payoff(K, geometric=True), S0, R, SIGMA, T
+    )
+    result = MultilevelMonteCarlo.estimate(sampler, target_rmse=0.02, seed=1)
+
+    assert abs(result.price - exact) < 0.06
+    assert result.std_error < 0.02
+    # Paths concentrate on the coarse levels
+    assert np.all(np.diff(result.n_paths) < 0)
+
+
+def test_euler_european_call_matches_black_scholes():
+    sampler = MultilevelMonteCarlo.gbm_level_sampler(
+        MultilevelMonteCarlo.european_call_payoff(K), S0, R, SIGMA, T, scheme="euler"
+    )
+    result = MultilevelMonteCarlo.estimate(sampler, target_rmse=0.02, seed=2)
+
+    assert abs(result.price - BlackScholes.call_price(S0, K, R, SIGMA, T)) < 0.06
+    assert len(result.n_paths) > 3
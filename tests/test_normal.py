@@ -0,0 +1,30 @@
+import numpy as np
+from scipy.stats import norm
+
+from derivatives_pricing.utils.normal import norm_cdf, norm_pdf, norm_ppf
+
+
+def test_kernels_match_scipy_stats():
+    x = np.linspace(-30, 30, 10_001)
+
+    assert np.allclose(norm_cdf(x), norm.cdf(x), rtol=1e-14, atol=0)
+    assert np.allclose(norm_pdf(x), norm.pdf(x), rtol=1e-14, atol=0)
+
+
+def test_cdf_lower_tail_has_no_cancellation():
+    # Mills ratio asymptotics: Phi(-x) ~ phi(x) / x * (1 - 1/x^2)
+    x = 20.0
+    approx = norm_pdf(x) / x * (1 - 1 / x ** 2 + 3 / x ** 4)
+
+    assert np.isclose(norm_cdf(-x), approx, rtol=1e-6)
+
+
+def test_ppf_inverts_cdf():
+    u = np.array([1e-12, 0.01, 0.5, 0.99, 1 - 1e-12])
+
+    assert np.allclose(norm_cdf(norm_ppf(u)), u, rtol=1e-10)
+
+
+def test_scalar_input():
+    assert np.isclose(norm_cdf(0.0), 0.5)
+    assert np.isclose(norm_pdf(0.0), 1 / np.sqrt(2 * np.pi))
@@ -0,0 +1,86 @@
+from functools import partial
+
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.parallel_monte_carlo import ParallelMonteCarloPricer, _call_samples
+from derivatives_pricing.utils.statistics import RunningStats
+
+
+def test_running_stats_merge_matches_single_pass():
+    samples = np.random.default_rng(0).normal(3.0, 2.0, 10_001)
+
+    merged = RunningStats()
+    for chunk in np.array_split(samples, 7):
+        merged.merge(RunningStats.from_samples(chunk))
+
+    assert merged.count == samples.size
+    assert np.isclose(merged.mean, samples.mean())
+    assert np.isclose(merged.variance, samples.var(ddof=1))
+
+
+def test_running_stats_along_axis_keeps_one_accumulator_per_row():
+    samples = np.random.default_rng(1).normal(size=(3, 1_000))
+
+    merged = RunningStats()
+    for chunk in np.array_split(samples, 4, axis=1):
+        merged.merge(RunningStats.from_samples(chunk, axis=1))
+
+    assert np.allclose(merged.mean, samples.mean(axis=1))
+    assert np.allclose(merged.variance, samples.var(axis=1, ddof=1))
+
+
+def test_result_independent_of_worker_count():
+    args = (100.0, 100.0, 0.05, 0.2, 1.0, 200_000)
+
+    serial = ParallelMonteCarloPricer.european_call(*args, seed=11, chunk_size=30_000, n_workers=1)
+    threaded = ParallelMonteCarloPricer.european_call(*args, seed=11, chunk_size=30_000, n_workers=4)
+
+    assert serial == threaded
+
+
+def test_put_price_within_confidence_of_black_scholes():
+    S0, K, r, sigma, T = 100.0, 110.0, 0.03, 0.25, 0.5
+
+    result = ParallelMonteCarloPricer.european_put(
+        S0, K, r, sigma, T, 400_000, seed=3, chunk_size=100_000, n_workers=2
+    )
+
+    assert result.n_paths == 400_000
+    assert abs(result.price - BlackScholes.put_price(S0, K, r, sigma, T)) < 4 * result.std_error
+
+
+def test_adaptive_run_stops_at_target_error():
+    exact = BlackScholes.put_price(100.0, 90.0, 0.05, 0.2, 1.0)
+
+    result = ParallelMonteCarloPricer.european_adaptive(
+        100.0, 90.0, 0.05, 0.2, 1.0, is_call=False, abs_tol=0.01, seed=3, chunk_size=50_000
+    )
+    serial = ParallelMonteCarloPricer.european_adaptive(
+        100.0, 90.0, 0.05, 0.2, 1.0, is_call=False, abs_tol=0.01, seed=3, chunk_size=50_000,
+        n_workers=1,
+    )
+
+    assert result.std_error <= 0.01
+    assert 50_000 < result.n_paths < 1_000_000
+    assert abs(result.price - exact) < 4 * result.std_error
+    assert result == serial
+
+
+def test_adaptive_run_respects_path_budget():
+    result = ParallelMonteCarloPricer.european_adaptive(
+        100.0, 100.0, 0.05, 0.2, 1.0, rel_tol=1e-6, max_paths=300_000, seed=3, chunk_size=50_000
+    )
+
+    assert result.n_paths == 300_000
+    assert result.std_error > 1e-6 * result.price
+
+
+def test_adaptive_run_from_a_single_path_first_round():
+    sampler = partial(_call_samples, S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0)
+    stats = ParallelMonteCarloPricer.run_adaptive(
+        sampler, abs_tol=0.05, min_paths=1, chunk_size=1_000, seed=5, n_workers=1
+    )
+    exact = BlackScholes.call_price(100.0, 100.0, 0.05, 0.2, 1.0)
+
+    assert stats.std_error <= 0.05
+    assert abs(stats.mean - exact) < 4 * stats.std_error
@@ -0,0 +1,63 @@
+import numpy as np
+from derivatives_pricing.models.paths import GBMPaths
+from derivatives_pricing.utils.qmc import brownian_bridge
+
+
+def test_layouts_and_precision():
+    paths = GBMPaths.simulate(100.0, 0.05, 0.2, 1.0, 1_000, 12, seed=1)
+    paths_tm = GBMPaths.simulate(
+        100.0, 0.05, 0.2, 1.0, 1_000, 12, seed=1, time_major=True, dtype=np.float32
+    )
+
+    assert paths.shape == (1_000, 13)
+    assert paths_tm.shape == (13, 1_000)
+    assert paths_tm.dtype == np.float32
+    assert np.all(paths[:, 0] == 100.0)
+    assert np.allclose(paths_tm[0], 100.0)
+
+
+def test_from_normals_matches_stepwise_recursion():
+    Z = np.random.default_rng(0).standard_normal((5, 4))
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    dt = T / 4
+
+    paths = GBMPaths.from_normals(S0, r, sigma, T, Z)
+
+    expected = S0 * np.exp(
+        np.cumsum((r - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * Z, axis=1)
+    )
+    assert np.allclose(paths[:, 1:], expected)
+
+
+def test_martingale_property():
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    paths = GBMPaths.simulate(S0, r, sigma, T, 200_000, 4, seed=3)
+
+    discounted_mean = np.exp(-r * T) * paths[:, -1].mean()
+    assert np.isclose(discounted_mean, S0, rtol=2e-3)
+
+
+def test_chunks_are_reproducible():
+    first = list(GBMPaths.simulate_chunks(100.0, 0.05, 0.2, 1.0, 25, 3, chunk_size=10, seed=5))
+    second = list(GBMPaths.simulate_chunks(100.0, 0.05, 0.2, 1.0, 25, 3, chunk_size=10, seed=5))
+
+    assert [chunk.shape[0] for chunk in first] == [10, 10, 5]
+    assert all(np.array_equal(a, b) for a, b in zip(first, second))
+
+
+def test_brownian_bridge_covariance():
+    n_steps, T = 6, 1.5
+    Z = np.random.default_rng(1).standard_normal((200_000, n_steps))
+
+    W = brownian_bridge(Z, T)
+
+    times = np.arange(1, n_steps + 1) * T / n_steps
+    assert np.allclose(np.cov(W), np.minimum.outer(times, times), rtol=0.02)
+
+
+def test_sobol_paths_martingale_property():
+    S0, r, sigma, T = 100.0, 0.05, 0.2, 1.0
+    paths = GBMPaths.simulate_sobol(S0, r, sigma, T, 2 ** 14, 8, seed=2)
+
+    assert paths.shape == (2 ** 14, 9)
+    assert np.allclose(np.exp(-r * T) * paths[:, -1].mean(), S0, rtol=1e-3)
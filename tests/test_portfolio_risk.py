@@ -0,0 +1,74 @@
+import numpy as np
+from derivatives_pricing.greeks.analytical import BlackScholesGreeks
+from derivatives_pricing.risk.portfolio import PortfolioRisk
+
+
+SPOTS = {"AAA": 100.0, "BBB": 50.0}
+VOLS = {"AAA": 0.2, "BBB": 0.35}
+R = 0.03
+
+
+def _book():
+    return {
+        "underlying": np.array(["BBB", "AAA", "AAA", "BBB", "AAA"]),
+        "strike": np.array([55.0, 100.0, 90.0, 45.0, 110.0]),
+        "expiry": np.array([0.1, 0.3, 0.3, 1.5, 3.0]),
+        "is_call": np.array([True, False, True, False, True]),
+        "quantity": np.array([10.0, -5.0, 2.0, 7.0, 1.0]),
+    }
+
+
+def test_ladders_match_per_position_sums():
+    book = _book()
+    ladders = PortfolioRisk.ladders(book, SPOTS, R, VOLS, bucket_edges=(0.0, 0.25, 1.0, np.inf))
+
+    assert list(ladders.underlyings) == ["AAA", "BBB"]
+    assert ladders.delta.shape == (2, 3)
+
+    expected = np.zeros((2, 3))
+    for name, K, T, call, q in zip(*book.values()):
+        greeks = BlackScholesGreeks.all_greeks(SPOTS[name], K, R, VOLS[name], T)
+        row = 0 if name == "AAA" else 1
+        col = np.searchsorted([0.0, 0.25, 1.0], T, side="right") - 1
+        expected[row, col] += q * greeks["delta_call" if call else "delta_put"]
+
+    assert np.allclose(ladders.delta, expected)
+
+
+def test_chunking_and_sigma_column_agree():
+    book = _book()
+    book["sigma"] = np.array([VOLS[name] for name in book["underlying"]])
+
+    whole = PortfolioRisk.ladders(book, SPOTS, R, VOLS)
+    chunked = PortfolioRisk.ladders(book, SPOTS, R, chunk_size=2)
+
+    for field in ("value", "delta", "gamma", "vega", "theta", "rho"):
+        assert np.allclose(getattr(whole, field), getattr(chunked, field))
+
+    positions = PortfolioRisk.position_greeks(book, SPOTS, R)
+    assert np.isclose(positions["gamma"].sum(), whole.gamma.sum())
+
+
+def test_expired_positions_carry_intrinsic_value_only():
+    book = _book()
+    book["expiry"] = np.array([0.1, 0.0, 0.0, 1.5, 3.0])
+    ladders = PortfolioRisk.ladders(book, SPOTS, R, VOLS, bucket_edges=(0.0, 0.25, np.inf))
+
+    for greek in ("value", "delta", "gamma", "vega", "theta", "rho"):
+        assert np.all(np.isfinite(getattr(ladders, greek)))
+
+    live = BlackScholesGreeks.all_greeks(SPOTS["BBB"], 55.0, R, VOLS["BBB"], 0.1)
+    # AAA short bucket: a 100 put (worthless, held -5) and a 90 call (10 ITM, held 2)
+    assert np.isclose(ladders.value[0, 0], 2 * 10.0)
+    assert np.isclose(ladders.delta[0, 0], 2 * 1.0)
+    assert ladders.gamma[0, 0] == 0.0
+    assert np.isclose(ladders.gamma[1, 0], 10 * live["gamma"])
+
+
+def test_position_greeks_accepts_list_columns():
+    book = {name: list(values) for name, values in _book().items()}
+    greeks = PortfolioRisk.position_greeks(book, SPOTS, R, VOLS)
+    expected = PortfolioRisk.position_greeks(_book(), SPOTS, R, VOLS)
+
+    for name, values in expected.items():
+        assert np.allclose(greeks[name], values)
@@ -0,0 +1,62 @@
+import numpy as np
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.models.regression import RegressionBasis
+
+
+def _sample(n=2_000):
+    rng = np.random.default_rng(0)
+    S = rng.uniform(60.0, 100.0, n)
+    y = np.maximum(100.0 - S, 0.0) + rng.normal(0.0, 1.0, n)
+    return S, y
+
+
+def test_polynomial_bases_give_identical_fits():
+    S, y = _sample()
+    fits = []
+
+    for kind in ("power", "hermite", "chebyshev"):
+        X, _ = RegressionBasis.fill(S, 100.0, 4, kind)
+        fits.append(X @ RegressionBasis.solve(X, y, method="qr"))
+
+    assert np.allclose(fits[0], fits[1])
+    assert np.allclose(fits[0], fits[2])
+
+
+def test_solvers_agree():
+    S, y = _sample()
+    X, _ = RegressionBasis.fill(S, 100.0, 3, "chebyshev")
+
+    betas = [RegressionBasis.solve(X, y, method) for method in ("gram", "qr", "lstsq")]
+
+    assert np.allclose(betas[0], betas[2])
+    assert np.allclose(betas[1], betas[2])
+
+
+def test_fill_reuses_buffer_and_scaling():
+    S, _ = _sample(100)
+    buffer = np.empty((500, 4))
+
+    X, scaling = RegressionBasis.fill(S, 100.0, 3, "hermite", out=buffer)
+    X_again, _ = RegressionBasis.fill(S[:10], 100.0, 3, "hermite", out=buffer, scaling=scaling)
+
+    assert np.shares_memory(X, buffer)
+    assert X_again.shape == (10, 4)
+    assert np.allclose(X_again[:, 1], (S[:10] / 100.0 - scaling[0]) / scaling[1])
+
+
+def test_gram_matches_qr_at_high_degree():
+    S, y = _sample()
+    for kind in ("power", "laguerre"):
+        X, _ = RegressionBasis.fill(S, 100.0, 8, kind)
+        gram = X @ RegressionBasis.solve(X, y, method="gram")
+        qr = X @ RegressionBasis.solve(X, y, method="qr")
+
+        assert np.allclose(gram, qr, atol=1e-8)
+
+    price = {
+        method: LongstaffSchwartzPricer.american_put(
+            100.0, 100.0, 0.05, 0.2, 1.0, n_paths=50_000, seed=1, basis_degree=8, regression=method
+        )
+        for method in ("gram", "qr")
+    }
+    assert np.isclose(price["gram"], price["qr"], atol=1e-6)
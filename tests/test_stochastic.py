@@ -0,0 +1,85 @@
+from math import factorial
+
+import numpy as np
+from derivatives_pricing.models.binomial import BinomialPricer
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.models.stochastic import (
+    GBMModel, HestonModel, JumpDiffusionModel, LocalVolModel, PathModel,
+)
+from derivatives_pricing.models.vol_surface import VolSurface
+
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+
+def _close(result, expected, n_se=4):
+    return abs(result.price - expected) < n_se * result.std_error
+
+
+def test_models_share_the_path_interface():
+    for model in (GBMModel(SIGMA), HestonModel(0.04, 1.5, 0.04, 0.5, -0.7),
+                  JumpDiffusionModel(SIGMA, 0.5, -0.1, 0.15)):
+        paths = model.simulate(S0, R, T, 1_000, 10, seed=1, time_major=True, dtype=np.float32)
+        assert paths.shape == (11, 1_000)
+        assert paths.dtype == np.float32
+        assert np.all(paths[0] == S0)
+        assert np.all(paths > 0)
+
+
+def test_degenerate_heston_and_flat_local_vol_match_black_scholes():
+    exact = BlackScholes.call_price(S0, K, R, SIGMA, T)
+
+    heston = HestonModel(SIGMA ** 2, 2.0, SIGMA ** 2, 1e-3, -0.7)
+    assert _close(MonteCarloPricer.european_model(heston, S0, K, R, T, 100_000, seed=1), exact)
+
+    strikes = np.tile(np.linspace(60.0, 150.0, 20), 3)
+    expiries = np.repeat([0.25, 1.0, 2.0], 20)
+    surface = VolSurface.from_quotes(S0, R, strikes, expiries, np.full(60, SIGMA))
+    local_vol = LocalVolModel.from_surface(surface)
+    assert _close(MonteCarloPricer.european_model(local_vol, S0, K, R, T, 100_000, seed=2), exact)
+
+
+def test_jump_diffusion_matches_merton_series():
+    lam, mu_j, sigma_j = 0.5, -0.1, 0.15
+    k = np.exp(mu_j + 0.5 * sigma_j ** 2) - 1
+    intensity = lam * (1 + k) * T
+    exact = sum(
+        np.exp(-intensity) * intensity ** n / factorial(n)
+        * BlackScholes.call_price(
+            S0, K, R - lam * k + n * (mu_j + 0.5 * sigma_j ** 2) / T,
+            np.sqrt(SIGMA ** 2 + n * sigma_j ** 2 / T), T,
+        )
+        for n in range(40)
+    )
+
+    model = JumpDiffusionModel(SIGMA, lam, mu_j, sigma_j)
+    assert _close(MonteCarloPricer.european_model(model, S0, K, R, T, 100_000, n_steps=10, seed=3), exact)
+
+
+def test_lsm_prices_american_put_under_any_model():
+    price = LongstaffSchwartzPricer.american_put_model(
+        GBMModel(SIGMA), S0, K, R, T, n_paths=50_000, seed=4
+    )
+    assert np.isclose(price, BinomialPricer.american_put(S0, K, R, SIGMA, T, n_steps=1_000), atol=0.1)
+
+    heston = LongstaffSchwartzPricer.american_put_model(
+        HestonModel(0.04, 1.5, 0.04, 0.5, -0.7), S0, K, R, T, n_paths=50_000, seed=4
+    )
+    european = MonteCarloPricer.european_model(
+        HestonModel(0.04, 1.5, 0.04, 0.5, -0.7), S0, K, R, T, 50_000, is_call=False, seed=4
+    )
+    assert heston > european.price
+
+
+def test_incomplete_model_fails_at_construction():
+    class NoDynamics(PathModel):
+        pass
+
+    try:
+        NoDynamics()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("PathModel without _evolve was instantiated")
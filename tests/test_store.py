@@ -0,0 +1,85 @@
+import numpy as np
+from derivatives_pricing.data.store import OptionChainStore
+from derivatives_pricing.models.black_scholes import BlackScholes
+
+
+def _chain(n=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "underlying": np.array(["SPY", "AAPL", "QQQ"])[rng.integers(3, size=n)],
+        "expiry": rng.choice([0.1, 0.25, 0.5, 1.0], size=n),
+        "strike": np.round(rng.uniform(50, 150, n)),
+        "is_call": rng.random(n) < 0.5,
+        "sigma": rng.uniform(0.1, 0.4, n),
+    }
+
+
+SPOTS = {"SPY": 100.0, "AAPL": 90.0, "QQQ": 110.0}
+
+
+def test_selection_slices_match_filtering(tmp_path):
+    chain = _chain()
+    OptionChainStore.ingest(str(tmp_path), chain, SPOTS, r=0.04)
+    store = OptionChainStore(str(tmp_path))
+
+    assert len(store) == 2_000
+    assert isinstance(store.columns["strike"], np.memmap)
+
+    selection = store.select("SPY", expiry=0.25, strike_range=(90.0, 110.0))
+    mask = (
+        (chain["underlying"] == "SPY") & (chain["expiry"] == 0.25)
+        & (chain["strike"] >= 90.0) & (chain["strike"] <= 110.0)
+    )
+
+    assert np.array_equal(selection["strike"], np.sort(chain["strike"][mask]))
+    assert np.all(selection["underlying"] == store.code("SPY"))
+    assert np.shares_memory(selection["strike"], store.columns["strike"])
+    assert np.array_equal(store.expiries("QQQ"), [0.1, 0.25, 0.5, 1.0])
+
+
+def test_pricing_inputs_feed_the_batch_pricer(tmp_path):
+    chain = _chain()
+    store = OptionChainStore.ingest(str(tmp_path), chain, SPOTS, r=0.04)
+
+    selection = store.select("AAPL")
+    call, _ = BlackScholes.price_chain(store.pricing_inputs(selection))
+
+    expected = BlackScholes.call_price(90.0, selection["strike"], 0.04, selection["sigma"], selection["expiry"])
+    assert np.allclose(call, expected)
+
+
+def test_csv_ingest(tmp_path):
+    csv_path = tmp_path / "chain.csv"
+    csv_path.write_text("underlying,expiry,strike,is_call,bid\nSPY,0.5,100,C,4.1\nSPY,0.5,95,P,2.0\n")
+
+    store = OptionChainStore.ingest_csv(str(tmp_path / "snapshot"), str(csv_path), SPOTS, 0.04, vols=SPOTS)
+    selection = store.select("SPY", expiry=0.5)
+
+    assert list(selection["strike"]) == [95.0, 100.0]
+    assert list(selection["is_call"]) == [False, True]
+    assert list(selection["bid"]) == [2.0, 4.1]
+
+
+def test_object_underlyings_are_stored_as_strings(tmp_path):
+    chain = _chain()
+    chain["underlying"] = chain["underlying"].astype(object)
+    OptionChainStore.ingest(str(tmp_path), chain, SPOTS, r=0.04)
+
+    store = OptionChainStore(str(tmp_path))
+    assert store.underlyings.dtype.kind == "U"
+    assert len(store.select("QQQ")["strike"]) == np.sum(chain["underlying"] == "QQQ")
+
+
+def test_reingest_without_vols_drops_the_old_vol_snapshot(tmp_path):
+    chain = _chain()
+    del chain["sigma"]
+    OptionChainStore.ingest(str(tmp_path), chain, SPOTS, r=0.04, vols=SPOTS)
+    store = OptionChainStore.ingest(str(tmp_path), chain, SPOTS, r=0.04)
+
+    assert store.vol is None
+    try:
+        store.pricing_inputs(store.select("SPY"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("stale vols were used")
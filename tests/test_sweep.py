@@ -0,0 +1,104 @@
+import numpy as np
+from derivatives_pricing.experiments.sweep import (
+    SHARED_PATH_KEYS, load_results, lsm_put_shared_paths, mc_call, parameter_grid, run_sweep,
+    write_results,
+)
+from derivatives_pricing.models.longstaff_schwartz import LongstaffSchwartzPricer
+
+
+CALLS = []
+
+
+def quadratic(a, b, seed=None):
+    CALLS.append((a, b))
+    return {"value": a ** 2 + b, "seed": seed or 0}
+
+
+def test_parameter_grid_is_cartesian():
+    grid = parameter_grid(a=[1, 2], b=[10, 20, 30])
+
+    assert len(grid) == 6
+    assert grid[0] == {"a": 1, "b": 10}
+    assert grid[-1] == {"a": 2, "b": 30}
+
+
+def test_cached_cells_are_not_recomputed(tmp_path):
+    CALLS.clear()
+    cache_dir = str(tmp_path / "cache")
+
+    first = run_sweep(quadratic, parameter_grid(a=[1, 2], b=[0]), seed=7,
+                      cache_dir=cache_dir, n_workers=1)
+    second = run_sweep(quadratic, parameter_grid(a=[1, 2, 3], b=[0]), seed=7,
+                       cache_dir=cache_dir, n_workers=1)
+
+    assert CALLS == [(1, 0), (2, 0), (3, 0)]
+    assert second[:2] == first
+    assert second[2] == {"a": 3, "b": 0, "value": 9.0, "seed": 7.0}
+
+
+def test_results_round_trip(tmp_path):
+    rows = run_sweep(quadratic, parameter_grid(a=[1, 2], b=[5]), cache_dir=None, n_workers=1)
+
+    for name in ("results.csv", "results.npz"):
+        path = str(tmp_path / name)
+        write_results(rows, path)
+        results = load_results(path)
+
+        assert np.allclose(results["a"], [1, 2])
+        assert np.allclose(results["value"], [6.0, 9.0])
+
+
+def test_mc_call_methods_share_one_grid(tmp_path):
+    grid = parameter_grid(method=["plain", "control_variate", "rqmc"], n_paths=[20_000])
+    rows = run_sweep(mc_call, grid, seed=1, cache_dir=None, n_workers=1)
+
+    path = str(tmp_path / "convergence.csv")
+    write_results(rows, path)
+    results = load_results(path)
+
+    assert list(results["method"]) == ["plain", "control_variate", "rqmc"]
+    assert np.all(np.abs(results["error"]) < 4 * results["std_error"] + 1e-3)
+
+
+def test_unseeded_runs_are_not_cached(tmp_path):
+    CALLS.clear()
+    cache_dir = str(tmp_path / "cache")
+
+    for _ in range(2):
+        run_sweep(quadratic, parameter_grid(a=[1], b=[0]), cache_dir=cache_dir, n_workers=1)
+
+    assert CALLS == [(1, 0), (1, 0)]
+
+
+GROUPS = []
+
+
+def grouped_quadratic(cells, seed=None):
+    GROUPS.append([cell["a"] for cell in cells])
+    return [cell["a"] ** 2 + cell["b"] for cell in cells]
+
+
+def test_grouped_cells_run_together_and_cache_per_group(tmp_path):
+    GROUPS.clear()
+    cache_dir = str(tmp_path / "cache")
+    grid = parameter_grid(b=[0, 10], a=[1, 2])
+
+    first = run_sweep(grouped_quadratic, grid, seed=1, cache_dir=cache_dir, n_workers=1, group_by=("b",))
+    second = run_sweep(grouped_quadratic, grid, seed=1, cache_dir=cache_dir, n_workers=1, group_by=("b",))
+
+    assert GROUPS == [[1, 2], [1, 2]]
+    assert [row["value"] for row in first] == [1.0, 4.0, 11.0, 14.0]
+    assert second == first
+
+
+def test_shared_path_lsm_matches_pricing_off_one_path_set():
+    grid = parameter_grid(basis_degree=[1, 3], n_paths=[4_096, 8_192], n_steps=[20])
+    rows = run_sweep(lsm_put_shared_paths, grid, seed=7, cache_dir=None, n_workers=1,
+                     group_by=SHARED_PATH_KEYS)
+
+    paths = LongstaffSchwartzPricer.simulate_paths(0.05, 0.2, 1.0, n_paths=8_192, n_steps=20, seed=7)
+    for row in rows:
+        expected = LongstaffSchwartzPricer.american_put_from_paths(
+            paths[:, :row["n_paths"]], 100.0, 100.0, 0.05, 1.0, basis_degree=row["basis_degree"], seed=7
+        )
+        assert np.isclose(row["price"], expected)
@@ -0,0 +1,55 @@
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.monte_carlo import MonteCarloPricer
+from derivatives_pricing.utils.statistics import ControlVariateStats
+from derivatives_pricing.utils.variance_reduction import antithetic_normals, moment_match
+
+
+def test_antithetic_and_moment_matched_draws():
+    Z = antithetic_normals(np.random.default_rng(0), 1_000)
+
+    assert np.allclose(Z[:500], -Z[500:])
+    assert np.isclose(moment_match(Z).std(), 1.0)
+
+
+def test_streaming_control_variate_matches_single_pass():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(9_000, 2))
+    Y = X @ [1.5, -0.5] + rng.normal(scale=0.1, size=9_000)
+
+    merged = ControlVariateStats()
+    for rows in np.array_split(np.arange(9_000), 5):
+        merged.merge(ControlVariateStats.from_samples(Y[rows], X[rows]))
+
+    single = ControlVariateStats.from_samples(Y, X)
+
+    assert np.allclose(merged.beta, single.beta)
+    assert np.allclose(merged.beta, [1.5, -0.5], atol=0.01)
+    assert np.isclose(merged.to_stats([0.0, 0.0]).mean, single.to_stats([0.0, 0.0]).mean)
+
+
+def test_each_technique_is_unbiased_and_reduces_error():
+    args = (100.0, 100.0, 0.05, 0.2, 1.0, 100_000)
+    exact = BlackScholes.put_price(*args[:5])
+
+    plain = MonteCarloPricer.european(*args, is_call=False, seed=3, chunk_size=30_000)
+    for options in ({"antithetic": True}, {"control_variate": True},
+                    {"antithetic": True, "control_variate": True, "moment_matching": True}):
+        result = MonteCarloPricer.european(
+            *args, is_call=False, seed=3, chunk_size=30_000, **options
+        )
+
+        assert result.n_paths == 100_000
+        assert result.std_error < plain.std_error
+        assert abs(result.price - exact) < 4 * result.std_error
+
+
+def test_importance_sampling_for_deep_out_of_the_money_call():
+    args = (100.0, 170.0, 0.05, 0.2, 1.0, 50_000)
+    exact = BlackScholes.call_price(*args[:5])
+
+    plain = MonteCarloPricer.european(*args, seed=4)
+    shifted = MonteCarloPricer.european(*args, seed=4, importance_sampling=True)
+
+    assert shifted.std_error < 0.2 * plain.std_error
+    assert abs(shifted.price - exact) < 4 * shifted.std_error
@@ -0,0 +1,65 @@
+import numpy as np
+from derivatives_pricing.models.black_scholes import BlackScholes
+from derivatives_pricing.models.vol_surface import VolSurface
+
+
+S, R = 100.0, 0.03
+EXPIRIES = np.array([0.1, 0.25, 0.5, 1.0, 2.0])
+PARAMS = np.array([
+    [0.001, 0.05, -0.4, 0.0, 0.10],
+    [0.004, 0.07, -0.4, 0.0, 0.12],
+    [0.008, 0.09, -0.4, 0.0, 0.15],
+    [0.018, 0.11, -0.4, 0.0, 0.20],
+    [0.036, 0.13, -0.4, 0.0, 0.25],
+])
+
+
+def _quotes():
+    K = np.tile(np.linspace(60.0, 150.0, 30), len(EXPIRIES))
+    T = np.repeat(EXPIRIES, 30)
+    k = np.log(K / (S * np.exp(R * T)))
+    w = VolSurface.svi_total_variance(k, PARAMS[np.searchsorted(EXPIRIES, T)])
+    return K, T, np.sqrt(w / T)
+
+
+def test_fit_recovers_svi_quotes_and_prices_recover_vols():
+    K, T, iv = _quotes()
+    surface = VolSurface.from_quotes(S, R, K, T, iv)
+
+    assert np.allclose(surface.implied_vol(K, T, exact=True), iv, atol=1e-6)
+    assert np.allclose(surface.implied_vol(K, T), iv, atol=1e-5)
+
+    prices = BlackScholes.call_price(S, K, R, iv, T)
+    from_prices = VolSurface.from_prices(S, R, K, T, prices)
+    assert np.allclose(from_prices.implied_vol(K, T), iv, atol=1e-5)
+
+
+def test_arbitrage_report_and_interpolation():
+    K, T, iv = _quotes()
+    surface = VolSurface.from_quotes(S, R, K, T, iv)
+
+    report = surface.arbitrage_report()
+    assert np.all(report["butterfly"] > 0)
+    assert np.all(report["calendar"] > 0)
+    assert not report["negative_variance"].any()
+
+    # Between slices total variance is interpolated linearly in T
+    k = np.array([-0.2, 0.0, 0.3])
+    w = surface.total_variance(k, 0.75, exact=True)
+    w_lo = VolSurface.svi_total_variance(k, PARAMS[2])
+    w_hi = VolSurface.svi_total_variance(k, PARAMS[3])
+    assert np.allclose(w, 0.5 * (w_lo + w_hi), atol=1e-6)
+
+
+def test_refit_updates_only_one_slice():
+    K, T, iv = _quotes()
+    surface = VolSurface.from_quotes(S, R, K, T, iv)
+    grid = surface.grid.copy()
+
+    mask = T == 0.5
+    surface.fit_slice(0.5, K[mask], 1.1 * iv[mask])
+
+    assert len(surface.expiries) == len(EXPIRIES)
+    changed = np.any(surface.grid != grid, axis=1)
+    assert list(changed) == [False, False, True, False, False]
+    assert np.allclose(surface.implied_vol(K[mask], 0.5), 1.1 * iv[mask], atol=1e-4)